@@ -72,3 +72,19 @@ DEFAULT_CARRY_OVER_SLOTS_TO_NEW_SESSION = True
 ENV_GPU_CONFIG = "TF_GPU_MEMORY_ALLOC"
 ENV_CPU_INTER_OP_CONFIG = "TF_INTER_OP_PARALLELISM_THREADS"
 ENV_CPU_INTRA_OP_CONFIG = "TF_INTRA_OP_PARALLELISM_THREADS"
+
+ENV_TRAINING_DATA_CACHE = "RASA_TRAINING_DATA_CACHE"
+ENV_TRAINING_DATA_CACHE_DIRECTORY = "RASA_TRAINING_DATA_CACHE_DIRECTORY"
+DEFAULT_TRAINING_DATA_CACHE_DIRECTORY = os.path.expanduser(
+    "~/.rasa/cache/training_data"
+)
+
+ENV_NLU_FEATURIZATION_CACHE_DIRECTORY = "RASA_NLU_FEATURIZATION_CACHE_DIRECTORY"
+
+ENV_PARALLEL_NLU_CORE_TRAINING = "RASA_PARALLEL_NLU_CORE_TRAINING"
+
+ENV_BATCH_WORKERS = "RASA_BATCH_WORKERS"
+DEFAULT_BATCH_WORKERS = 2
+
+ENV_TRACKER_FEATURIZATION_WORKERS = "RASA_TRACKER_FEATURIZATION_WORKERS"
+DEFAULT_TRACKER_FEATURIZATION_WORKERS = 1
@@ -3,11 +3,22 @@ import logging
 import os
 import shutil
 import tempfile
-from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Text,
+    Tuple,
+    Union,
+)
 import uuid
 
 import aiohttp
 from aiohttp import ClientError
+from async_generator import asynccontextmanager
 
 import rasa
 from rasa.constants import DEFAULT_CORE_SUBDIRECTORY_NAME, DEFAULT_DOMAIN_PATH
@@ -511,9 +522,22 @@ class Agent:
 
         processor = self.create_processor(message_preprocessor)
 
-        async with self.lock_store.lock(message.sender_id):
+        async with self.lock_conversation(message.sender_id):
             return await processor.handle_message(message)
 
+    @asynccontextmanager
+    async def lock_conversation(self, sender_id: Text) -> AsyncGenerator[None, None]:
+        """Locks a conversation and flushes its tracker when the lock is released.
+
+        Args:
+            sender_id: The conversation ID.
+        """
+        async with self.lock_store.lock(sender_id):
+            try:
+                yield
+            finally:
+                await self.tracker_store.flush_async(sender_id)
+
     # noinspection PyUnusedLocal
     async def predict_next(
         self, sender_id: Text, **kwargs: Any
@@ -1,11 +1,17 @@
 import logging
-from typing import Any, Dict, Text, Optional, Union
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Text, Optional, Union
 
 import rasa.shared.utils.common
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
 
+# default bounds of the queue of events which are published in the background
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_MAX_BATCH_SIZE = 100
+
 
 class EventBroker:
     """Base class for any event broker implementation."""
@@ -30,6 +36,18 @@ class EventBroker:
         """Publishes a json-formatted Rasa Core event into an event queue."""
         raise NotImplementedError("Event broker must implement the `publish` method.")
 
+    def publish_many(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes several json-formatted Rasa Core events into an event queue.
+
+        Event brokers which can publish several events at once should override this
+        method. By default the events are published one by one.
+
+        Args:
+            events: The events in the order in which they should be published.
+        """
+        for event in events:
+            self.publish(event)
+
     def is_ready(self) -> bool:
         """Determine whether or not the event broker is ready.
 
@@ -44,6 +62,60 @@ class EventBroker:
         pass
 
 
+class BackgroundPublisher:
+    """Publishes events in batches from a bounded queue in a background thread.
+
+    Adding events blocks while the queue is full, so that events aren't dropped if
+    the event broker can't keep up.
+    """
+
+    def __init__(
+        self,
+        publish_batch: Callable[[List[Dict[Text, Any]]], None],
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """Creates the queue and starts the background thread.
+
+        Args:
+            publish_batch: Function which publishes a batch of events.
+            max_queue_size: Maximum number of events which wait to be published.
+            max_batch_size: Maximum number of events which are published at once.
+        """
+        self._publish_batch = publish_batch
+        self.max_batch_size = max_batch_size
+        self._queue: "queue.Queue[Dict[Text, Any]]" = queue.Queue(max_queue_size)
+
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+
+    def put(self, events: List[Dict[Text, Any]]) -> None:
+        """Adds events to the queue of events which are published."""
+        for event in events:
+            self._queue.put(event)
+
+    def flush(self) -> None:
+        """Blocks until all queued events were published."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            events = [self._queue.get()]
+            while len(events) < self.max_batch_size:
+                try:
+                    events.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._publish_batch(events)
+            except Exception as e:
+                logger.error(f"Failed to publish {len(events)} event(s): {e}")
+            finally:
+                for _ in events:
+                    self._queue.task_done()
+
+
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig],
 ) -> Optional["EventBroker"]:
@@ -5,7 +5,7 @@ import time
 import typing
 from collections import deque
 from contextlib import contextmanager
-from threading import Thread
+from threading import RLock, Thread
 from typing import (
     Callable,
     Deque,
@@ -24,7 +24,12 @@ from rasa.constants import (
     ENV_LOG_LEVEL_LIBRARIES,
     DOCS_URL_PIKA_EVENT_BROKER,
 )
-from rasa.core.brokers.broker import EventBroker
+from rasa.core.brokers.broker import (
+    BackgroundPublisher,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_QUEUE_SIZE,
+    EventBroker,
+)
 import rasa.shared.utils.io
 from rasa.utils.endpoints import EndpointConfig
 from rasa.shared.utils.io import DEFAULT_ENCODING
@@ -35,6 +40,7 @@ if typing.TYPE_CHECKING:
     from pika.channel import Channel
     import pika
     from pika.connection import Parameters, Connection
+    from pika.frame import Method
 
 logger = logging.getLogger(__name__)
 
@@ -267,6 +273,10 @@ class PikaEventBroker(EventBroker):
         log_level: Union[Text, int] = os.environ.get(
             ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES
         ),
+        confirm_delivery: bool = False,
+        publish_in_background: bool = False,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
         **kwargs: Any,
     ):
         """Initialise RabbitMQ event broker.
@@ -283,6 +293,14 @@ class PikaEventBroker(EventBroker):
             raise_on_failure: Whether to raise an exception if publishing fails. If
                 `False`, keep retrying.
             log_level: Logging level.
+            confirm_delivery: Whether to enable publisher confirms. Messages which
+                RabbitMQ rejects or which weren't confirmed before the channel was
+                closed are published again.
+            publish_in_background: If `True`, events are queued and published in
+                batches by a background thread instead of when they are published.
+            max_queue_size: Maximum number of queued events. Publishing blocks
+                while the queue is full.
+            max_batch_size: Maximum number of events published at once.
         """
         logging.getLogger("pika").setLevel(log_level)
 
@@ -295,8 +313,28 @@ class PikaEventBroker(EventBroker):
         self.should_keep_unpublished_messages = should_keep_unpublished_messages
         self.raise_on_failure = raise_on_failure
 
+        self.confirm_delivery = confirm_delivery
+
         # List to store unpublished messages which hopefully will be published later
-        self._unpublished_messages: Deque[Text] = deque()
+        self._unpublished_messages: Deque[
+            Tuple[Text, Optional[Dict[Text, Text]]]
+        ] = deque()
+        # Published messages and their headers by delivery tag until RabbitMQ
+        # confirmed them
+        self._unconfirmed_messages: Dict[
+            int, Tuple[Text, Optional[Dict[Text, Text]]]
+        ] = {}
+        self._delivery_tag = 0
+        # messages are published from several threads, e.g. the worker threads
+        # which save trackers and the thread of the pika IO loop. The lock keeps
+        # the delivery tags in line with the order of the published messages.
+        self._publish_lock = RLock()
+
+        self._background_publisher = (
+            BackgroundPublisher(self.publish_batch, max_queue_size, max_batch_size)
+            if publish_in_background
+            else None
+        )
         self._run_pika()
 
     def __del__(self) -> None:
@@ -306,6 +344,8 @@ class PikaEventBroker(EventBroker):
 
     def close(self) -> None:
         """Close the pika channel and connection."""
+        if self._background_publisher:
+            self._background_publisher.flush()
         self.__del__()
 
     @property
@@ -400,16 +440,56 @@ class PikaEventBroker(EventBroker):
             channel.queue_declare(queue=queue, durable=True)
             channel.queue_bind(exchange=RABBITMQ_EXCHANGE, queue=queue)
 
-        self.channel = channel
+        if self.confirm_delivery:
+            channel.confirm_delivery(self._on_delivery_confirmation)
 
-        while self._unpublished_messages:
-            # Send unpublished messages
-            message = self._unpublished_messages.popleft()
-            self._publish(message)
-            logger.debug(
-                f"Published message from queue of unpublished messages. "
-                f"Remaining unpublished messages: {len(self._unpublished_messages)}."
-            )
+        with self._publish_lock:
+            if self.confirm_delivery:
+                # messages which weren't confirmed on the previous channel are sent
+                # again
+                self._unpublished_messages.extendleft(
+                    reversed(list(self._unconfirmed_messages.values()))
+                )
+                self._unconfirmed_messages = {}
+                self._delivery_tag = 0
+
+            self.channel = channel
+
+            while self._unpublished_messages:
+                # Send unpublished messages
+                body, headers = self._unpublished_messages.popleft()
+                self._publish(body, headers)
+                logger.debug(
+                    f"Published message from queue of unpublished messages. "
+                    f"Remaining unpublished messages: "
+                    f"{len(self._unpublished_messages)}."
+                )
+
+    def _on_delivery_confirmation(self, frame: "Method") -> None:
+        confirmation = frame.method
+        with self._publish_lock:
+            if confirmation.multiple:
+                delivery_tags = [
+                    tag
+                    for tag in list(self._unconfirmed_messages)
+                    if tag <= confirmation.delivery_tag
+                ]
+            else:
+                delivery_tags = [confirmation.delivery_tag]
+
+            rejected = [
+                self._unconfirmed_messages.pop(tag)
+                for tag in delivery_tags
+                if tag in self._unconfirmed_messages
+            ]
+        if confirmation.NAME != "Basic.Nack":
+            return
+
+        logger.warning(
+            f"RabbitMQ rejected {len(rejected)} message(s). Publishing them again."
+        )
+        for body, headers in rejected:
+            self._publish(body, headers)
 
     def _run_pika_io_loop_in_thread(self) -> None:
         thread = Thread(target=self._run_pika_io_loop, daemon=True)
@@ -451,6 +531,9 @@ class PikaEventBroker(EventBroker):
     ) -> None:
         """Publish `event` into Pika queue.
 
+        The event is queued if the event broker publishes in the background and no
+        `headers` are given.
+
         Args:
             event: Serialised event to be published.
             retries: Number of retries if publishing fails
@@ -459,11 +542,53 @@ class PikaEventBroker(EventBroker):
                 dictionary). The headers can be retrieved in the consumer from the
                 `headers` attribute of the message's `BasicProperties`.
         """
-        body = json.dumps(event)
+        if self._background_publisher and not headers:
+            self.publish_many([event])
+            return
+
+        if self._background_publisher:
+            # events with headers aren't queued, so they mustn't overtake queued ones
+            self._background_publisher.flush()
+        self.publish_batch([event], retries, retry_delay_in_seconds, headers)
+
+    def publish_many(self, events: List[Dict[Text, Any]]) -> None:
+        """Publish several events into the Pika queue.
+
+        The events are queued if the event broker publishes in the background.
+
+        Args:
+            events: Serialised events to be published.
+        """
+        if self._background_publisher:
+            self._background_publisher.put(events)
+        else:
+            self.publish_batch(events)
+
+    def publish_batch(
+        self,
+        events: List[Dict[Text, Any]],
+        retries: int = 60,
+        retry_delay_in_seconds: int = 5,
+        headers: Optional[Dict[Text, Text]] = None,
+    ) -> None:
+        """Publish several events on the current channel without waiting in between.
+
+        If publishing fails, it is retried starting with the first event which
+        wasn't published.
+
+        Args:
+            events: Serialised events to be published.
+            retries: Number of retries if publishing fails
+            retry_delay_in_seconds: Delay in seconds between retries.
+            headers: Message headers to append to the published messages.
+        """
+        bodies = deque(json.dumps(event) for event in events)
 
         while retries:
             try:
-                self._publish(body, headers)
+                while bodies:
+                    self._publish(bodies[0], headers)
+                    bodies.popleft()
                 return
             except Exception as e:
                 logger.error(
@@ -477,7 +602,8 @@ class PikaEventBroker(EventBroker):
             retries -= 1
             time.sleep(retry_delay_in_seconds)
 
-        logger.error(f"Failed to publish Pika event on host '{self.host}':\n{body}")
+        for body in bodies:
+            logger.error(f"Failed to publish Pika event on host '{self.host}':\n{body}")
 
     def _get_message_properties(
         self, headers: Optional[Dict[Text, Text]] = None
@@ -515,12 +641,18 @@ class PikaEventBroker(EventBroker):
     def _basic_publish(
         self, body: Text, headers: Optional[Dict[Text, Text]] = None
     ) -> None:
-        self.channel.basic_publish(
-            exchange=RABBITMQ_EXCHANGE,
-            routing_key="",
-            body=body.encode(DEFAULT_ENCODING),
-            properties=self._get_message_properties(headers),
-        )
+        properties = self._get_message_properties(headers)
+        with self._publish_lock:
+            self.channel.basic_publish(
+                exchange=RABBITMQ_EXCHANGE,
+                routing_key="",
+                body=body.encode(DEFAULT_ENCODING),
+                properties=properties,
+            )
+
+            if self.confirm_delivery:
+                self._delivery_tag += 1
+                self._unconfirmed_messages[self._delivery_tag] = (body, headers)
 
         logger.debug(
             f"Published Pika events to exchange '{RABBITMQ_EXCHANGE}' on host "
@@ -528,20 +660,21 @@ class PikaEventBroker(EventBroker):
         )
 
     def _publish(self, body: Text, headers: Optional[Dict[Text, Text]] = None) -> None:
-        if self._pika_connection.is_closed:
-            # Try to reset connection
-            self._run_pika()
-            self._basic_publish(body, headers)
-        elif not self.channel and self.should_keep_unpublished_messages:
-            logger.warning(
-                f"RabbitMQ channel has not been assigned. Adding message to "
-                f"list of unpublished messages and trying to publish them "
-                f"later. Current number of unpublished messages is "
-                f"{len(self._unpublished_messages)}."
-            )
-            self._unpublished_messages.append(body)
-        else:
-            self._basic_publish(body, headers)
+        with self._publish_lock:
+            if self._pika_connection.is_closed:
+                # Try to reset connection
+                self._run_pika()
+                self._basic_publish(body, headers)
+            elif not self.channel and self.should_keep_unpublished_messages:
+                logger.warning(
+                    f"RabbitMQ channel has not been assigned. Adding message to "
+                    f"list of unpublished messages and trying to publish them "
+                    f"later. Current number of unpublished messages is "
+                    f"{len(self._unpublished_messages)}."
+                )
+                self._unpublished_messages.append((body, headers))
+            else:
+                self._basic_publish(body, headers)
 
 
 def create_rabbitmq_ssl_options(
@@ -1,9 +1,14 @@
 import contextlib
 import json
 import logging
-from typing import Any, Dict, Optional, Text
-
-from rasa.core.brokers.broker import EventBroker
+from typing import Any, Dict, List, Optional, Text
+
+from rasa.core.brokers.broker import (
+    BackgroundPublisher,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_QUEUE_SIZE,
+    EventBroker,
+)
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
@@ -36,7 +41,25 @@ class SQLEventBroker(EventBroker):
         db: Text = "events.db",
         username: Optional[Text] = None,
         password: Optional[Text] = None,
+        publish_in_background: bool = False,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
     ):
+        """Creates the event broker and the `events` table.
+
+        Args:
+            dialect: SQL dialect of the database.
+            host: Database host.
+            port: Database port.
+            db: Name of the database.
+            username: Username for the database.
+            password: Password for the database.
+            publish_in_background: If `True`, events are queued and inserted in
+                batches by a background thread instead of when they are published.
+            max_queue_size: Maximum number of queued events. Publishing blocks
+                while the queue is full.
+            max_batch_size: Maximum number of events inserted at once.
+        """
         from rasa.core.tracker_store import SQLTrackerStore
         import sqlalchemy.orm
 
@@ -50,6 +73,13 @@ class SQLEventBroker(EventBroker):
         self.Base.metadata.create_all(self.engine)
         self.sessionmaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
 
+        self.max_batch_size = max_batch_size
+        self._background_publisher = (
+            BackgroundPublisher(self._insert, max_queue_size, max_batch_size)
+            if publish_in_background
+            else None
+        )
+
     @classmethod
     def from_endpoint_config(cls, broker_config: EndpointConfig) -> "SQLEventBroker":
         return cls(host=broker_config.url, **broker_config.kwargs)
@@ -65,10 +95,32 @@ class SQLEventBroker(EventBroker):
 
     def publish(self, event: Dict[Text, Any]) -> None:
         """Publishes a json-formatted Rasa Core event into an event queue."""
+        self.publish_many([event])
+
+    def publish_many(self, events: List[Dict[Text, Any]]) -> None:
+        """Inserts several json-formatted Rasa Core events at once."""
+        if self._background_publisher:
+            self._background_publisher.put(events)
+        else:
+            self._insert(events)
+
+    def _insert(self, events: List[Dict[Text, Any]]) -> None:
+        rows = [
+            {"sender_id": event.get("sender_id"), "data": json.dumps(event)}
+            for event in events
+        ]
+        table = self.SQLBrokerEvent.__table__
+
         with self.session_scope() as session:
-            session.add(
-                self.SQLBrokerEvent(
-                    sender_id=event.get("sender_id"), data=json.dumps(event)
-                )
-            )
+            for start in range(0, len(rows), self.max_batch_size):
+                batch = rows[start : start + self.max_batch_size]
+                if self.engine.dialect.supports_multivalues_insert:
+                    session.execute(table.insert().values(batch))
+                else:
+                    session.execute(table.insert(), batch)
             session.commit()
+
+    def close(self) -> None:
+        """Waits until all queued events were inserted."""
+        if self._background_publisher:
+            self._background_publisher.flush()
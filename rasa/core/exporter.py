@@ -6,7 +6,7 @@ from typing import Text, Optional, List, Set, Dict, Any
 from tqdm import tqdm
 
 import rasa.cli.utils as cli_utils
-from rasa.core.brokers.broker import EventBroker
+from rasa.core.brokers.broker import DEFAULT_MAX_BATCH_SIZE, EventBroker
 from rasa.core.brokers.pika import PikaEventBroker
 from rasa.core.constants import RASA_EXPORT_PROCESS_ID_HEADER_NAME
 from rasa.core.tracker_store import TrackerStore
@@ -79,15 +79,18 @@ class Exporter:
 
         headers = self._get_message_headers()
 
-        for event in tqdm(events, "events"):
-            # noinspection PyBroadException
-            try:
-                self._publish_with_message_headers(event, headers)
-                published_events += 1
-                current_timestamp = event["timestamp"]
-            except Exception as e:
-                logger.exception(e)
-                raise PublishingError(current_timestamp)
+        with tqdm(total=len(events), desc="events") as progress_bar:
+            for start in range(0, len(events), DEFAULT_MAX_BATCH_SIZE):
+                batch = events[start : start + DEFAULT_MAX_BATCH_SIZE]
+                # noinspection PyBroadException
+                try:
+                    self._publish_with_message_headers(batch, headers)
+                    published_events += len(batch)
+                    current_timestamp = batch[-1]["timestamp"]
+                except Exception as e:
+                    logger.exception(e)
+                    raise PublishingError(current_timestamp)
+                progress_bar.update(len(batch))
 
         self.event_broker.close()
 
@@ -108,20 +111,20 @@ class Exporter:
         return None
 
     def _publish_with_message_headers(
-        self, event: Dict[Text, Any], headers: Optional[Dict[Text, Text]]
+        self, events: List[Dict[Text, Any]], headers: Optional[Dict[Text, Text]]
     ) -> None:
-        """Publish `event` to a message broker with `headers`.
+        """Publish a batch of `events` to a message broker with `headers`.
 
         Args:
-            event: Serialized event to be published.
+            events: Serialized events to be published.
             headers: Message headers to be published if `self.event_broker` is a
                 `PikaEventBroker`.
 
         """
         if isinstance(self.event_broker, PikaEventBroker):
-            self.event_broker.publish(event=event, headers=headers)
+            self.event_broker.publish_batch(events, headers=headers)
         else:
-            self.event_broker.publish(event)
+            self.event_broker.publish_many(events)
 
     def _get_conversation_ids_in_tracker(self) -> Set[Text]:
         """Fetch conversation IDs in `self.tracker_store`.
@@ -212,15 +215,14 @@ class Exporter:
         )
 
         events = []
+        retrieved_conversation_ids = set()
 
-        for conversation_id in tqdm(conversation_ids_to_process, "conversation IDs"):
-            tracker = self.tracker_store.retrieve(conversation_id)
-            if not tracker:
-                logger.info(
-                    f"Could not retrieve tracker for conversation ID "
-                    f"'{conversation_id}'. Skipping."
-                )
-                continue
+        trackers = self.tracker_store.retrieve_many(conversation_ids_to_process)
+        for tracker in tqdm(
+            trackers, "conversation IDs", total=len(conversation_ids_to_process)
+        ):
+            conversation_id = tracker.sender_id
+            retrieved_conversation_ids.add(conversation_id)
 
             _events = tracker.current_state(EventVerbosity.ALL)["events"]
 
@@ -235,6 +237,12 @@ class Exporter:
                 self._get_events_for_conversation_id(_events, conversation_id)
             )
 
+        for conversation_id in conversation_ids_to_process - retrieved_conversation_ids:
+            logger.info(
+                f"Could not retrieve tracker for conversation ID "
+                f"'{conversation_id}'. Skipping."
+            )
+
         return self._sort_and_select_events_by_timestamp(events)
 
     @staticmethod
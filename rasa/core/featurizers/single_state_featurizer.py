@@ -1,8 +1,8 @@
 import logging
 import numpy as np
 import scipy.sparse
-from typing import List, Optional, Dict, Text, Set
-from collections import defaultdict
+from typing import Any, Hashable, List, Optional, Dict, Text, Set, Tuple
+from collections import OrderedDict, defaultdict
 
 import rasa.shared.utils.io
 from rasa.shared.core.domain import SubState, State, Domain
@@ -22,6 +22,9 @@ from rasa.shared.nlu.training_data.message import Message
 
 logger = logging.getLogger(__name__)
 
+# maximum number of (attribute, value) pairs whose interpreter features are cached
+MAX_CACHED_FEATURIZATIONS = 10000
+
 
 class SingleStateFeaturizer:
     """Base class to transform the dialogue state into an ML format.
@@ -36,6 +39,27 @@ class SingleStateFeaturizer:
     def __init__(self) -> None:
         self._default_feature_states = {}
         self.action_texts = []
+        self._reset_featurization_cache()
+
+    def _reset_featurization_cache(
+        self, interpreter: Optional[NaturalLanguageInterpreter] = None
+    ) -> None:
+        # features which the interpreter created for (attribute, value) pairs
+        self._featurization_interpreter = interpreter
+        self._featurization_cache: "OrderedDict[Tuple[Text, Any], List[Features]]" = (
+            OrderedDict()
+        )
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        # the cached features are not persisted
+        state = self.__dict__.copy()
+        state.pop("_featurization_interpreter", None)
+        state.pop("_featurization_cache", None)
+        return state
+
+    def __setstate__(self, state: Dict[Text, Any]) -> None:
+        self.__dict__.update(state)
+        self._reset_featurization_cache()
 
     def prepare_from_domain(self, domain: Domain) -> None:
         """Gets necessary information for featurization from domain.
@@ -84,17 +108,26 @@ class SingleStateFeaturizer:
         self, sub_state: SubState, attribute: Text, sparse: bool = False
     ) -> List["Features"]:
         state_features = self._state_features_for_attribute(sub_state, attribute)
-
-        features = np.zeros(len(self._default_feature_states[attribute]), np.float32)
-        for state_feature, value in state_features.items():
-            # check that the value is in default_feature_states to be able to assigh
-            # its value
-            if state_feature in self._default_feature_states[attribute]:
-                features[self._default_feature_states[attribute][state_feature]] = value
-        features = np.expand_dims(features, 0)
+        feature_states = self._default_feature_states[attribute]
+
+        # check that the value is in default_feature_states to be able to assign
+        # its value
+        indices_and_values = sorted(
+            (feature_states[state_feature], value)
+            for state_feature, value in state_features.items()
+            if state_feature in feature_states and value != 0
+        )
+        indices = np.array([index for index, _ in indices_and_values], np.int64)
+        values = np.array([value for _, value in indices_and_values], np.float32)
 
         if sparse:
-            features = scipy.sparse.coo_matrix(features)
+            features = scipy.sparse.coo_matrix(
+                (values, (np.zeros_like(indices), indices)),
+                shape=(1, len(feature_states)),
+            )
+        else:
+            features = np.zeros((1, len(feature_states)), np.float32)
+            features[0, indices] = values
 
         features = Features(
             features, FEATURE_TYPE_SENTENCE, attribute, self.__class__.__name__
@@ -141,6 +174,50 @@ class SingleStateFeaturizer:
 
         return output
 
+    def _features_from_interpreter(
+        self, attribute: Text, value: Any, interpreter: NaturalLanguageInterpreter
+    ) -> List["Features"]:
+        """Featurizes a single attribute value with the NLU pipeline.
+
+        The NLU pipeline featurizes every attribute independently. Since the same
+        intents, action names, and texts occur in many states, the features are
+        cached per (attribute, value) pair for the given interpreter.
+
+        Args:
+            attribute: The attribute, e.g. INTENT or ACTION_NAME.
+            value: The value of the attribute.
+            interpreter: The interpreter used to featurize the value.
+
+        Returns:
+            The features of the attribute.
+        """
+        if interpreter is not self._featurization_interpreter:
+            self._reset_featurization_cache(interpreter)
+
+        try:
+            key = (attribute, value)
+            features = self._featurization_cache.get(key)
+        except TypeError:
+            # unhashable values can't be cached
+            key = None
+            features = None
+
+        if features is not None:
+            self._featurization_cache.move_to_end(key)
+            return features
+
+        parsed_message = interpreter.featurize_message(Message(data={attribute: value}))
+        features = self._get_features_from_parsed_message(
+            parsed_message, {attribute}
+        ).get(attribute, [])
+
+        if key is not None:
+            self._featurization_cache[key] = features
+            if len(self._featurization_cache) > MAX_CACHED_FEATURIZATIONS:
+                self._featurization_cache.popitem(last=False)
+
+        return features
+
     @staticmethod
     def _get_name_attribute(attributes: Set[Text]) -> Optional[Text]:
         # there is always either INTENT or ACTION_NAME
@@ -160,14 +237,18 @@ class SingleStateFeaturizer:
         sparse: bool = False,
     ) -> Dict[Text, List["Features"]]:
 
-        message = Message(data=sub_state)
         # remove entities from possible attributes
         attributes = set(
             attribute for attribute in sub_state.keys() if attribute != ENTITIES
         )
 
-        parsed_message = interpreter.featurize_message(message)
-        output = self._get_features_from_parsed_message(parsed_message, attributes)
+        output = {}
+        for attribute in attributes:
+            features = self._features_from_interpreter(
+                attribute, sub_state[attribute], interpreter
+            )
+            if features:
+                output[attribute] = features
 
         # check that name attributes have features
         name_attribute = self._get_name_attribute(attributes)
@@ -182,6 +263,33 @@ class SingleStateFeaturizer:
 
         return output
 
+    def _encode_sub_state(
+        self,
+        state_type: Text,
+        sub_state: SubState,
+        is_user_input: bool,
+        interpreter: NaturalLanguageInterpreter,
+    ) -> Dict[Text, List["Features"]]:
+        if state_type == PREVIOUS_ACTION:
+            return self._extract_state_features(sub_state, interpreter, sparse=True)
+        # featurize user only if it is "real" user input,
+        # i.e. input from a turn after action_listen
+        if state_type == USER and is_user_input:
+            sub_state_features = self._extract_state_features(
+                sub_state, interpreter, sparse=True
+            )
+            if sub_state.get(ENTITIES):
+                sub_state_features[ENTITIES] = self._create_features(
+                    sub_state, ENTITIES, sparse=True
+                )
+            return sub_state_features
+        if state_type in {SLOTS, ACTIVE_LOOP}:
+            return {
+                state_type: self._create_features(sub_state, state_type, sparse=True)
+            }
+
+        return {}
+
     def encode_state(
         self, state: State, interpreter: NaturalLanguageInterpreter
     ) -> Dict[Text, List["Features"]]:
@@ -194,30 +302,94 @@ class SingleStateFeaturizer:
         Returns:
             A dictionary of state_type to list of features.
         """
+        is_user_input = is_prev_action_listen_in_state(state)
+
         state_features = {}
         for state_type, sub_state in state.items():
-            if state_type == PREVIOUS_ACTION:
-                state_features.update(
-                    self._extract_state_features(sub_state, interpreter, sparse=True)
-                )
-            # featurize user only if it is "real" user input,
-            # i.e. input from a turn after action_listen
-            if state_type == USER and is_prev_action_listen_in_state(state):
-                state_features.update(
-                    self._extract_state_features(sub_state, interpreter, sparse=True)
-                )
-                if sub_state.get(ENTITIES):
-                    state_features[ENTITIES] = self._create_features(
-                        sub_state, ENTITIES, sparse=True
-                    )
-
-            if state_type in {SLOTS, ACTIVE_LOOP}:
-                state_features[state_type] = self._create_features(
-                    sub_state, state_type, sparse=True
+            state_features.update(
+                self._encode_sub_state(
+                    state_type, sub_state, is_user_input, interpreter
                 )
+            )
 
         return state_features
 
+    @staticmethod
+    def _sub_state_key(sub_state: SubState) -> Optional[Hashable]:
+        try:
+            return frozenset(sub_state.items())
+        except TypeError:
+            # unhashable values can't be interned
+            return None
+
+    def encode_all_states(
+        self, states: List[State], interpreter: NaturalLanguageInterpreter
+    ) -> List[Dict[Text, List["Features"]]]:
+        """Encode the given states with the help of the given interpreter.
+
+        Training data contains many identical states and sub-states (e.g. the same
+        user intent or slot values occur in many turns). Every distinct state and
+        sub-state is only encoded once and its features are shared between all
+        occurrences, so the returned features must not be modified.
+
+        Args:
+            states: The states to encode
+            interpreter: The interpreter used to encode the states
+
+        Returns:
+            A dictionary of state_type to list of features for each state.
+        """
+        if type(self).encode_state is not SingleStateFeaturizer.encode_state:
+            # respect custom encodings of subclasses
+            return [self.encode_state(state, interpreter) for state in states]
+
+        encoded_states: Dict[Any, Dict[Text, List["Features"]]] = {}
+        encoded_sub_states: Dict[Hashable, Dict[Text, List["Features"]]] = {}
+
+        all_state_features = []
+        for state in states:
+            # the same state object is often part of several training examples
+            state_features = encoded_states.get(id(state))
+            if state_features is not None:
+                all_state_features.append(state_features)
+                continue
+
+            is_user_input = is_prev_action_listen_in_state(state)
+            sub_state_keys = []
+            for state_type, sub_state in state.items():
+                sub_state_key = self._sub_state_key(sub_state)
+                if sub_state_key is not None:
+                    sub_state_key = (
+                        state_type,
+                        state_type == USER and is_user_input,
+                        sub_state_key,
+                    )
+                sub_state_keys.append(sub_state_key)
+
+            state_key = (
+                tuple(sub_state_keys) if None not in sub_state_keys else id(state)
+            )
+            state_features = encoded_states.get(state_key)
+            if state_features is None:
+                state_features = {}
+                for (state_type, sub_state), sub_state_key in zip(
+                    state.items(), sub_state_keys
+                ):
+                    sub_state_features = encoded_sub_states.get(sub_state_key)
+                    if sub_state_features is None:
+                        sub_state_features = self._encode_sub_state(
+                            state_type, sub_state, is_user_input, interpreter
+                        )
+                        if sub_state_key is not None:
+                            encoded_sub_states[sub_state_key] = sub_state_features
+                    state_features.update(sub_state_features)
+                encoded_states[state_key] = state_features
+
+            encoded_states[id(state)] = state_features
+            all_state_features.append(state_features)
+
+        return all_state_features
+
     def _encode_action(
         self, action: Text, interpreter: NaturalLanguageInterpreter
     ) -> Dict[Text, List["Features"]]:
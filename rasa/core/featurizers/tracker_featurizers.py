@@ -1,23 +1,102 @@
+import contextlib
 import jsonpickle
 import logging
+import multiprocessing
 import os
 
 from rasa.shared.nlu.constants import TEXT
 from tqdm import tqdm
-from typing import Tuple, List, Optional, Dict, Text
+from typing import (
+    Any,
+    Generator,
+    Hashable,
+    Iterable,
+    Tuple,
+    List,
+    Optional,
+    Dict,
+    Text,
+)
 import numpy as np
 
+from rasa.constants import (
+    DEFAULT_TRACKER_FEATURIZATION_WORKERS,
+    ENV_TRACKER_FEATURIZATION_WORKERS,
+)
 from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
 from rasa.shared.core.domain import State, Domain
 from rasa.shared.core.events import ActionExecuted
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
 from rasa.shared.core.constants import USER
+import rasa.shared.utils.common
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.features import Features
 
 logger = logging.getLogger(__name__)
 
+# number of shards of the training trackers per worker process
+SHARDS_PER_WORKER = 4
+
+# sliced states, action, and hash of a training example
+TrainingExample = Tuple[List[State], Text, Optional[Tuple[int, int, Text]]]
+
+# states and training examples of the training trackers which are shared between
+# featurizers while `share_training_data` is active
+_shared_training_data: Optional[Dict[Hashable, Tuple[Any, Any, Any]]] = None
+
+
+@contextlib.contextmanager
+def share_training_data() -> Generator[None, None, None]:
+    """Shares the training data of trackers between featurizers within the context.
+
+    The states of every training tracker are only created once and featurizers
+    with the same configuration reuse the training examples which were already
+    created for a tracker. This avoids featurizing the same trackers again for
+    every policy of an ensemble. The trackers and the domain must not be modified
+    while the context is active.
+    """
+    global _shared_training_data
+
+    if _shared_training_data is not None:
+        # an outer context is already sharing the training data
+        yield
+        return
+
+    _shared_training_data = {}
+    try:
+        yield
+    finally:
+        _shared_training_data = None
+
+
+def _shared_tracker_data(
+    key: Hashable, tracker: DialogueStateTracker, domain: Domain
+) -> Optional[Any]:
+    """Returns the shared data of a tracker or `None` if there is none."""
+    if _shared_training_data is None:
+        return None
+
+    entry = _shared_training_data.get((key, id(tracker), id(domain)))
+    if entry is None or entry[0] is not tracker or entry[1] is not domain:
+        return None
+
+    return entry[2]
+
+
+def _share_tracker_data(
+    key: Hashable, tracker: DialogueStateTracker, domain: Domain, data: Any
+) -> None:
+    """Shares the data of a tracker in case `share_training_data` is active."""
+    if _shared_training_data is not None:
+        # the entry keeps references to the tracker and the domain so that their
+        # ids can't be reused by other objects while the entry exists
+        _shared_training_data[(key, id(tracker), id(domain))] = (
+            tracker,
+            domain,
+            data,
+        )
+
 
 class InvalidStory(Exception):
     """Exception that can be raised if story cannot be featurized."""
@@ -58,18 +137,44 @@ class TrackerFeaturizer:
         """
         return tracker.past_states(domain)
 
+    def _training_states(
+        self, tracker: DialogueStateTracker, domain: Domain
+    ) -> List[State]:
+        """Creates the states of a training tracker.
+
+        The states are shared with other featurizers in case `share_training_data`
+        is active. They must not be modified.
+        """
+        key = ("states", type(self)._create_states)
+        states = _shared_tracker_data(key, tracker, domain)
+        if states is None:
+            states = self._create_states(tracker, domain)
+            _share_tracker_data(key, tracker, domain, states)
+
+        return states
+
     def _featurize_states(
         self,
         trackers_as_states: List[List[State]],
         interpreter: NaturalLanguageInterpreter,
     ) -> List[List[Dict[Text, List["Features"]]]]:
-        return [
+        all_state_features = self.state_featurizer.encode_all_states(
             [
-                self.state_featurizer.encode_state(state, interpreter)
+                state
+                for tracker_states in trackers_as_states
                 for state in tracker_states
-            ]
-            for tracker_states in trackers_as_states
-        ]
+            ],
+            interpreter,
+        )
+
+        tracker_state_features = []
+        start = 0
+        for tracker_states in trackers_as_states:
+            end = start + len(tracker_states)
+            tracker_state_features.append(all_state_features[start:end])
+            start = end
+
+        return tracker_state_features
 
     @staticmethod
     def _convert_labels_to_ids(
@@ -248,7 +353,7 @@ class FullDialogueTrackerFeaturizer(TrackerFeaturizer):
             disable=rasa.shared.utils.io.is_logging_disabled(),
         )
         for tracker in pbar:
-            states = self._create_states(tracker, domain)
+            states = self._training_states(tracker, domain)
 
             delete_first_state = False
             actions = []
@@ -344,15 +449,179 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
         return states[-slice_length:]
 
     @staticmethod
+    def _prefix_hashes(states: List[State], tracker: DialogueStateTracker) -> List[int]:
+        """Calculates the rolling hashes of all prefixes of the states.
+
+        The hash of any slice of the states can then be derived in constant time.
+        """
+        prefix_hashes = [0]
+        for state in states:
+            frozen_state = (
+                state if state is None else tracker.freeze_current_state(state)
+            )
+            prefix_hashes.append(
+                rasa.shared.utils.common.extend_sequence_hash(
+                    prefix_hashes[-1], frozen_state
+                )
+            )
+        return prefix_hashes
+
     def _hash_example(
-        states: List[State], action: Text, tracker: DialogueStateTracker
-    ) -> int:
-        """Hash states for efficient deduplication."""
-        frozen_states = tuple(
-            s if s is None else tracker.freeze_current_state(s) for s in states
+        self, prefix_hashes: List[int], states_length: int, action: Text
+    ) -> Tuple[int, int, Text]:
+        """Hash the sliced states and the action for efficient deduplication."""
+        slice_length = states_length
+        if self.max_history:
+            slice_length = min(states_length, self.max_history)
+
+        states_hash = rasa.shared.utils.common.subsequence_hash(
+            prefix_hashes[states_length],
+            prefix_hashes[states_length - slice_length],
+            slice_length,
+        )
+        return slice_length, states_hash, action
+
+    def _training_examples(
+        self, tracker: DialogueStateTracker, domain: Domain
+    ) -> List[TrainingExample]:
+        """Creates the training examples of a single tracker.
+
+        Args:
+            tracker: The tracker.
+            domain: The domain.
+
+        Returns:
+            The sliced states, the action, and (if duplicates are removed) the hash
+            of every example.
+        """
+        states = self._training_states(tracker, domain)
+        if self.remove_duplicates:
+            prefix_hashes = self._prefix_hashes(states, tracker)
+
+        examples = []
+        states_length_for_action = 0
+        for event in tracker.applied_events():
+            if not isinstance(event, ActionExecuted):
+                continue
+
+            states_length_for_action += 1
+
+            # use only actions which can be predicted at a stories start
+            if event.unpredictable:
+                continue
+
+            sliced_states = self.slice_state_history(
+                states[:states_length_for_action], self.max_history
+            )
+            action = event.action_name or event.action_text
+            hashed = None
+            if self.remove_duplicates:
+                hashed = self._hash_example(
+                    prefix_hashes, states_length_for_action, action
+                )
+            examples.append((sliced_states, action, hashed))
+
+        return examples
+
+    def _training_examples_key(self) -> Hashable:
+        """Identifies featurizers which create the same training examples."""
+        return (
+            "examples",
+            type(self),
+            type(self)._create_states,
+            self.max_history,
+            self.remove_duplicates,
+        )
+
+    def _training_examples_of_trackers(
+        self, trackers: List[DialogueStateTracker], domain: Domain
+    ) -> Iterable[List[TrainingExample]]:
+        """Creates the training examples of every tracker.
+
+        In case `share_training_data` is active, the examples of trackers which
+        were already featurized by a featurizer with the same configuration are
+        reused.
+
+        Args:
+            trackers: The trackers.
+            domain: The domain.
+
+        Returns:
+            The training examples of every tracker in the order of the trackers.
+        """
+        if _shared_training_data is None:
+            return self._create_training_examples_of_trackers(trackers, domain)
+
+        key = self._training_examples_key()
+        examples_of_trackers = [
+            _shared_tracker_data(key, tracker, domain) for tracker in trackers
+        ]
+        missing = [
+            index
+            for index, examples in enumerate(examples_of_trackers)
+            if examples is None
+        ]
+        if len(missing) < len(trackers):
+            logger.debug(
+                f"Reusing the training examples of "
+                f"{len(trackers) - len(missing)} of {len(trackers)} trackers."
+            )
+
+        created = self._create_training_examples_of_trackers(
+            [trackers[index] for index in missing], domain
+        )
+        for index, examples in zip(missing, created):
+            _share_tracker_data(key, trackers[index], domain, examples)
+            examples_of_trackers[index] = examples
+
+        return examples_of_trackers
+
+    def _create_training_examples_of_trackers(
+        self, trackers: List[DialogueStateTracker], domain: Domain
+    ) -> Iterable[List[TrainingExample]]:
+        """Creates the training examples of every tracker.
+
+        The trackers are featurized by several processes in case this was
+        configured with the `RASA_TRACKER_FEATURIZATION_WORKERS` environment
+        variable. The hashes of the examples depend on the hash seed of the
+        process, so the worker processes have to be forked.
+
+        Args:
+            trackers: The trackers.
+            domain: The domain.
+
+        Returns:
+            The training examples of every tracker in the order of the trackers.
+        """
+        num_workers = rasa.shared.utils.common.number_of_workers(
+            ENV_TRACKER_FEATURIZATION_WORKERS, DEFAULT_TRACKER_FEATURIZATION_WORKERS
+        )
+        if (
+            num_workers <= 1
+            or len(trackers) < 2
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            return (self._training_examples(tracker, domain) for tracker in trackers)
+
+        num_shards = min(len(trackers), num_workers * SHARDS_PER_WORKER)
+        shard_size = -(-len(trackers) // num_shards)
+        shards = [
+            (self, trackers[start : start + shard_size], domain)
+            for start in range(0, len(trackers), shard_size)
+        ]
+        logger.debug(
+            f"Featurizing {len(trackers)} trackers in {len(shards)} shards "
+            f"using {num_workers} processes."
+        )
+        examples_of_shards = rasa.shared.utils.common.map_in_parallel(
+            _training_examples_of_shard, shards, num_workers, start_method="fork"
+        )
+
+        return (
+            examples
+            for examples_of_shard in examples_of_shards
+            for examples in examples_of_shard
         )
-        frozen_actions = (action,)
-        return hash((frozen_states, frozen_actions))
 
     def training_states_and_actions(
         self, trackers: List[DialogueStateTracker], domain: Domain
@@ -382,45 +651,24 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
             "".format(type(self).__name__, type(self.state_featurizer).__name__)
         )
         pbar = tqdm(
-            trackers,
+            self._training_examples_of_trackers(trackers, domain),
+            total=len(trackers),
             desc="Processed trackers",
             disable=rasa.shared.utils.io.is_logging_disabled(),
         )
-        for tracker in pbar:
-            states = self._create_states(tracker, domain)
+        for examples in pbar:
+            for sliced_states, action, hashed in examples:
+                # only continue with tracker_states that created a
+                # hashed_featurization we haven't observed
+                if hashed is not None:
+                    if hashed in hashed_examples:
+                        continue
+                    hashed_examples.add(hashed)
 
-            states_length_for_action = 0
-            for event in tracker.applied_events():
-                if not isinstance(event, ActionExecuted):
-                    continue
-
-                states_length_for_action += 1
+                trackers_as_states.append(sliced_states)
+                trackers_as_actions.append([action])
 
-                # use only actions which can be predicted at a stories start
-                if event.unpredictable:
-                    continue
-
-                sliced_states = self.slice_state_history(
-                    states[:states_length_for_action], self.max_history
-                )
-                if self.remove_duplicates:
-                    hashed = self._hash_example(
-                        sliced_states, event.action_name or event.action_text, tracker
-                    )
-
-                    # only continue with tracker_states that created a
-                    # hashed_featurization we haven't observed
-                    if hashed not in hashed_examples:
-                        hashed_examples.add(hashed)
-                        trackers_as_states.append(sliced_states)
-                        trackers_as_actions.append(
-                            [event.action_name or event.action_text]
-                        )
-                else:
-                    trackers_as_states.append(sliced_states)
-                    trackers_as_actions.append([event.action_name or event.action_text])
-
-                pbar.set_postfix({"# actions": "{:d}".format(len(trackers_as_actions))})
+            pbar.set_postfix({"# actions": "{:d}".format(len(trackers_as_actions))})
 
         logger.debug("Created {} action examples.".format(len(trackers_as_actions)))
 
@@ -454,3 +702,10 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
                     del state[USER][TEXT]
 
         return trackers_as_states
+
+
+def _training_examples_of_shard(
+    shard: Tuple[MaxHistoryTrackerFeaturizer, List[DialogueStateTracker], Domain]
+) -> List[List[TrainingExample]]:
+    featurizer, trackers, domain = shard
+    return [featurizer._training_examples(tracker, domain) for tracker in trackers]
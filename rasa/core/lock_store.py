@@ -4,7 +4,7 @@ import logging
 import os
 
 from async_generator import asynccontextmanager
-from typing import Text, Union, Optional, AsyncGenerator
+from typing import Text, Union, Optional, AsyncGenerator, Tuple
 
 import rasa.shared.utils.common
 from rasa.core.constants import DEFAULT_LOCK_LIFETIME
@@ -72,13 +72,21 @@ class LockStore:
 
         Creates a new lock if none is found.
         """
+        ticket, _ = self._issue_ticket(conversation_id, lock_lifetime)
+
+        return ticket
+
+    def _issue_ticket(
+        self, conversation_id: Text, lock_lifetime: float
+    ) -> Tuple[int, Optional[TicketLock]]:
+        """Issue new ticket and return it together with the lock fetched after
+        saving it."""
         logger.debug(f"Issuing ticket for conversation '{conversation_id}'.")
         try:
             lock = self.get_or_create_lock(conversation_id)
             ticket = lock.issue_ticket(lock_lifetime)
-            self.save_lock(lock)
 
-            return ticket
+            return ticket, self._save_and_get_lock(lock)
         except Exception as e:
             raise LockError(f"Error while acquiring lock. Error:\n{e}")
 
@@ -94,27 +102,26 @@ class LockStore:
         Try acquiring lock with a wait time of `wait_time_in_seconds` seconds
         between attempts. Raise a `LockError` if lock has expired.
         """
-        ticket = self.issue_ticket(conversation_id, lock_lifetime)
+        ticket, lock = self._issue_ticket(conversation_id, lock_lifetime)
         try:
 
             yield await self._acquire_lock(
-                conversation_id, ticket, wait_time_in_seconds
+                conversation_id, ticket, wait_time_in_seconds, lock
             )
         finally:
             self.cleanup(conversation_id, ticket)
 
     async def _acquire_lock(
-        self, conversation_id: Text, ticket: int, wait_time_in_seconds: float
+        self,
+        conversation_id: Text,
+        ticket: int,
+        wait_time_in_seconds: float,
+        lock: Optional[TicketLock],
     ) -> TicketLock:
         logger.debug(f"Acquiring lock for conversation '{conversation_id}'.")
-        while True:
-            # fetch lock in every iteration because lock might no longer exist
-            lock = self.get_lock(conversation_id)
-
-            # exit loop if lock does not exist anymore (expired)
-            if not lock:
-                break
 
+        # exit loop if lock does not exist anymore (expired)
+        while lock:
             # acquire lock if it isn't locked
             if not lock.is_locked(ticket):
                 logger.debug(f"Acquired lock for conversation '{conversation_id}'.")
@@ -125,9 +132,10 @@ class LockStore:
                 f"Retrying..."
             )
 
-            # sleep and update lock
+            # sleep and update lock, the lock is fetched in every iteration
+            # because it might no longer exist
             await asyncio.sleep(wait_time_in_seconds)
-            self.update_lock(conversation_id)
+            lock = self._update_and_get_lock(conversation_id)
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
@@ -141,6 +149,26 @@ class LockStore:
             lock.remove_expired_tickets()
             self.save_lock(lock)
 
+    def _update_and_get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
+        """Remove expired tickets from the lock for `conversation_id` and return the
+        lock fetched after saving it."""
+
+        lock = self.get_lock(conversation_id)
+        if not lock:
+            return None
+
+        lock.remove_expired_tickets()
+        return self._save_and_get_lock(lock)
+
+    def _save_and_get_lock(self, lock: TicketLock) -> Optional[TicketLock]:
+        """Commit `lock` to storage and fetch it again.
+
+        The lock is fetched again since other processes might have changed it.
+        """
+
+        self.save_lock(lock)
+        return self.get_lock(lock.conversation_id)
+
     def get_or_create_lock(self, conversation_id: Text) -> TicketLock:
         """Fetch existing lock for `conversation_id` or create a new one if
         it doesn't exist."""
@@ -174,11 +202,17 @@ class LockStore:
             self.save_lock(lock)
 
     def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
-        """Remove lock for `conversation_id` if no one is waiting."""
+        """Finish serving ticket with `ticket_number` for `conversation_id` and
+        remove the lock if no one is waiting."""
 
-        self.finish_serving(conversation_id, ticket_number)
-        if not self.is_someone_waiting(conversation_id):
-            self.delete_lock(conversation_id)
+        lock = self.get_lock(conversation_id)
+        if lock:
+            lock.remove_ticket_for(ticket_number)
+            if lock.is_someone_waiting():
+                self.save_lock(lock)
+                return
+
+        self.delete_lock(conversation_id)
 
     @staticmethod
     def _log_deletion(conversation_id: Text, deletion_successful: bool) -> None:
@@ -226,7 +260,10 @@ class RedisLockStore(LockStore):
         super().__init__()
 
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
-        serialised_lock = self.red.get(conversation_id)
+        return self._deserialise_lock(self.red.get(conversation_id))
+
+    @staticmethod
+    def _deserialise_lock(serialised_lock: Optional[bytes]) -> Optional[TicketLock]:
         if serialised_lock:
             return TicketLock.from_dict(json.loads(serialised_lock))
 
@@ -237,6 +274,15 @@ class RedisLockStore(LockStore):
     def save_lock(self, lock: TicketLock) -> None:
         self.red.set(lock.conversation_id, lock.dumps())
 
+    def _save_and_get_lock(self, lock: TicketLock) -> Optional[TicketLock]:
+        # send both commands in a single round trip
+        pipeline = self.red.pipeline(transaction=False)
+        pipeline.set(lock.conversation_id, lock.dumps())
+        pipeline.get(lock.conversation_id)
+        _, serialised_lock = pipeline.execute()
+
+        return self._deserialise_lock(serialised_lock)
+
 
 class InMemoryLockStore(LockStore):
     """In-memory store for ticket locks."""
@@ -33,7 +33,10 @@ from rasa.shared.core.events import (
     Event,
 )
 from rasa.core.exceptions import UnsupportedDialogueModelError
-from rasa.core.featurizers.tracker_featurizers import MaxHistoryTrackerFeaturizer
+from rasa.core.featurizers.tracker_featurizers import (
+    MaxHistoryTrackerFeaturizer,
+    share_training_data,
+)
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.core.policies.policy import Policy, SupportedData
 from rasa.core.policies.fallback import FallbackPolicy
@@ -200,13 +203,16 @@ class PolicyEnsemble:
         if training_trackers:
             self._emit_rule_policy_warning(training_trackers)
 
-            for policy in self.policies:
-                trackers_to_train = SupportedData.trackers_for_policy(
-                    policy, training_trackers
-                )
-                policy.train(
-                    trackers_to_train, domain, interpreter=interpreter, **kwargs
-                )
+            # policies with the same featurizer configuration reuse each other's
+            # featurized trackers
+            with share_training_data():
+                for policy in self.policies:
+                    trackers_to_train = SupportedData.trackers_for_policy(
+                        policy, training_trackers
+                    )
+                    policy.train(
+                        trackers_to_train, domain, interpreter=interpreter, **kwargs
+                    )
 
             training_events = self._training_events_from_trackers(training_trackers)
             self.action_fingerprints = self._create_action_fingerprints(training_events)
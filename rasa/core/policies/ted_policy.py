@@ -139,7 +139,8 @@ class TEDPolicy(Policy):
         # Batch size will be linearly increased for each epoch.
         BATCH_SIZES: [64, 256],
         # Strategy used whenc creating batches.
-        # Can be either 'sequence' or 'balanced'.
+        # Can be 'sequence', 'balanced' or 'bucketed'. 'bucketed' balances the
+        # batches and groups examples of similar length to reduce padding.
         BATCH_STRATEGY: BALANCED,
         # Number of epochs to train
         EPOCHS: 1,
@@ -86,7 +86,7 @@ class MessageProcessor:
 
         if not self.policy_ensemble or not self.domain:
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
             rasa.shared.utils.io.raise_warning(
                 "No policy ensemble or domain set. Skipping action prediction "
                 "and execution.",
@@ -97,7 +97,7 @@ class MessageProcessor:
         await self._predict_and_execute_next_action(message.output_channel, tracker)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         if isinstance(message.output_channel, CollectingOutputChannel):
             return message.output_channel.messages
@@ -126,7 +126,7 @@ class MessageProcessor:
 
         probabilities, policy = self._get_next_action_probabilities(tracker)
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
         scores = [
             {"action": a, "score": p}
             for a, p in zip(self.domain.action_names, probabilities)
@@ -188,7 +188,7 @@ class MessageProcessor:
               Tracker for `sender_id` if available, `None` otherwise.
         """
 
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker_async(sender_id)
         if not tracker:
             return None
 
@@ -216,6 +216,24 @@ class MessageProcessor:
             conversation_id, append_action_listen=False
         )
 
+    async def get_tracker_async(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Get the tracker for a conversation without blocking the event loop.
+
+        Args:
+            conversation_id: The ID of the conversation for which the history should be
+                retrieved.
+
+        Returns:
+            Tracker for the conversation. Creates an empty tracker in case it's a new
+            conversation.
+        """
+        conversation_id = conversation_id or DEFAULT_SENDER_ID
+        return await self.tracker_store.get_or_create_tracker_async(
+            conversation_id, append_action_listen=False
+        )
+
     async def log_message(
         self, message: UserMessage, should_save_tracker: bool = True
     ) -> Optional[DialogueStateTracker]:
@@ -237,7 +255,7 @@ class MessageProcessor:
 
             if should_save_tracker:
                 # save tracker state to continue conversation from this state
-                self._save_tracker(tracker)
+                await self._save_tracker(tracker)
         else:
             logger.warning(
                 f"Failed to retrieve or create tracker for conversation ID "
@@ -265,7 +283,7 @@ class MessageProcessor:
             )
 
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
         else:
             logger.warning(
                 f"Failed to retrieve or create tracker for conversation ID "
@@ -340,20 +358,25 @@ class MessageProcessor:
             )
             return None
 
-        if (
-            reminder_event.kill_on_user_message
-            and self._has_message_after_reminder(tracker, reminder_event)
-            or not self._is_reminder_still_valid(tracker, reminder_event)
-        ):
-            logger.debug(
-                f"Canceled reminder because it is outdated ({reminder_event})."
-            )
-        else:
-            intent = reminder_event.intent
-            entities = reminder_event.entities or {}
-            await self.trigger_external_user_uttered(
-                intent, entities, tracker, output_channel
-            )
+        try:
+            if (
+                reminder_event.kill_on_user_message
+                and self._has_message_after_reminder(tracker, reminder_event)
+                or not self._is_reminder_still_valid(tracker, reminder_event)
+            ):
+                logger.debug(
+                    f"Canceled reminder because it is outdated ({reminder_event})."
+                )
+            else:
+                intent = reminder_event.intent
+                entities = reminder_event.entities or {}
+                await self.trigger_external_user_uttered(
+                    intent, entities, tracker, output_channel
+                )
+        finally:
+            # reminders aren't handled within a conversation lock, which would
+            # flush the tracker when it's released
+            await self.tracker_store.flush_async(sender_id)
 
     async def trigger_external_user_uttered(
         self,
@@ -399,7 +422,7 @@ class MessageProcessor:
         )
         await self._predict_and_execute_next_action(output_channel, tracker)
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
     @staticmethod
     def _log_slots(tracker) -> None:
@@ -784,8 +807,8 @@ class MessageProcessor:
 
         return has_expired
 
-    def _save_tracker(self, tracker: DialogueStateTracker) -> None:
-        self.tracker_store.save(tracker)
+    async def _save_tracker(self, tracker: DialogueStateTracker) -> None:
+        await self.tracker_store.save_async(tracker)
 
     def _prob_array_for_action(self, action_name: Text) -> Tuple[List[float], None]:
         idx = self.domain.index_for_action(action_name)
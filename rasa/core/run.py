@@ -209,6 +209,15 @@ def serve_application(
 
     app.register_listener(clear_model_files, "after_server_stop")
 
+    async def flush_tracker_store(_app: Sanic, _loop: Text) -> None:
+        if _app.agent and _app.agent.tracker_store:
+            await _app.agent.tracker_store.flush_async()
+            # publishes the events which are still queued
+            if _app.agent.tracker_store.event_broker:
+                _app.agent.tracker_store.event_broker.close()
+
+    app.register_listener(flush_tracker_store, "before_server_stop")
+
     rasa.utils.common.update_sanic_log_level(log_file)
 
     app.run(
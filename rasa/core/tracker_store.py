@@ -1,13 +1,20 @@
+import asyncio
 import contextlib
+import copy
+import functools
 import itertools
 import json
 import logging
 import os
 import pickle
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 
 from time import sleep
 from typing import (
+    Any,
     Callable,
     Dict,
     Iterable,
@@ -15,6 +22,7 @@ from typing import (
     List,
     Optional,
     Text,
+    Tuple,
     Union,
     TYPE_CHECKING,
 )
@@ -32,7 +40,7 @@ from rasa.core.constants import (
 )
 from rasa.shared.core.conversation import Dialogue
 from rasa.shared.core.domain import Domain
-from rasa.shared.core.events import SessionStarted
+from rasa.shared.core.events import Event, SessionStarted
 from rasa.shared.core.trackers import (
     ActionExecuted,
     DialogueStateTracker,
@@ -51,13 +59,33 @@ if TYPE_CHECKING:
     from sqlalchemy.orm.session import Session
     from sqlalchemy import Sequence
     from sqlalchemy.orm.query import Query
+    from sqlalchemy.orm.session import sessionmaker
+    from sqlalchemy.ext.baked import Result
 
 logger = logging.getLogger(__name__)
 
+# compression algorithms for trackers stored in Redis
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_LZ4 = "lz4"
+
+# serialised trackers smaller than this aren't compressed
+DEFAULT_COMPRESSION_THRESHOLD_IN_BYTES = 1024
+
+# magic numbers at the start of compressed data, which distinguish compressed
+# trackers from uncompressed ones (which start with `{`)
+ZLIB_MAGIC_NUMBER = b"\x78"
+ZSTD_MAGIC_NUMBER = b"\x28\xb5\x2f\xfd"
+LZ4_MAGIC_NUMBER = b"\x04\x22\x4d\x18"
+
 # default values of PostgreSQL pool size and max overflow
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# number of sender IDs or conversations which are fetched at once when iterating
+# over the conversations of a tracker store
+DEFAULT_PAGE_SIZE = 100
+
 
 class TrackerStore:
     """Class to hold all of the TrackerStore classes"""
@@ -118,6 +146,43 @@ class TrackerStore:
             tracker = self.create_tracker(
                 sender_id, append_action_listen=append_action_listen
             )
+        else:
+            tracker.number_of_persisted_events = len(tracker.events)
+        return tracker
+
+    async def get_or_create_tracker_async(
+        self,
+        sender_id: Text,
+        max_event_history: Optional[int] = None,
+        append_action_listen: bool = True,
+    ) -> "DialogueStateTracker":
+        """Returns tracker or creates one without blocking the event loop.
+
+        If the tracker store overrides `get_or_create_tracker`, it is run in a worker
+        thread instead.
+
+        Args:
+            sender_id: Conversation ID associated with the requested tracker.
+            max_event_history: Value to update the tracker store's max event history to.
+            append_action_listen: Whether or not to append an initial `action_listen`.
+        """
+        if self._overrides(TrackerStore.get_or_create_tracker):
+            # custom tracker stores might only override the blocking method
+            return await self._run_in_thread(
+                self.get_or_create_tracker,
+                sender_id,
+                max_event_history,
+                append_action_listen,
+            )
+
+        tracker = await self.retrieve_async(sender_id)
+        self.max_event_history = max_event_history
+        if tracker is None:
+            tracker = await self.create_tracker_async(
+                sender_id, append_action_listen=append_action_listen
+            )
+        else:
+            tracker.number_of_persisted_events = len(tracker.events)
         return tracker
 
     def init_tracker(self, sender_id: Text) -> "DialogueStateTracker":
@@ -147,6 +212,7 @@ class TrackerStore:
         tracker = self.init_tracker(sender_id)
 
         if tracker:
+            tracker.number_of_persisted_events = 0
             if append_action_listen:
                 tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
 
@@ -154,6 +220,37 @@ class TrackerStore:
 
         return tracker
 
+    async def create_tracker_async(
+        self, sender_id: Text, append_action_listen: bool = True
+    ) -> DialogueStateTracker:
+        """Creates a new tracker for `sender_id` without blocking the event loop.
+
+        If the tracker store overrides `create_tracker`, it is run in a worker thread
+        instead.
+
+        Args:
+            sender_id: Conversation ID associated with the tracker.
+            append_action_listen: Whether or not to append an initial `action_listen`.
+
+        Returns:
+            The newly created tracker for `sender_id`.
+        """
+        if self._overrides(TrackerStore.create_tracker):
+            return await self._run_in_thread(
+                self.create_tracker, sender_id, append_action_listen
+            )
+
+        tracker = self.init_tracker(sender_id)
+
+        if tracker:
+            tracker.number_of_persisted_events = 0
+            if append_action_listen:
+                tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+            await self.save_async(tracker)
+
+        return tracker
+
     def save(self, tracker):
         """Save method that will be overridden by specific tracker"""
         raise NotImplementedError()
@@ -162,14 +259,68 @@ class TrackerStore:
         """Retrieve method that will be overridden by specific tracker"""
         raise NotImplementedError()
 
+    def _overrides(self, method: Callable) -> bool:
+        """Checks whether the tracker store overrides a method of `TrackerStore`."""
+        return getattr(type(self), method.__name__) is not method
+
+    @staticmethod
+    async def _run_in_thread(function: Callable, *args: Any) -> Any:
+        """Runs a blocking function in a worker thread of the event loop."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(function, *args))
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        """Saves the tracker without blocking the event loop.
+
+        By default `save` is run in a worker thread, so the implementation of `save`
+        has to be thread-safe. Tracker stores with a non-blocking client can
+        override this method instead.
+
+        Args:
+            tracker: The tracker to save.
+        """
+        await self._run_in_thread(self.save, tracker)
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves a tracker without blocking the event loop.
+
+        By default `retrieve` is run in a worker thread, so the implementation of
+        `retrieve` has to be thread-safe. Tracker stores with a non-blocking client
+        can override this method instead.
+
+        Args:
+            sender_id: Conversation ID of the tracker.
+
+        Returns:
+            The tracker or `None` if there is no tracker for `sender_id`.
+        """
+        return await self._run_in_thread(self.retrieve, sender_id)
+
     def stream_events(self, tracker: DialogueStateTracker) -> None:
-        """Streams events to a message broker"""
-        offset = self.number_of_existing_events(tracker.sender_id)
+        """Streams the events which aren't stored yet to a message broker.
+
+        The events which are already stored are only counted using the tracker
+        store if the tracker doesn't know their number, e.g. because it was neither
+        retrieved from nor saved to this tracker store.
+
+        Args:
+            tracker: The tracker which is saved.
+        """
+        offset = tracker.number_of_persisted_events
+        if offset is None:
+            offset = self.number_of_existing_events(tracker.sender_id)
+
         events = tracker.events
-        for event in list(itertools.islice(events, offset, len(events))):
+        bodies = []
+        for event in itertools.islice(events, offset, len(events)):
             body = {"sender_id": tracker.sender_id}
             body.update(event.as_dict())
-            self.event_broker.publish(body)
+            bodies.append(body)
+
+        if bodies:
+            self.event_broker.publish_many(bodies)
+
+        tracker.number_of_persisted_events = len(events)
 
     def number_of_existing_events(self, sender_id: Text) -> int:
         """Return number of stored events for a given sender id."""
@@ -180,6 +331,57 @@ class TrackerStore:
         """Returns the set of values for the tracker store's primary key"""
         raise NotImplementedError()
 
+    def retrieve_many(
+        self, sender_ids: Iterable[Text]
+    ) -> Iterator[DialogueStateTracker]:
+        """Retrieves the trackers of several conversations.
+
+        Conversations without a tracker are skipped. Tracker stores which can
+        fetch several conversations at once should override this method, and might
+        not return the trackers in the order of `sender_ids`.
+
+        Args:
+            sender_ids: Conversation IDs of the trackers.
+
+        Returns:
+            The trackers of the conversations.
+        """
+        for sender_id in sender_ids:
+            tracker = self.retrieve(sender_id)
+            if tracker is not None:
+                yield tracker
+
+    async def keys_async(self) -> Iterable[Text]:
+        """Returns the tracker store's primary keys without blocking the event loop.
+
+        By default `keys` is run in a worker thread.
+        """
+        return await self._run_in_thread(lambda: list(self.keys()))
+
+    def save_many(self, trackers: Iterable[DialogueStateTracker]) -> None:
+        """Saves several trackers.
+
+        Tracker stores which can write multiple trackers at once should override
+        this method.
+
+        Args:
+            trackers: The trackers to save.
+        """
+        for tracker in trackers:
+            self.save(tracker)
+
+    async def flush_async(self, sender_id: Optional[Text] = None) -> None:
+        """Persists saves which the tracker store deferred.
+
+        This is called with the conversation ID whenever the lock of a conversation
+        is released. Tracker stores save trackers right away by default, so there
+        is nothing to flush.
+
+        Args:
+            sender_id: Conversation ID whose lock was released. `None` requests
+                that all deferred saves are persisted, e.g. before a shutdown.
+        """
+
     @staticmethod
     def serialise_tracker(tracker: DialogueStateTracker) -> Text:
         """Serializes the tracker, returns representation of the tracker."""
@@ -222,20 +424,74 @@ class TrackerStore:
 
 
 class InMemoryTrackerStore(TrackerStore):
-    """Stores conversation history in memory"""
+    """Stores conversation history in memory.
+
+    The store keeps a snapshot of every tracker which is copied when it's saved or
+    retrieved. The copies share their (immutable) events, so that the trackers
+    don't have to be serialised and replayed.
+
+    The number of stored conversations and events can be bounded, and conversations
+    can expire if they weren't accessed for a while. The least recently used
+    conversations are evicted first. Evicted conversations are lost unless a
+    `spill_path` is given: they are then written to an SQLite database at this path
+    and loaded again when they are retrieved.
+    """
 
     def __init__(
-        self, domain: Domain, event_broker: Optional[EventBroker] = None
+        self,
+        domain: Domain,
+        event_broker: Optional[EventBroker] = None,
+        max_conversations: Optional[int] = None,
+        max_events: Optional[int] = None,
+        conversation_ttl: Optional[float] = None,
+        spill_path: Optional[Text] = None,
     ) -> None:
-        self.store = {}
+        """Create an `InMemoryTrackerStore`.
+
+        Args:
+            domain: The `Domain` to initialize the `DialogueStateTracker`.
+            event_broker: An event broker to publish any new events to another
+                destination.
+            max_conversations: Maximum number of conversations kept in memory.
+            max_events: Maximum number of events of all conversations kept in memory.
+            conversation_ttl: Number of seconds after which conversations which
+                weren't retrieved or saved are evicted.
+            spill_path: Path of an SQLite database which evicted conversations are
+                written to.
+        """
+        self.store: "OrderedDict[Text, Tuple[DialogueStateTracker, Domain]]" = (
+            OrderedDict()
+        )
+        self.max_conversations = max_conversations
+        self.max_events = max_events
+        self.conversation_ttl = conversation_ttl
+        self.number_of_events = 0
+        self._last_access: Dict[Text, float] = {}
+        # `save` and `retrieve` may be called from several threads
+        self._lock = threading.RLock()
+
+        self._spill = None
+        if spill_path:
+            import sqlite3
+
+            self._spill = sqlite3.connect(spill_path, check_same_thread=False)
+            self._spill.execute(
+                "CREATE TABLE IF NOT EXISTS trackers "
+                "(sender_id TEXT PRIMARY KEY, tracker TEXT NOT NULL)"
+            )
+
         super().__init__(domain, event_broker)
 
     def save(self, tracker: DialogueStateTracker) -> None:
         """Updates and saves the current conversation state"""
         if self.event_broker:
             self.stream_events(tracker)
-        serialised = InMemoryTrackerStore.serialise_tracker(tracker)
-        self.store[tracker.sender_id] = serialised
+
+        snapshot = tracker.snapshot()
+        with self._lock:
+            self._remove(tracker.sender_id)
+            self._add(tracker.sender_id, snapshot, self.domain)
+            self._evict(keep=tracker.sender_id)
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """
@@ -245,16 +501,150 @@ class InMemoryTrackerStore(TrackerStore):
         Returns:
             DialogueStateTracker
         """
-        if sender_id in self.store:
+        with self._lock:
+            self._evict()
+            if sender_id not in self.store:
+                self._load_spilled(sender_id)
+
+            if sender_id not in self.store:
+                logger.debug(f"Creating a new tracker for id '{sender_id}'.")
+                return None
+
             logger.debug(f"Recreating tracker for id '{sender_id}'")
-            return self.deserialise_tracker(sender_id, self.store[sender_id])
-        else:
-            logger.debug(f"Creating a new tracker for id '{sender_id}'.")
-            return None
+            self.store.move_to_end(sender_id)
+            self._last_access[sender_id] = time.time()
+            tracker, domain = self.store[sender_id]
+
+        if domain is not self.domain:
+            # the slots of the domain might have changed
+            return self.deserialise_tracker(sender_id, self.serialise_tracker(tracker))
+
+        return tracker.snapshot()
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Tracker Store in memory"""
-        return self.store.keys()
+        with self._lock:
+            keys = list(self.store.keys())
+            if self._spill:
+                keys += [
+                    sender_id
+                    for (sender_id,) in self._spill.execute(
+                        "SELECT sender_id FROM trackers"
+                    )
+                    if sender_id not in self.store
+                ]
+
+        return keys
+
+    def _add(
+        self, sender_id: Text, tracker: DialogueStateTracker, domain: Domain
+    ) -> None:
+        self.store[sender_id] = (tracker, domain)
+        self.number_of_events += len(tracker.events)
+        self._last_access[sender_id] = time.time()
+
+    def _remove(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        stored = self.store.pop(sender_id, None)
+        if stored is None:
+            return None
+
+        self.number_of_events -= len(stored[0].events)
+        del self._last_access[sender_id]
+        return stored[0]
+
+    def _is_full(self) -> bool:
+        return (
+            self.max_conversations is not None
+            and len(self.store) > self.max_conversations
+        ) or (self.max_events is not None and self.number_of_events > self.max_events)
+
+    def _is_expired(self, sender_id: Text) -> bool:
+        return (
+            self.conversation_ttl is not None
+            and time.time() - self._last_access[sender_id] > self.conversation_ttl
+        )
+
+    def _evict(self, keep: Optional[Text] = None) -> None:
+        """Evicts the least recently used conversations until the limits are kept.
+
+        Args:
+            keep: Conversation which is never evicted.
+        """
+        for sender_id in list(self.store.keys()):
+            if sender_id == keep:
+                continue
+            if not self._is_full() and not self._is_expired(sender_id):
+                # all following conversations were used more recently
+                break
+
+            tracker = self._remove(sender_id)
+            if self._spill:
+                self._spill.execute(
+                    "INSERT OR REPLACE INTO trackers VALUES (?, ?)",
+                    (sender_id, self.serialise_tracker(tracker)),
+                )
+                self._spill.commit()
+            logger.debug(f"Evicted tracker for id '{sender_id}' from memory.")
+
+    def _load_spilled(self, sender_id: Text) -> None:
+        if not self._spill:
+            return
+
+        spilled = self._spill.execute(
+            "SELECT tracker FROM trackers WHERE sender_id = ?", (sender_id,)
+        ).fetchone()
+        if spilled:
+            tracker = self.deserialise_tracker(sender_id, spilled[0])
+            self._spill.execute(
+                "DELETE FROM trackers WHERE sender_id = ?", (sender_id,)
+            )
+            self._spill.commit()
+            self._add(sender_id, tracker, self.domain)
+            self._evict(keep=sender_id)
+
+
+def _compressor(compression: Text) -> Callable[[bytes], bytes]:
+    """Returns the function which compresses data with `compression`."""
+    if compression == COMPRESSION_ZLIB:
+        import zlib
+
+        return zlib.compress
+    if compression == COMPRESSION_ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress
+    if compression == COMPRESSION_LZ4:
+        import lz4.frame
+
+        return lz4.frame.compress
+
+    raise ValueError(
+        f"Unknown compression '{compression}'. Use one of "
+        f"'{COMPRESSION_ZLIB}', '{COMPRESSION_ZSTD}' or '{COMPRESSION_LZ4}'."
+    )
+
+
+def _decompress(data: bytes) -> bytes:
+    """Decompresses `data` if it was compressed by any of the supported algorithms.
+
+    The algorithm is detected by the magic number at the start of `data`, so
+    that uncompressed trackers and trackers which were compressed with a different
+    configuration can still be read.
+    """
+    if data.startswith(ZLIB_MAGIC_NUMBER):
+        import zlib
+
+        return zlib.decompress(data)
+    if data.startswith(ZSTD_MAGIC_NUMBER):
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    if data.startswith(LZ4_MAGIC_NUMBER):
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+
+    return data
 
 
 class RedisTrackerStore(TrackerStore):
@@ -270,13 +660,37 @@ class RedisTrackerStore(TrackerStore):
         event_broker: Optional[EventBroker] = None,
         record_exp: Optional[float] = None,
         use_ssl: bool = False,
+        compression: Optional[Text] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD_IN_BYTES,
     ):
+        """Create a tracker store which stores the trackers in Redis.
+
+        Args:
+            domain: The domain which is used to restore the trackers.
+            host: The host of the Redis server.
+            port: The port of the Redis server.
+            db: The number of the Redis database.
+            password: The password which is used for authentication.
+            event_broker: An event broker used to publish events.
+            record_exp: Time in seconds after which trackers expire.
+            use_ssl: `True` if SSL should be used for the connection to Redis.
+            compression: The algorithm which is used to compress the stored
+                trackers (`zlib`, `zstd` or `lz4`). `None` stores them uncompressed.
+                `zstd` and `lz4` require the `zstandard` and `lz4` packages.
+            compression_threshold: Size in bytes from which serialised trackers are
+                compressed.
+        """
         import redis
 
         self.red = redis.StrictRedis(
             host=host, port=port, db=db, password=password, ssl=use_ssl
         )
         self.record_exp = record_exp
+        if compression:
+            # fail early if the compression is unknown or its package is missing
+            _compressor(compression)
+        self.compression = compression
+        self.compression_threshold = compression_threshold
         super().__init__(domain, event_broker)
 
     def save(self, tracker, timeout=None):
@@ -288,7 +702,15 @@ class RedisTrackerStore(TrackerStore):
             timeout = self.record_exp
 
         serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(tracker.sender_id, serialised_tracker, ex=timeout)
+        self.red.set(tracker.sender_id, self._encode(serialised_tracker), ex=timeout)
+
+    def _encode(self, serialised_tracker: Text) -> bytes:
+        encoded = serialised_tracker.encode(rasa.shared.utils.io.DEFAULT_ENCODING)
+        if self.compression and len(encoded) >= self.compression_threshold:
+            # compressors are created for every tracker as they aren't thread-safe
+            return _compressor(self.compression)(encoded)
+
+        return encoded
 
     def retrieve(self, sender_id):
         """
@@ -300,17 +722,47 @@ class RedisTrackerStore(TrackerStore):
         """
         stored = self.red.get(sender_id)
         if stored is not None:
-            return self.deserialise_tracker(sender_id, stored)
+            return self.deserialise_tracker(sender_id, _decompress(stored))
         else:
             return None
 
     def keys(self) -> Iterable[Text]:
-        """Returns keys of the Redis Tracker Store"""
-        return self.red.keys()
+        """Returns keys of the Redis Tracker Store.
+
+        The keys are iterated with `SCAN`, so that Redis isn't blocked.
+        """
+        for key in self.red.scan_iter(count=DEFAULT_PAGE_SIZE):
+            yield key.decode(rasa.shared.utils.io.DEFAULT_ENCODING)
+
+    def retrieve_many(
+        self, sender_ids: Iterable[Text]
+    ) -> Iterator[DialogueStateTracker]:
+        """Retrieves the trackers of several conversations with one `MGET` per page."""
+        for page in _pages(sender_ids, DEFAULT_PAGE_SIZE):
+            for sender_id, stored in zip(page, self.red.mget(page)):
+                if stored is not None:
+                    yield self.deserialise_tracker(sender_id, _decompress(stored))
+
+
+# sort key of the item which stores the number of events and the index of the latest
+# `SessionStarted` event of a conversation in DynamoDB
+DYNAMO_CONVERSATION_SORT_KEY = -1
+
+# maximum number of events stored in a single DynamoDB item (items are limited to
+# 400KB)
+MAX_EVENTS_PER_DYNAMO_ITEM = 20
 
 
 class DynamoTrackerStore(TrackerStore):
-    """Stores conversation history in DynamoDB"""
+    """Stores conversation history in DynamoDB.
+
+    The events of a conversation are stored in chunks which are only written once.
+    The sort key of a chunk is the index of its first event in the conversation. An
+    additional item per conversation with the sort key `-1` stores the number of
+    events and the index of the latest `SessionStarted` event. Conversations which
+    were stored as snapshots of the whole dialogue (with the timestamp of the save
+    as sort key) can still be retrieved and are converted on their next save.
+    """
 
     def __init__(
         self,
@@ -334,9 +786,22 @@ class DynamoTrackerStore(TrackerStore):
         self.client = boto3.client("dynamodb", region_name=region)
         self.region = region
         self.table_name = table_name
-        self.db = self.get_or_create_table(table_name)
+        # boto3 resources aren't thread-safe, but trackers are saved and retrieved
+        # in worker threads, hence every thread uses its own table resource
+        self._thread_local = threading.local()
+        self._thread_local.db = self.get_or_create_table(table_name)
         super().__init__(domain, event_broker)
 
+    @property
+    def db(self) -> "boto3.resources.factory.dynamodb.Table":
+        """Returns the table resource of the current thread."""
+        if not hasattr(self._thread_local, "db"):
+            import boto3
+
+            dynamo = boto3.resource("dynamodb", region_name=self.region)
+            self._thread_local.db = dynamo.Table(self.table_name)
+        return self._thread_local.db
+
     def get_or_create_table(
         self, table_name: Text
     ) -> "boto3.resources.factory.dynamodb.Table":
@@ -365,10 +830,94 @@ class DynamoTrackerStore(TrackerStore):
         return dynamo.Table(table_name)
 
     def save(self, tracker):
-        """Saves the current conversation state"""
+        """Saves the events which aren't stored yet."""
         if self.event_broker:
             self.stream_events(tracker)
-        self.db.put_item(Item=self.serialise_tracker(tracker))
+
+        number_of_events, session_start_index = self._stored_event_offsets(
+            tracker.sender_id
+        ) or (0, 0)
+        offset = number_of_events
+        if not self.load_events_from_previous_conversation_sessions:
+            # retrieved trackers start with the latest stored session
+            offset -= session_start_index
+
+        additional_events = list(
+            itertools.islice(tracker.events, offset, len(tracker.events))
+        )
+
+        with self.db.batch_writer() as batch:
+            for start, chunk in self._chunks(additional_events):
+                if isinstance(chunk[0], SessionStarted):
+                    session_start_index = number_of_events + start
+                batch.put_item(
+                    Item=core_utils.replace_floats_with_decimals(
+                        {
+                            "sender_id": tracker.sender_id,
+                            "session_date": number_of_events + start,
+                            "events": [event.as_dict() for event in chunk],
+                        }
+                    )
+                )
+
+        # the batch writer doesn't guarantee the order of its writes, so the number
+        # of events is updated once all chunks were written. Chunks of failed saves
+        # are overwritten by the next save.
+        self.db.put_item(
+            Item={
+                "sender_id": tracker.sender_id,
+                "session_date": DYNAMO_CONVERSATION_SORT_KEY,
+                "number_of_events": number_of_events + len(additional_events),
+                "session_start_index": session_start_index,
+            }
+        )
+
+    @staticmethod
+    def _chunks(events: List[Event]) -> Iterator[Tuple[int, List[Event]]]:
+        """Splits events into chunks which are stored as separate items.
+
+        Every `SessionStarted` event starts a new chunk, so that the latest session
+        can be queried by the sort key.
+
+        Args:
+            events: The events to store.
+
+        Returns:
+            The index of the first event of each chunk and the chunk.
+        """
+        start = 0
+        for index, event in enumerate(events):
+            if index > start and (
+                isinstance(event, SessionStarted)
+                or index - start == MAX_EVENTS_PER_DYNAMO_ITEM
+            ):
+                yield start, events[start:index]
+                start = index
+
+        if start < len(events):
+            yield start, events[start:]
+
+    def _stored_event_offsets(self, sender_id: Text) -> Optional[Tuple[int, int]]:
+        """Returns the number of stored events and the index of the latest session start.
+
+        Args:
+            sender_id: Conversation ID.
+
+        Returns:
+            The number of stored events and the index of the latest stored
+            `SessionStarted` event or `None` in case the conversation isn't stored in
+            chunks (yet).
+        """
+        conversation = self.db.get_item(
+            Key={"sender_id": sender_id, "session_date": DYNAMO_CONVERSATION_SORT_KEY}
+        ).get("Item")
+        if not conversation:
+            return None
+
+        return (
+            int(conversation["number_of_events"]),
+            int(conversation["session_start_index"]),
+        )
 
     def serialise_tracker(self, tracker: "DialogueStateTracker") -> Dict:
         """Serializes the tracker, returns object with decimal types"""
@@ -384,6 +933,47 @@ class DynamoTrackerStore(TrackerStore):
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Create a tracker from all previously stored events."""
+        offsets = self._stored_event_offsets(sender_id)
+        if offsets:
+            number_of_events, first_event = offsets
+            if self.load_events_from_previous_conversation_sessions:
+                first_event = 0
+            events = self._stored_events(sender_id, first_event, number_of_events)
+        else:
+            events = self._events_from_snapshot(sender_id)
+            if events is None:
+                return None
+
+        # `float`s are stored as `Decimal` objects - we need to convert them back
+        events_with_floats = core_utils.replace_decimals_with_floats(events)
+
+        return DialogueStateTracker.from_dict(
+            sender_id, events_with_floats, self.domain.slots
+        )
+
+    def _stored_events(
+        self, sender_id: Text, first_event: int, number_of_events: int
+    ) -> List[Dict]:
+        """Queries the chunks of events with the sort key range of the events."""
+        if first_event >= number_of_events:
+            return []
+
+        query = {
+            "KeyConditionExpression": Key("sender_id").eq(sender_id)
+            & Key("session_date").between(first_event, number_of_events - 1)
+        }
+        events = []
+        while True:
+            response = self.db.query(**query)
+            for chunk in response["Items"]:
+                events.extend(chunk["events"])
+
+            if "LastEvaluatedKey" not in response:
+                return events
+            query["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def _events_from_snapshot(self, sender_id: Text) -> Optional[List[Dict]]:
+        """Retrieves the events of a conversation which is stored as snapshots."""
         # Retrieve dialogues for a sender_id in reverse-chronological order based on
         # the session_date sort key
         dialogues = self.db.query(
@@ -395,21 +985,31 @@ class DynamoTrackerStore(TrackerStore):
         if not dialogues:
             return None
 
-        events = dialogues[0].get("events", [])
+        return dialogues[0].get("events", [])
 
-        # `float`s are stored as `Decimal` objects - we need to convert them back
-        events_with_floats = core_utils.replace_decimals_with_floats(events)
+    def keys(self) -> Iterable[Text]:
+        """Returns sender_ids of the DynamoTrackerStore.
 
-        return DialogueStateTracker.from_dict(
-            sender_id, events_with_floats, self.domain.slots
-        )
+        The table is scanned page by page.
+        """
+        # every conversation is stored in several items
+        seen = set()
+        scan = {"ProjectionExpression": "sender_id"}
+        while True:
+            response = self.db.scan(**scan)
+            for item in response["Items"]:
+                if item["sender_id"] not in seen:
+                    seen.add(item["sender_id"])
+                    yield item["sender_id"]
 
-    def keys(self) -> Iterable[Text]:
-        """Returns sender_ids of the DynamoTrackerStore"""
-        return [
-            i["sender_id"]
-            for i in self.db.scan(ProjectionExpression="sender_id")["Items"]
-        ]
+            if "LastEvaluatedKey" not in response:
+                return
+            scan["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+# field of a conversation document in Mongo which stores the index of the latest
+# `SessionStarted` event in the `events` array of the document
+MONGO_SESSION_START_INDEX_KEY = "session_start_index"
 
 
 class MongoTrackerStore(TrackerStore):
@@ -472,12 +1072,23 @@ class MongoTrackerStore(TrackerStore):
         if self.event_broker:
             self.stream_events(tracker)
 
-        additional_events = self._additional_events(tracker)
+        number_of_events, session_start_index = self._stored_event_offsets(
+            tracker.sender_id
+        )
+        additional_events = list(
+            self._events_after(tracker, number_of_events - session_start_index)
+        )
+        for index, event in enumerate(additional_events):
+            if isinstance(event, SessionStarted):
+                session_start_index = number_of_events + index
+
+        state = self._current_tracker_state_without_events(tracker)
+        state[MONGO_SESSION_START_INDEX_KEY] = session_start_index
 
         self.conversations.update_one(
             {"sender_id": tracker.sender_id},
             {
-                "$set": self._current_tracker_state_without_events(tracker),
+                "$set": state,
                 "$push": {
                     "events": {"$each": [e.as_dict() for e in additional_events]}
                 },
@@ -485,6 +1096,66 @@ class MongoTrackerStore(TrackerStore):
             upsert=True,
         )
 
+    def _stored_event_counts(self, sender_id: Text) -> Tuple[int, Optional[int]]:
+        """Counts the stored events of a conversation on the database server.
+
+        Args:
+            sender_id: Conversation ID.
+
+        Returns:
+            The number of stored events and the stored index of the latest
+            `SessionStarted` event. The index is `None` for documents which were
+            saved without it.
+        """
+        counts = list(
+            self.conversations.aggregate(
+                [
+                    {"$match": {"sender_id": sender_id}},
+                    {
+                        "$project": {
+                            "_id": 0,
+                            "number_of_events": {"$size": {"$ifNull": ["$events", []]}},
+                            MONGO_SESSION_START_INDEX_KEY: 1,
+                        }
+                    },
+                ]
+            )
+        )
+        if not counts:
+            return 0, 0
+
+        return (
+            counts[0]["number_of_events"],
+            counts[0].get(MONGO_SESSION_START_INDEX_KEY),
+        )
+
+    def _stored_event_offsets(self, sender_id: Text) -> Tuple[int, int]:
+        """Returns the number of stored events and the index of the latest session start.
+
+        Args:
+            sender_id: Conversation ID.
+
+        Returns:
+            The number of stored events and the index of the latest stored
+            `SessionStarted` event (`0` if there is none).
+        """
+        number_of_events, session_start_index = self._stored_event_counts(sender_id)
+        if session_start_index is not None:
+            return number_of_events, session_start_index
+
+        # the document was saved without the index, so the events have to be fetched
+        stored = self.conversations.find_one({"sender_id": sender_id}) or {}
+        all_events = self._events_from_serialized_tracker(stored)
+        number_of_events_since_last_session = len(
+            self._events_since_last_session_start(all_events)
+        )
+
+        return len(all_events), len(all_events) - number_of_events_since_last_session
+
+    @staticmethod
+    def _events_after(tracker: DialogueStateTracker, offset: int) -> Iterator:
+        return itertools.islice(tracker.events, offset, len(tracker.events))
+
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
 
@@ -495,15 +1166,35 @@ class MongoTrackerStore(TrackerStore):
             List of serialised events that aren't currently stored.
 
         """
-
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
+        number_of_events, session_start_index = self._stored_event_offsets(
+            tracker.sender_id
         )
 
-        return itertools.islice(
-            tracker.events, number_events_since_last_session, len(tracker.events)
+        return self._events_after(tracker, number_of_events - session_start_index)
+
+    def _find_conversation(self, sender_id: Text) -> Optional[Dict]:
+        """Fetches the conversation document of `sender_id`.
+
+        Unless events from previous conversation sessions should be retrieved, the
+        events before the latest session start are left out on the database server.
+        """
+        if self.load_events_from_previous_conversation_sessions:
+            return self.conversations.find_one({"sender_id": sender_id})
+
+        number_of_events, session_start_index = self._stored_event_counts(sender_id)
+        if session_start_index is None:
+            return self.conversations.find_one({"sender_id": sender_id})
+
+        return self.conversations.find_one(
+            {"sender_id": sender_id},
+            {
+                "events": {
+                    "$slice": [
+                        session_start_index,
+                        max(number_of_events - session_start_index, 1),
+                    ]
+                }
+            },
         )
 
     @staticmethod
@@ -539,7 +1230,7 @@ class MongoTrackerStore(TrackerStore):
         Returns:
             `DialogueStateTracker`
         """
-        stored = self.conversations.find_one({"sender_id": sender_id})
+        stored = self._find_conversation(sender_id)
 
         # look for conversations which have used an `int` sender_id in the past
         # and update them.
@@ -555,15 +1246,55 @@ class MongoTrackerStore(TrackerStore):
         if not stored:
             return
 
+        return self._tracker_from_document(sender_id, stored)
+
+    def _tracker_from_document(
+        self, sender_id: Text, stored: Dict
+    ) -> DialogueStateTracker:
         events = self._events_from_serialized_tracker(stored)
         if not self.load_events_from_previous_conversation_sessions:
             events = self._events_since_last_session_start(events)
 
         return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
 
+    def retrieve_many(
+        self, sender_ids: Iterable[Text]
+    ) -> Iterator[DialogueStateTracker]:
+        """Retrieves the trackers of several conversations with one query per page."""
+        for page in _pages(sender_ids, DEFAULT_PAGE_SIZE):
+            stored_conversations = {
+                stored["sender_id"]: stored
+                for stored in self.conversations.find({"sender_id": {"$in": page}})
+            }
+            for sender_id in page:
+                stored = stored_conversations.get(sender_id)
+                if stored:
+                    yield self._tracker_from_document(sender_id, stored)
+                elif sender_id.isdigit():
+                    # conversations with an `int` sender_id are updated on retrieval
+                    tracker = self.retrieve(sender_id)
+                    if tracker:
+                        yield tracker
+
     def keys(self) -> Iterable[Text]:
-        """Returns sender_ids of the Mongo Tracker Store"""
-        return [c["sender_id"] for c in self.conversations.find()]
+        """Returns sender_ids of the Mongo Tracker Store.
+
+        Only the sender IDs are fetched, page by page.
+        """
+        cursor = self.conversations.find(
+            {}, {"sender_id": True, "_id": False}, batch_size=DEFAULT_PAGE_SIZE
+        )
+        return (c["sender_id"] for c in cursor)
+
+
+def _pages(items: Iterable[Any], page_size: int) -> Iterator[List[Any]]:
+    """Splits `items` into lists of at most `page_size` items."""
+    iterator = iter(items)
+    while True:
+        page = list(itertools.islice(iterator, page_size))
+        if not page:
+            return
+        yield page
 
 
 def _create_sequence(table_name: Text) -> "Sequence":
@@ -599,20 +1330,60 @@ def is_postgresql_url(url: Union[Text, "URL"]) -> bool:
     return url.drivername == "postgresql"
 
 
-def create_engine_kwargs(url: Union[Text, "URL"]) -> Dict[Text, Union[Text, int]]:
+def is_sqlite_url(url: Union[Text, "URL"]) -> bool:
+    """Determine whether `url` configures a SQLite connection.
+
+    Args:
+        url: SQL connection URL.
+
+    Returns:
+        `True` if `url` is a SQLite connection URL.
+    """
+    if isinstance(url, str):
+        return url.startswith("sqlite")
+
+    return url.drivername.startswith("sqlite")
+
+
+def create_engine_kwargs(
+    url: Union[Text, "URL"],
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    pool_pre_ping: bool = False,
+    pool_recycle: Optional[int] = None,
+) -> Dict[Text, Union[Text, int]]:
     """Get `sqlalchemy.create_engine()` kwargs.
 
     Args:
         url: SQL connection URL.
+        pool_size: Number of connections which are kept in the connection pool.
+            Defaults to the `SQL_POOL_SIZE` environment variable for PostgreSQL.
+            Not available for SQLite.
+        max_overflow: Number of connections which can be opened in addition to the
+            `pool_size`. Defaults to the `SQL_MAX_OVERFLOW` environment variable
+            for PostgreSQL. Not available for SQLite.
+        pool_pre_ping: Whether to test connections for liveness when they are
+            taken from the pool.
+        pool_recycle: Number of seconds after which connections are replaced.
 
     Returns:
         kwargs to be passed into `sqlalchemy.create_engine()`.
     """
-    if not is_postgresql_url(url):
-        return {}
-
     kwargs = {}
 
+    if pool_pre_ping:
+        kwargs["pool_pre_ping"] = True
+    if pool_recycle is not None:
+        kwargs["pool_recycle"] = pool_recycle
+
+    if not is_postgresql_url(url):
+        if not is_sqlite_url(url):
+            if pool_size is not None:
+                kwargs["pool_size"] = pool_size
+            if max_overflow is not None:
+                kwargs["max_overflow"] = max_overflow
+        return kwargs
+
     schema_name = os.environ.get(POSTGRESQL_SCHEMA)
 
     if schema_name:
@@ -623,12 +1394,16 @@ def create_engine_kwargs(url: Union[Text, "URL"]) -> Dict[Text, Union[Text, int]
     # connections that are kept in the connection pool. Not available
     # for SQLite, and only  tested for PostgreSQL. See
     # https://docs.sqlalchemy.org/en/13/core/pooling.html#sqlalchemy.pool.QueuePool
-    kwargs["pool_size"] = int(
-        os.environ.get(POSTGRESQL_POOL_SIZE, POSTGRESQL_DEFAULT_POOL_SIZE)
-    )
-    kwargs["max_overflow"] = int(
-        os.environ.get(POSTGRESQL_MAX_OVERFLOW, POSTGRESQL_DEFAULT_MAX_OVERFLOW)
-    )
+    if pool_size is None:
+        pool_size = int(
+            os.environ.get(POSTGRESQL_POOL_SIZE, POSTGRESQL_DEFAULT_POOL_SIZE)
+        )
+    if max_overflow is None:
+        max_overflow = int(
+            os.environ.get(POSTGRESQL_MAX_OVERFLOW, POSTGRESQL_DEFAULT_MAX_OVERFLOW)
+        )
+    kwargs["pool_size"] = pool_size
+    kwargs["max_overflow"] = max_overflow
 
     return kwargs
 
@@ -693,16 +1468,56 @@ class SQLTrackerStore(TrackerStore):
         event_broker: Optional[EventBroker] = None,
         login_db: Optional[Text] = None,
         query: Optional[Dict] = None,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_pre_ping: bool = False,
+        pool_recycle: Optional[int] = None,
+        read_replicas: Optional[List[Text]] = None,
     ) -> None:
+        """Create a `SQLTrackerStore`.
+
+        Args:
+            domain: The `Domain` to initialize the `DialogueStateTracker`.
+            dialect: SQL database type.
+            host: Database network host.
+            port: Database network port.
+            db: Database name.
+            username: User name to use when connecting to the database.
+            password: Password for database user.
+            event_broker: An event broker to publish any new events to another
+                destination.
+            login_db: Alternative database name to which initially connect, and
+                create the database specified by `db` (PostgreSQL only).
+            query: Dictionary of options to be passed to the dialect and/or the
+                DBAPI upon connect.
+            pool_size: Number of connections which are kept in the connection pool.
+            max_overflow: Number of connections which can be opened in addition to
+                the `pool_size`.
+            pool_pre_ping: Whether to test connections for liveness when they are
+                taken from the pool.
+            pool_recycle: Number of seconds after which connections are replaced.
+            read_replicas: Hosts (or complete URLs) of read replicas of the
+                database. They are only used to list the conversations and to
+                retrieve several trackers at once, e.g. for `rasa export`. Single
+                trackers are always retrieved from the primary database, since a
+                tracker which is saved again must not miss any events.
+        """
         import sqlalchemy.exc
+        from sqlalchemy.ext import baked
 
         engine_url = self.get_db_url(
             dialect, host, port, db, username, password, login_db, query
         )
 
-        self.engine = sa.engine.create_engine(
-            engine_url, **create_engine_kwargs(engine_url)
+        pool_kwargs = dict(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
         )
+        self._engine_kwargs = create_engine_kwargs(engine_url, **pool_kwargs)
+        self.engine = sa.engine.create_engine(engine_url, **self._engine_kwargs)
+        self._bakery = baked.bakery()
 
         logger.debug(
             f"Attempting to connect to database via '{repr(self.engine.url)}'."
@@ -739,6 +1554,19 @@ class SQLTrackerStore(TrackerStore):
 
         logger.debug(f"Connection to SQL database '{db}' successful.")
 
+        self._replica_sessionmakers = []
+        for replica in read_replicas or []:
+            replica_url = self.get_db_url(
+                dialect, replica, port, db, username, password, query=query
+            )
+            replica_engine = sa.engine.create_engine(
+                replica_url, **create_engine_kwargs(replica_url, **pool_kwargs)
+            )
+            self._replica_sessionmakers.append(
+                sa.orm.session.sessionmaker(bind=replica_engine)
+            )
+        self._replicas = itertools.cycle(self._replica_sessionmakers)
+
         super().__init__(domain, event_broker)
 
     @staticmethod
@@ -802,7 +1630,7 @@ class SQLTrackerStore(TrackerStore):
 
         self._create_database(self.engine, db)
         engine_url.database = db
-        self.engine = create_engine(engine_url)
+        self.engine = create_engine(engine_url, **self._engine_kwargs)
 
     @staticmethod
     def _create_database(engine: "Engine", db: Text):
@@ -828,7 +1656,26 @@ class SQLTrackerStore(TrackerStore):
     @contextlib.contextmanager
     def session_scope(self):
         """Provide a transactional scope around a series of operations."""
-        session = self.sessionmaker()
+        with self._session_scope(self.sessionmaker) as session:
+            yield session
+
+    @contextlib.contextmanager
+    def _read_session_scope(self):
+        """Provide a read-only scope which uses a read replica if there is one.
+
+        Replicas might lag behind the primary database, so this must not be used
+        to retrieve trackers which are saved again afterwards.
+        """
+        sessionmaker = self.sessionmaker
+        if self._replica_sessionmakers:
+            sessionmaker = next(self._replicas)
+
+        with self._session_scope(sessionmaker) as session:
+            yield session
+
+    @contextlib.contextmanager
+    def _session_scope(self, sessionmaker: "sessionmaker"):
+        session = sessionmaker()
         try:
             ensure_schema_exists(session)
             yield session
@@ -843,10 +1690,20 @@ class SQLTrackerStore(TrackerStore):
             session.close()
 
     def keys(self) -> Iterable[Text]:
-        """Returns sender_ids of the SQLTrackerStore"""
-        with self.session_scope() as session:
-            sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
-            return [sender_id for (sender_id,) in sender_ids]
+        """Returns sender_ids of the SQLTrackerStore.
+
+        The sender IDs are streamed from the database using a server-side cursor
+        if the database driver supports it. They are read from a read replica if
+        there is one.
+        """
+        with self._read_session_scope() as session:
+            sender_ids = (
+                session.query(self.SQLEvent.sender_id)
+                .distinct()
+                .yield_per(DEFAULT_PAGE_SIZE)
+            )
+            for (sender_id,) in sender_ids:
+                yield sender_id
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Create a tracker from all previously stored events."""
@@ -857,22 +1714,72 @@ class SQLTrackerStore(TrackerStore):
 
             events = [json.loads(event.data) for event in serialised_events]
 
-            if self.domain and len(events) > 0:
-                logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
-                    sender_id, events, self.domain.slots
-                )
-            else:
-                logger.debug(
-                    f"Can't retrieve tracker matching "
-                    f"sender id '{sender_id}' from SQL storage. "
-                    f"Returning `None` instead."
+            return self._tracker_from_events(sender_id, events)
+
+    def _tracker_from_events(
+        self, sender_id: Text, events: List[Dict[Text, Any]]
+    ) -> Optional[DialogueStateTracker]:
+        if self.domain and len(events) > 0:
+            logger.debug(f"Recreating tracker from sender id '{sender_id}'")
+            return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        else:
+            logger.debug(
+                f"Can't retrieve tracker matching "
+                f"sender id '{sender_id}' from SQL storage. "
+                f"Returning `None` instead."
+            )
+            return None
+
+    def retrieve_many(
+        self, sender_ids: Iterable[Text]
+    ) -> Iterator[DialogueStateTracker]:
+        """Retrieves the trackers of several conversations with one query per page.
+
+        The events of each page are streamed from the database using a server-side
+        cursor if the database driver supports it. The trackers are read from a
+        read replica if there is one.
+        """
+        for page in _pages(sender_ids, DEFAULT_PAGE_SIZE):
+            with self._read_session_scope() as session:
+                serialised_events = (
+                    session.query(self.SQLEvent.sender_id, self.SQLEvent.data)
+                    .filter(self.SQLEvent.sender_id.in_(page))
+                    .order_by(self.SQLEvent.sender_id, self.SQLEvent.timestamp)
+                    .yield_per(DEFAULT_PAGE_SIZE)
                 )
-                return None
+                for sender_id, rows in itertools.groupby(
+                    serialised_events, key=lambda row: row.sender_id
+                ):
+                    events = [json.loads(row.data) for row in rows]
+                    if not self.load_events_from_previous_conversation_sessions:
+                        events = self._events_of_latest_session(events)
+
+                    tracker = self._tracker_from_events(sender_id, events)
+                    if tracker:
+                        yield tracker
 
-    def _event_query(self, session: "Session", sender_id: Text) -> "Query":
+    @staticmethod
+    def _events_of_latest_session(
+        events: List[Dict[Text, Any]]
+    ) -> List[Dict[Text, Any]]:
+        """Filters events like `_event_query` does on the database server."""
+        session_starts = [
+            event["timestamp"]
+            for event in events
+            if event["event"] == SessionStarted.type_name
+        ]
+        if not session_starts:
+            return events
+
+        latest_session_start = max(session_starts)
+        return [event for event in events if event["timestamp"] >= latest_session_start]
+
+    def _event_query(self, session: "Session", sender_id: Text) -> "Result":
         """Provide the query to retrieve the conversation events for a specific sender.
 
+        The query is baked, i.e. it's only constructed and compiled to SQL once and
+        then reused with different parameters.
+
         Args:
             session: Current database session.
             sender_id: Sender id whose conversation events should be retrieved.
@@ -880,63 +1787,81 @@ class SQLTrackerStore(TrackerStore):
         Returns:
             Query to get the conversation events.
         """
-        # Subquery to find the timestamp of the latest `SessionStarted` event
-        session_start_sub_query = (
-            session.query(sa.func.max(self.SQLEvent.timestamp).label("session_start"))
-            .filter(
-                self.SQLEvent.sender_id == sender_id,
-                self.SQLEvent.type_name == SessionStarted.type_name,
-            )
-            .subquery()
+        event_query = self._bakery(lambda s: s.query(self.SQLEvent))
+        event_query += lambda q: q.filter(
+            self.SQLEvent.sender_id == sa.bindparam("sender_id")
         )
 
-        event_query = session.query(self.SQLEvent).filter(
-            self.SQLEvent.sender_id == sender_id
-        )
         if not self.load_events_from_previous_conversation_sessions:
-            event_query = event_query.filter(
-                # Find events after the latest `SessionStarted` event or return all
-                # events
-                sa.or_(
-                    self.SQLEvent.timestamp >= session_start_sub_query.c.session_start,
-                    session_start_sub_query.c.session_start.is_(None),
+            event_query += self._filter_events_of_latest_session
+
+        event_query += lambda q: q.order_by(self.SQLEvent.timestamp)
+
+        return event_query(session).params(sender_id=sender_id)
+
+    def _filter_events_of_latest_session(self, event_query: "Query") -> "Query":
+        # Subquery to find the timestamp of the latest `SessionStarted` event
+        session_start_event = sa.orm.aliased(self.SQLEvent)
+        session_start = (
+            sa.select([sa.func.max(session_start_event.timestamp)])
+            .where(
+                sa.and_(
+                    session_start_event.sender_id == sa.bindparam("sender_id"),
+                    session_start_event.type_name == SessionStarted.type_name,
                 )
             )
+            .as_scalar()
+        )
 
-        return event_query.order_by(self.SQLEvent.timestamp)
+        # Find events after the latest `SessionStarted` event or return all events
+        return event_query.filter(
+            sa.or_(self.SQLEvent.timestamp >= session_start, session_start.is_(None))
+        )
 
     def save(self, tracker: DialogueStateTracker) -> None:
         """Update database with events from the current conversation."""
 
+        self.save_many([tracker])
+
+    def save_many(self, trackers: Iterable[DialogueStateTracker]) -> None:
+        """Stores the new events of several conversations in one transaction."""
+
+        trackers = list(trackers)
         if self.event_broker:
-            self.stream_events(tracker)
+            for tracker in trackers:
+                self.stream_events(tracker)
 
         with self.session_scope() as session:
-            # only store recent events
-            events = self._additional_events(session, tracker)
-
-            for event in events:
-                data = event.as_dict()
-                intent = (
-                    data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
-                )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
-                )
+            for tracker in trackers:
+                self._add_events(session, tracker)
             session.commit()
 
-        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+        for tracker in trackers:
+            logger.debug(
+                f"Tracker with sender_id '{tracker.sender_id}' stored to database"
+            )
+
+    def _add_events(self, session: "Session", tracker: DialogueStateTracker) -> None:
+        # only store recent events
+        events = self._additional_events(session, tracker)
+
+        for event in events:
+            data = event.as_dict()
+            intent = data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
+            action = data.get("name")
+            timestamp = data.get("timestamp")
+
+            # noinspection PyArgumentList
+            session.add(
+                self.SQLEvent(
+                    sender_id=tracker.sender_id,
+                    type_name=event.type_name,
+                    timestamp=timestamp,
+                    intent_name=intent,
+                    action_name=action,
+                    data=json.dumps(data),
+                )
+            )
 
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
@@ -1015,10 +1940,17 @@ class FailSafeTrackerStore(TrackerStore):
 
     def keys(self) -> Iterable[Text]:
         try:
-            return self._tracker_store.keys()
+            yield from self._tracker_store.keys()
+        except Exception as e:
+            self.on_tracker_store_error(e)
+
+    def retrieve_many(
+        self, sender_ids: Iterable[Text]
+    ) -> Iterator[DialogueStateTracker]:
+        try:
+            yield from self._tracker_store.retrieve_many(sender_ids)
         except Exception as e:
             self.on_tracker_store_error(e)
-            return []
 
     def save(self, tracker: DialogueStateTracker) -> None:
         try:
@@ -1027,6 +1959,208 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             self.fallback_tracker_store.save(tracker)
 
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        try:
+            return await self._tracker_store.retrieve_async(sender_id)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return None
+
+    async def keys_async(self) -> Iterable[Text]:
+        try:
+            return await self._tracker_store.keys_async()
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return []
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        try:
+            await self._tracker_store.save_async(tracker)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            await self.fallback_tracker_store.save_async(tracker)
+
+    async def flush_async(self, sender_id: Optional[Text] = None) -> None:
+        try:
+            await self._tracker_store.flush_async(sender_id)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+
+
+class WriteBehindTrackerStore(TrackerStore):
+    """Wraps a tracker store so that saves are deferred and coalesced.
+
+    Saved trackers are kept in memory as snapshots until they are flushed to the
+    wrapped tracker store. Repeated saves of a conversation before a flush only
+    result in a single write. Events are published to the event broker of the
+    wrapped tracker store when they are flushed.
+
+    Without a `flush_interval` the tracker of a conversation is flushed when its
+    lock is released, i.e. once per handled message. With a `flush_interval` all
+    pending trackers are flushed together once the interval passed. Saves which
+    weren't flushed yet are lost if the process terminates unexpectedly, and other
+    Rasa instances only see them after they were flushed.
+    """
+
+    def __init__(
+        self,
+        tracker_store: TrackerStore,
+        flush_interval: Optional[float] = None,
+        max_pending_trackers: int = 100,
+    ) -> None:
+        """Create a `WriteBehindTrackerStore`.
+
+        Args:
+            tracker_store: Tracker store which persists the trackers.
+            flush_interval: Seconds after which pending trackers are flushed
+                together. If `None`, a tracker is flushed when the lock of its
+                conversation is released.
+            max_pending_trackers: Number of pending trackers which triggers a flush
+                regardless of the `flush_interval`.
+        """
+        self._tracker_store = tracker_store
+        self.flush_interval = flush_interval
+        self.max_pending_trackers = max_pending_trackers
+        self._pending: "OrderedDict[Text, DialogueStateTracker]" = OrderedDict()
+        # trackers which are currently being flushed, they are retrieved from here
+        # until the wrapped tracker store committed them
+        self._in_flight: Dict[Text, DialogueStateTracker] = {}
+        self._lock = threading.Lock()
+        self._scheduled_flush: Optional[asyncio.Future] = None
+
+        super().__init__(tracker_store.domain, tracker_store.event_broker)
+
+    @property
+    def domain(self) -> Optional[Domain]:
+        return self._tracker_store.domain
+
+    @domain.setter
+    def domain(self, domain: Optional[Domain]) -> None:
+        self._tracker_store.domain = domain
+
+    def save(self, tracker: DialogueStateTracker) -> None:
+        """Defers saving the tracker until the next flush."""
+        if self._defer(tracker):
+            self.flush()
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        """Defers saving the tracker until the next flush."""
+        if self._defer(tracker):
+            await self._run_in_thread(self.flush)
+        elif self.flush_interval is not None and self._scheduled_flush is None:
+            self._scheduled_flush = asyncio.ensure_future(self._flush_after_interval())
+
+    def _defer(self, tracker: DialogueStateTracker) -> bool:
+        snapshot = tracker.snapshot()
+        with self._lock:
+            pending = self._pending.pop(tracker.sender_id, None)
+            if pending is not None:
+                # the events since the earlier save still have to be published
+                snapshot.number_of_persisted_events = pending.number_of_persisted_events
+            self._pending[tracker.sender_id] = snapshot
+
+            return len(self._pending) >= self.max_pending_trackers
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._scheduled_flush = None
+        try:
+            await self._run_in_thread(self.flush)
+        except Exception as e:
+            logger.error(f"Failed to flush pending trackers: {e}")
+
+    def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        with self._lock:
+            pending = self._pending.get(sender_id)
+            if pending is None:
+                pending = self._in_flight.get(sender_id)
+        if pending is not None:
+            return pending.snapshot()
+
+        return self._tracker_store.retrieve(sender_id)
+
+    def keys(self) -> Iterable[Text]:
+        with self._lock:
+            pending = list(self._pending.keys())
+            pending += [key for key in self._in_flight if key not in self._pending]
+
+        yield from pending
+        pending = set(pending)
+        for sender_id in self._tracker_store.keys():
+            if sender_id not in pending:
+                yield sender_id
+
+    def flush(self, sender_id: Optional[Text] = None) -> None:
+        """Saves pending trackers to the wrapped tracker store.
+
+        Trackers are retrieved from memory until the wrapped tracker store saved
+        them. Trackers which couldn't be saved stay pending unless they were saved
+        again in the meantime.
+
+        Args:
+            sender_id: Only flush the tracker of this conversation. If `None`, all
+                pending trackers are flushed.
+        """
+        with self._lock:
+            if sender_id is None:
+                trackers = list(self._pending.values())
+                self._pending.clear()
+            elif sender_id in self._pending:
+                trackers = [self._pending.pop(sender_id)]
+            else:
+                trackers = []
+
+            for tracker in trackers:
+                self._in_flight[tracker.sender_id] = tracker
+
+        if not trackers:
+            return
+
+        try:
+            self._tracker_store.save_many(trackers)
+        except Exception:
+            with self._lock:
+                for tracker in trackers:
+                    pending = self._pending.setdefault(tracker.sender_id, tracker)
+                    if pending is not tracker:
+                        # the newer tracker was retrieved while this one was in
+                        # flight, but the events of this one might not be published
+                        pending.number_of_persisted_events = _min_persisted_events(
+                            pending, tracker
+                        )
+                self._remove_in_flight(trackers)
+            raise
+
+        with self._lock:
+            self._remove_in_flight(trackers)
+
+        logger.debug(f"Flushed {len(trackers)} pending tracker(s).")
+
+    def _remove_in_flight(self, trackers: List[DialogueStateTracker]) -> None:
+        for tracker in trackers:
+            # a later flush of the same conversation might be in flight already
+            if self._in_flight.get(tracker.sender_id) is tracker:
+                del self._in_flight[tracker.sender_id]
+
+    async def flush_async(self, sender_id: Optional[Text] = None) -> None:
+        """Flushes pending trackers without blocking the event loop.
+
+        If a `flush_interval` is set, releasing a conversation lock doesn't flush
+        its tracker right away.
+        """
+        if sender_id is not None and self.flush_interval is not None:
+            return
+
+        await self._run_in_thread(self.flush, sender_id)
+
+
+def _min_persisted_events(*trackers: DialogueStateTracker) -> Optional[int]:
+    """Returns the lowest number of persisted events or `None` if any is unknown."""
+    numbers = [tracker.number_of_persisted_events for tracker in trackers]
+    if None in numbers:
+        return None
+    return min(numbers)
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
@@ -1036,10 +2170,20 @@ def _create_from_endpoint_config(
     """Given an endpoint configuration, create a proper tracker store object."""
 
     domain = domain or Domain.empty()
+    write_behind = None
+    if endpoint_config:
+        # the configuration of the caller is used again when another model is loaded
+        endpoint_config = copy.copy(endpoint_config)
+        endpoint_config.kwargs = {**endpoint_config.kwargs}
+        write_behind = endpoint_config.kwargs.pop("write_behind", None)
 
     if endpoint_config is None or endpoint_config.type is None:
         # default tracker store if no type is set
         tracker_store = InMemoryTrackerStore(domain, event_broker)
+    elif endpoint_config.type.lower() == "in_memory":
+        tracker_store = InMemoryTrackerStore(
+            domain=domain, event_broker=event_broker, **endpoint_config.kwargs
+        )
     elif endpoint_config.type.lower() == "redis":
         tracker_store = RedisTrackerStore(
             domain=domain,
@@ -1072,6 +2216,10 @@ def _create_from_endpoint_config(
 
     logger.debug(f"Connected to {tracker_store.__class__.__name__}.")
 
+    if write_behind:
+        write_behind_kwargs = write_behind if isinstance(write_behind, dict) else {}
+        tracker_store = WriteBehindTrackerStore(tracker_store, **write_behind_kwargs)
+
     return tracker_store
 
 
@@ -0,0 +1,169 @@
+import logging
+import os
+import pickle
+import tempfile
+from hashlib import md5
+from typing import Any, Callable, Iterable, List, Optional, Text
+
+import rasa.shared.utils.io
+from rasa.constants import (
+    DEFAULT_TRAINING_DATA_CACHE_DIRECTORY,
+    ENV_TRAINING_DATA_CACHE,
+    ENV_TRAINING_DATA_CACHE_DIRECTORY,
+)
+from rasa.version import __version__
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_SUFFIX = ".pkl"
+
+# Files which reference environment variables are never cached since their parsed
+# content depends on the environment at load time and not only on the file content.
+ENVIRONMENT_VARIABLE_MARKER = b"${"
+
+
+class TrainingDataCache:
+    """Persistent cache for parsed training data (`StoryStep`s, `TrainingData`,
+    `Domain`s).
+
+    Entries are keyed by the content hash of the files they were parsed from (plus
+    any additional inputs which influence the parsing) and stored as pickles, so
+    that unchanged files don't have to be parsed again.
+    """
+
+    def __init__(self, cache_directory: Optional[Text] = None) -> None:
+        self.cache_directory = cache_directory or os.environ.get(
+            ENV_TRAINING_DATA_CACHE_DIRECTORY, DEFAULT_TRAINING_DATA_CACHE_DIRECTORY
+        )
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Checks whether caching was disabled using an environment variable."""
+
+        return os.environ.get(ENV_TRAINING_DATA_CACHE, "true").lower() != "false"
+
+    @staticmethod
+    def fingerprint(files: Iterable[Text], *additional_inputs: Any) -> Optional[Text]:
+        """Calculates a cache key for the given files.
+
+        Args:
+            files: The files which are parsed.
+            additional_inputs: Further inputs which influence the parsing result.
+
+        Returns:
+            The cache key or `None` if the files can't be cached.
+        """
+        key = md5()
+        key.update(__version__.encode())
+        for additional_input in additional_inputs:
+            key.update(repr(additional_input).encode())
+
+        for file in files:
+            try:
+                with open(file, "rb") as f:
+                    content = f.read()
+            except OSError:
+                return None
+
+            if ENVIRONMENT_VARIABLE_MARKER in content:
+                return None
+
+            key.update(file.encode())
+            key.update(md5(content).digest())
+
+        return key.hexdigest()
+
+    def fingerprint_each(
+        self, files: Iterable[Text], *additional_inputs: Any
+    ) -> List[Optional[Text]]:
+        """Calculates a separate cache key for every file.
+
+        Args:
+            files: The files which are parsed individually.
+            additional_inputs: Further inputs which influence the parsing result.
+
+        Returns:
+            The cache key for each file. The key is `None` if the file can't be cached
+            or caching is disabled.
+        """
+        if not self.is_enabled():
+            return [None for _ in files]
+
+        return [self.fingerprint([file], *additional_inputs) for file in files]
+
+    def _path_for_key(self, key: Text) -> Text:
+        return os.path.join(self.cache_directory, key + CACHE_FILE_SUFFIX)
+
+    def load(self, key: Text) -> Optional[Any]:
+        """Loads a cached entry.
+
+        Args:
+            key: The cache key of the entry.
+
+        Returns:
+            The cached object or `None` in case there is no (valid) entry.
+        """
+        path = self._path_for_key(key)
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.debug(f"Failed to load cached training data from '{path}': {e}")
+            return None
+
+    def save(self, key: Text, obj: Any) -> None:
+        """Stores an entry in the cache.
+
+        The entry is written to a temporary file first and then moved to its final
+        location so that concurrent readers never see partially written entries.
+
+        Args:
+            key: The cache key of the entry.
+            obj: The object to cache.
+        """
+        try:
+            rasa.shared.utils.io.create_directory(self.cache_directory)
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=self.cache_directory, suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "wb") as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self._path_for_key(key))
+        except Exception as e:
+            logger.debug(f"Failed to cache training data with key '{key}': {e}")
+
+    def load_or_compute(
+        self,
+        files: Iterable[Text],
+        compute: Callable[[], Any],
+        *additional_inputs: Any,
+    ) -> Any:
+        """Returns the cached result for `files` or computes and caches it.
+
+        Args:
+            files: The files which are parsed by `compute`.
+            compute: Function which parses the files in case of a cache miss.
+            additional_inputs: Further inputs which influence the parsing result.
+
+        Returns:
+            The (cached) parsing result.
+        """
+        if not self.is_enabled():
+            return compute()
+
+        files = list(files)
+        key = self.fingerprint(files, *additional_inputs)
+        if key is None:
+            return compute()
+
+        cached = self.load(key)
+        if cached is not None:
+            logger.debug(f"Loaded parsed training data for {files} from cache.")
+            return cached
+
+        result = compute()
+        self.save(key, result)
+        return result
@@ -63,7 +63,7 @@ class RasaFileImporter(TrainingDataImporter):
         if not self._domain_path:
             return domain
         try:
-            domain = Domain.load(self._domain_path)
+            domain = utils.domain_from_path(self._domain_path)
             domain.check_missing_templates()
         except InvalidDomain as e:
             rasa.shared.utils.io.raise_warning(
@@ -1,5 +1,8 @@
+import os
 from typing import Iterable, Text, Optional, Dict, List
 
+import rasa.shared.utils.io
+from rasa.importers.cache import TrainingDataCache
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.training_data.structures import StoryGraph
 from rasa.shared.nlu.training_data.training_data import TrainingData
@@ -8,7 +11,18 @@ from rasa.shared.nlu.training_data.training_data import TrainingData
 def training_data_from_paths(paths: Iterable[Text], language: Text) -> TrainingData:
     from rasa.shared.nlu.training_data import loading
 
-    training_data_sets = [loading.load_data(nlu_file, language) for nlu_file in paths]
+    paths = list(paths)
+    cache = TrainingDataCache()
+    keys = cache.fingerprint_each(paths, language)
+    training_data_sets = [cache.load(key) if key else None for key in keys]
+
+    missing = [i for i, data in enumerate(training_data_sets) if data is None]
+    loaded = loading.load_files([paths[i] for i in missing], language)
+    for i, training_data in zip(missing, loaded):
+        training_data_sets[i] = training_data or TrainingData()
+        if keys[i]:
+            cache.save(keys[i], training_data_sets[i])
+
     return TrainingData().merge(*training_data_sets)
 
 
@@ -22,7 +36,39 @@ async def story_graph_from_paths(
 
     from rasa.shared.core.training_data import loading
 
-    story_steps = await loading.load_data_from_files(
-        files, domain, template_variables, use_e2e, exclusion_percentage
+    cache = TrainingDataCache()
+    # the story readers validate the stories against the domain, hence the parsed
+    # stories also depend on it
+    domain_hash = hash(domain) if cache.is_enabled() else None
+    keys = cache.fingerprint_each(files, domain_hash, template_variables, use_e2e)
+    steps_per_file = [cache.load(key) if key else None for key in keys]
+
+    missing = [i for i, steps in enumerate(steps_per_file) if steps is None]
+    loaded = await loading.read_story_files(
+        [files[i] for i in missing], domain, template_variables, use_e2e
     )
+    for i, steps in zip(missing, loaded):
+        steps_per_file[i] = steps
+        if keys[i]:
+            cache.save(keys[i], steps)
+
+    story_steps = [step for steps in steps_per_file for step in steps]
+    story_steps = loading.exclude_story_steps(story_steps, exclusion_percentage)
     return StoryGraph(story_steps)
+
+
+def domain_from_path(path: Text) -> Domain:
+    """Loads a domain and caches the parsed result.
+
+    Args:
+        path: Path to a domain file or a directory with domain files.
+
+    Returns:
+        The loaded `Domain`.
+    """
+    if os.path.isdir(path):
+        files = rasa.shared.utils.io.list_files(path)
+    else:
+        files = [path]
+
+    return TrainingDataCache().load_or_compute(files, lambda: Domain.load(path))
@@ -375,6 +375,13 @@ class Component(metaclass=ComponentMetaclass):
     # This is an important feature for backwards compatibility of components.
     not_supported_language_list = None
 
+    # Defines whether the output of `train` can be cached across training runs.
+    # This is only the case if `train` doesn't learn anything from the training
+    # data and only sets attributes / adds features to each training example which
+    # solely depend on the example itself and on the component configuration
+    # (e.g. tokenizers and featurizers using pre-trained models).
+    has_cacheable_training_output = False
+
     def __init__(self, component_config: Optional[Dict[Text, Any]] = None) -> None:
 
         if not component_config:
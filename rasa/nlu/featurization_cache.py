@@ -0,0 +1,258 @@
+import json
+import logging
+import os
+import pickle
+import uuid
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Text, Tuple
+
+import numpy as np
+
+import rasa.shared.utils.io
+from rasa.constants import ENV_NLU_FEATURIZATION_CACHE_DIRECTORY
+from rasa.nlu.components import Component
+from rasa.nlu.config import RasaNLUModelConfig
+from rasa.shared.nlu.training_data.features import Features
+from rasa.shared.nlu.training_data.message import Message
+from rasa.shared.nlu.training_data.training_data import TrainingData
+from rasa.version import __version__
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "index.pkl"
+FEATURES_FILE_SUFFIX = ".bin"
+
+# byte alignment of the dense feature arrays within the memory mapped file
+ALIGNMENT = 64
+
+# (attribute values set by the component, features added by the component)
+CacheEntry = Tuple[Dict[Text, Any], List[Tuple[Text, Text, Any, Any]]]
+
+
+class FeaturizationCache:
+    """Caches the output of tokenizers and featurizers across training runs.
+
+    The cache is content addressed: the output which a component added to a training
+    example is stored under the fingerprint of the pipeline up to (and including) the
+    component and the fingerprint of the example's original attributes. Only
+    components which set `has_cacheable_training_output` can be cached, and only as
+    long as all components before them in the pipeline are cacheable, too.
+
+    Dense features are stored in a single file per component which is memory mapped
+    when the features are loaded again.
+    """
+
+    def __init__(self, cache_directory: Text) -> None:
+        self.cache_directory = cache_directory
+        self._example_fingerprints: Dict[int, Text] = {}
+
+    @classmethod
+    def from_environment(cls) -> Optional["FeaturizationCache"]:
+        """Creates a cache if `RASA_NLU_FEATURIZATION_CACHE_DIRECTORY` is set."""
+
+        cache_directory = os.environ.get(ENV_NLU_FEATURIZATION_CACHE_DIRECTORY)
+        if not cache_directory:
+            return None
+
+        return cls(cache_directory)
+
+    @staticmethod
+    def _fingerprint(obj: Any) -> Text:
+        serialized = json.dumps(obj, sort_keys=True, default=str)
+        return md5(serialized.encode(rasa.shared.utils.io.DEFAULT_ENCODING)).hexdigest()
+
+    def register_examples(self, training_data: TrainingData) -> None:
+        """Fingerprints the training examples before any component modified them.
+
+        Args:
+            training_data: The training data before the training of the pipeline.
+        """
+        self._example_fingerprints = {
+            id(example): self._fingerprint(example.data)
+            for example in training_data.training_examples
+        }
+
+    def _pipeline_fingerprint(self, pipeline: List[Component]) -> Text:
+        return self._fingerprint(
+            [__version__]
+            + [[component.name, component.component_config] for component in pipeline]
+        )
+
+    def train(
+        self,
+        component: Component,
+        previous_components: List[Component],
+        training_data: TrainingData,
+        config: RasaNLUModelConfig,
+        **kwargs: Any,
+    ) -> Optional[Dict[Text, Any]]:
+        """Trains a component unless its output is already cached for all examples.
+
+        Args:
+            component: The component which should be trained. Its
+                `has_cacheable_training_output` has to be set.
+            previous_components: The components before `component` in the pipeline.
+            training_data: The training data.
+            config: The model configuration.
+            **kwargs: The pipeline context.
+
+        Returns:
+            The context updates of the component training.
+        """
+        directory = os.path.join(
+            self.cache_directory,
+            self._pipeline_fingerprint(previous_components + [component]),
+        )
+        cached = self._load(directory)
+
+        entries = {}
+        missing = []
+        for example in training_data.training_examples:
+            fingerprint = self._example_fingerprints.get(id(example))
+            entry = cached.get(fingerprint)
+            if entry is None:
+                missing.append(example)
+            else:
+                self._apply(entry, example)
+                entries[fingerprint] = entry
+
+        if not missing:
+            logger.info(f"Loaded the output of '{component.name}' from the cache.")
+            return None
+
+        logger.debug(
+            f"Output of '{component.name}' is cached for "
+            f"{len(entries)} of {len(training_data.training_examples)} examples."
+        )
+
+        previous_data = [example.data.copy() for example in missing]
+        previous_number_of_features = [len(example.features) for example in missing]
+
+        missing_data = TrainingData(
+            None,
+            training_data.entity_synonyms,
+            training_data.regex_features,
+            training_data.lookup_tables,
+            training_data.responses,
+        )
+        missing_data.training_examples = missing
+        updates = component.train(missing_data, config, **kwargs)
+
+        for example, data, number_of_features in zip(
+            missing, previous_data, previous_number_of_features
+        ):
+            fingerprint = self._example_fingerprints.get(id(example))
+            if fingerprint is not None:
+                entries[fingerprint] = self._entry(example, data, number_of_features)
+
+        self._save(directory, entries)
+
+        return updates
+
+    @staticmethod
+    def _entry(
+        example: Message, previous_data: Dict[Text, Any], previous_features: int
+    ) -> CacheEntry:
+        attributes = {
+            key: value
+            for key, value in example.data.items()
+            if key not in previous_data or previous_data[key] is not value
+        }
+        features = [
+            (f.type, f.attribute, f.origin, f.features)
+            for f in example.features[previous_features:]
+        ]
+        return attributes, features
+
+    @staticmethod
+    def _apply(entry: CacheEntry, example: Message) -> None:
+        attributes, features = entry
+        for key, value in attributes.items():
+            example.set(key, value)
+        for feature_type, attribute, origin, values in features:
+            example.add_features(Features(values, feature_type, attribute, origin))
+
+    @staticmethod
+    def _load(directory: Text) -> Dict[Text, CacheEntry]:
+        index_file = os.path.join(directory, INDEX_FILE_NAME)
+        if not os.path.isfile(index_file):
+            return {}
+
+        try:
+            with open(index_file, "rb") as f:
+                features_file, entries = pickle.load(f)
+
+            dense_values = None
+            features_path = os.path.join(directory, features_file)
+            if os.path.getsize(features_path) > 0:
+                dense_values = np.memmap(features_path, dtype=np.uint8, mode="r")
+        except Exception as e:
+            logger.debug(f"Failed to load cached features from '{directory}': {e}")
+            return {}
+
+        def load_values(values: Any) -> Any:
+            if not isinstance(values, tuple):
+                # sparse features are pickled together with the index
+                return values
+            offset, shape, dtype = values
+            dtype = np.dtype(dtype)
+            size = int(np.prod(shape)) * dtype.itemsize
+            return dense_values[offset : offset + size].view(dtype).reshape(shape)
+
+        return {
+            fingerprint: (
+                attributes,
+                [
+                    (feature_type, attribute, origin, load_values(values))
+                    for feature_type, attribute, origin, values in features
+                ],
+            )
+            for fingerprint, (attributes, features) in entries.items()
+        }
+
+    @staticmethod
+    def _save(directory: Text, entries: Dict[Text, CacheEntry]) -> None:
+        try:
+            rasa.shared.utils.io.create_directory(directory)
+            old_files = [
+                file
+                for file in os.listdir(directory)
+                if file.endswith(FEATURES_FILE_SUFFIX)
+            ]
+
+            features_file = uuid.uuid4().hex + FEATURES_FILE_SUFFIX
+            serialized_entries = {}
+            offset = 0
+            with open(os.path.join(directory, features_file), "wb") as f:
+                for fingerprint, (attributes, features) in entries.items():
+                    serialized_features = []
+                    for feature_type, attribute, origin, values in features:
+                        if isinstance(values, np.ndarray):
+                            values = np.ascontiguousarray(values)
+                            padding = -offset % ALIGNMENT
+                            f.write(b"\0" * padding)
+                            offset += padding
+                            f.write(values.tobytes())
+                            serialized_values = (offset, values.shape, values.dtype.str)
+                            offset += values.nbytes
+                        else:
+                            serialized_values = values
+                        serialized_features.append(
+                            (feature_type, attribute, origin, serialized_values)
+                        )
+                    serialized_entries[fingerprint] = (attributes, serialized_features)
+
+            temporary_index = os.path.join(directory, INDEX_FILE_NAME + ".tmp")
+            with open(temporary_index, "wb") as f:
+                pickle.dump(
+                    (features_file, serialized_entries),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temporary_index, os.path.join(directory, INDEX_FILE_NAME))
+
+            # files which are still memory mapped stay readable until they are closed
+            for file in old_files:
+                os.remove(os.path.join(directory, file))
+        except Exception as e:
+            logger.warning(f"Failed to cache features in '{directory}': {e}")
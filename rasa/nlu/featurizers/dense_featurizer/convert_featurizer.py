@@ -35,6 +35,8 @@ class ConveRTFeaturizer(DenseFeaturizer):
     for dense featurizable attributes of each message object.
     """
 
+    has_cacheable_training_output = True
+
     @classmethod
     def required_components(cls) -> List[Type[Component]]:
         return [ConveRTTokenizer]
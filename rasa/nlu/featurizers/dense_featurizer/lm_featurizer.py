@@ -25,6 +25,8 @@ class LanguageModelFeaturizer(DenseFeaturizer):
     level representations for dense featurizable attributes of each message object.
     """
 
+    has_cacheable_training_output = True
+
     @classmethod
     def required_components(cls) -> List[Type[Component]]:
         return [HFTransformersNLP, LanguageModelTokenizer]
@@ -23,6 +23,9 @@ if typing.TYPE_CHECKING:
 
 
 class MitieFeaturizer(DenseFeaturizer):
+
+    has_cacheable_training_output = True
+
     @classmethod
     def required_components(cls) -> List[Type[Component]]:
         return [MitieNLP, Tokenizer]
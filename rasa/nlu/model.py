@@ -1,4 +1,3 @@
-import copy
 import datetime
 import logging
 import os
@@ -15,6 +14,7 @@ from rasa.nlu.classifiers.classifier import (  # pytype: disable=pyi-error
 from rasa.nlu.components import Component, ComponentBuilder  # pytype: disable=pyi-error
 from rasa.nlu.config import RasaNLUModelConfig, component_config_from_pipeline
 from rasa.nlu.extractors.extractor import EntityExtractor  # pytype: disable=pyi-error
+from rasa.nlu.featurization_cache import FeaturizationCache
 
 from rasa.nlu.constants import PREDICTED_CONFIDENCE_KEY
 
@@ -192,8 +192,14 @@ class Trainer:
                 self.pipeline, self.training_data
             )
 
-        # data gets modified internally during the training - hence the copy
-        working_data: TrainingData = copy.deepcopy(data)
+        # data gets modified internally during the training - hence the copy. The
+        # components only set new attributes and add features to the messages, so
+        # a copy which shares the existing attribute values is sufficient.
+        working_data: TrainingData = data.shallow_copy()
+
+        featurization_cache = FeaturizationCache.from_environment()
+        if featurization_cache:
+            featurization_cache.register_examples(working_data)
 
         for i, component in enumerate(self.pipeline):
             if isinstance(component, (EntityExtractor, IntentClassifier)):
@@ -201,7 +207,17 @@ class Trainer:
 
             logger.info(f"Starting to train component {component.name}")
             component.prepare_partial_processing(self.pipeline[:i], context)
-            updates = component.train(working_data, self.config, **context)
+
+            if featurization_cache and not component.has_cacheable_training_output:
+                # the output of all following components depends on this component
+                featurization_cache = None
+
+            if featurization_cache:
+                updates = featurization_cache.train(
+                    component, self.pipeline[:i], working_data, self.config, **context
+                )
+            else:
+                updates = component.train(working_data, self.config, **context)
             logger.info("Finished training component.")
             if updates:
                 context.update(updates)
@@ -62,6 +62,10 @@ class Token:
 
 
 class Tokenizer(Component):
+
+    # tokenization only depends on the text of each example
+    has_cacheable_training_output = True
+
     def __init__(self, component_config: Dict[Text, Any] = None) -> None:
         """Construct a new tokenizer using the WhitespaceTokenizer framework."""
 
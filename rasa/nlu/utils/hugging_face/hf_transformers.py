@@ -45,6 +45,8 @@ class HFTransformersNLP(Component):
     message.
     """
 
+    has_cacheable_training_output = True
+
     defaults = {
         # name of the language model to load.
         "model_name": "bert",
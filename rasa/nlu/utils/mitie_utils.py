@@ -12,6 +12,9 @@ if typing.TYPE_CHECKING:
 
 class MitieNLP(Component):
 
+    # only provides the MITIE feature extractor and doesn't modify the examples
+    has_cacheable_training_output = True
+
     defaults = {
         # name of the language model to load - this contains
         # the MITIE feature extractor
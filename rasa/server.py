@@ -327,6 +327,12 @@ def _create_emulator(mode: Optional[Text]) -> NoEmulator:
         )
 
 
+async def _flush_tracker_store(agent: Optional[Agent]) -> None:
+    """Saves the pending trackers of `agent` before it is replaced."""
+    if agent and agent.tracker_store:
+        await agent.tracker_store.flush_async()
+
+
 async def _load_agent(
     model_path: Optional[Text] = None,
     model_server: Optional[EndpointConfig] = None,
@@ -503,16 +509,16 @@ def create_app(
         verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
 
         try:
-            async with app.agent.lock_store.lock(conversation_id):
+            async with app.agent.lock_conversation(conversation_id):
                 processor = app.agent.create_processor()
-                tracker = processor.get_tracker(conversation_id)
+                tracker = await processor.get_tracker_async(conversation_id)
                 _validate_tracker(tracker, conversation_id)
 
                 events = _get_events_from_request_body(request)
 
                 for event in events:
                     tracker.update(event, app.agent.domain)
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -558,13 +564,13 @@ def create_app(
         verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
 
         try:
-            async with app.agent.lock_store.lock(conversation_id):
+            async with app.agent.lock_conversation(conversation_id):
                 tracker = DialogueStateTracker.from_dict(
                     conversation_id, request.json, app.agent.domain.slots
                 )
 
                 # will override an existing tracker with the same id!
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -618,7 +624,7 @@ def create_app(
         verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
 
         try:
-            async with app.agent.lock_store.lock(conversation_id):
+            async with app.agent.lock_conversation(conversation_id):
                 tracker = await get_tracker(
                     app.agent.create_processor(), conversation_id
                 )
@@ -667,7 +673,7 @@ def create_app(
         verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
 
         try:
-            async with app.agent.lock_store.lock(conversation_id):
+            async with app.agent.lock_conversation(conversation_id):
                 tracker = await get_tracker(
                     app.agent.create_processor(), conversation_id
                 )
@@ -749,7 +755,7 @@ def create_app(
         user_message = UserMessage(message, None, conversation_id, parse_data)
 
         try:
-            async with app.agent.lock_store.lock(conversation_id):
+            async with app.agent.lock_conversation(conversation_id):
                 tracker = await app.agent.log_message(user_message)
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -994,9 +1000,11 @@ def create_app(
                     {"parameter": "model_server", "in": "body"},
                 )
 
-        app.agent = await _load_agent(
+        agent = await _load_agent(
             model_path, model_server, remote_storage, endpoints, app.agent.lock_store
         )
+        await _flush_tracker_store(app.agent)
+        app.agent = agent
 
         logger.debug(f"Successfully loaded model '{model_path}'.")
         return response.json(None, status=204)
@@ -1006,6 +1014,7 @@ def create_app(
     async def unload_model(request: Request) -> HTTPResponse:
         model_file = app.agent.model_directory
 
+        await _flush_tracker_store(app.agent)
         app.agent = Agent(lock_store=app.agent.lock_store)
 
         logger.debug(f"Successfully unloaded model '{model_file}'.")
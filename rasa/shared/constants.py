@@ -31,3 +31,6 @@ ENV_LOG_LEVEL = "LOG_LEVEL"
 
 DEFAULT_SENDER_ID = "default"
 UTTER_PREFIX = "utter_"
+
+ENV_TRAINING_DATA_LOADING_WORKERS = "RASA_TRAINING_DATA_LOADING_WORKERS"
+DEFAULT_TRAINING_DATA_LOADING_WORKERS = 1
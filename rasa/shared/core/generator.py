@@ -5,7 +5,7 @@ import logging
 import random
 
 from tqdm import tqdm
-from typing import Optional, List, Text, Set, Dict, Tuple, Deque, Any
+from typing import Optional, List, Text, Set, Dict, Tuple, Deque, Any, Iterable
 
 from rasa.shared.constants import DOCS_URL_STORIES
 from rasa.shared.core.constants import SHOULD_NOT_BE_SET
@@ -29,6 +29,7 @@ from rasa.shared.core.training_data.structures import (
     GENERATED_CHECKPOINT_PREFIX,
 )
 from rasa.shared.utils.io import is_logging_disabled
+import rasa.shared.utils.common
 import rasa.shared.utils.io
 
 logger = logging.getLogger(__name__)
@@ -45,8 +46,109 @@ ExtractorConfig = namedtuple(
 )
 
 
+# (number of hashed states, rolling hash of the states)
+StatesHash = Tuple[int, int]
+
+
+class _History:
+    """Immutable, singly linked list of the items of a tracker's history.
+
+    Appending an item to (or removing the last item from) a history creates a new
+    history which shares all other items with the old one. Tracker copies can hence
+    share their histories instead of copying them.
+    """
+
+    __slots__ = ("item", "previous", "length")
+
+    def __init__(self, item: Any = None, previous: Optional["_History"] = None):
+        self.item = item
+        self.previous = previous
+        self.length = previous.length + 1 if previous is not None else 0
+
+    def append(self, item: Any) -> "_History":
+        return type(self)(item, self)
+
+    def extend(self, items: Iterable[Any]) -> "_History":
+        history = self
+        for item in items:
+            history = type(self)(item, history)
+        return history
+
+    def pop(self) -> "_History":
+        if self.previous is None:
+            raise IndexError("pop from an empty history")
+        return self.previous
+
+    def items(self) -> List[Any]:
+        items = []
+        history = self
+        while history.previous is not None:
+            items.append(history.item)
+            history = history.previous
+        items.reverse()
+        return items
+
+
+class _StateHistory(_History):
+    """History of frozen states which keeps a rolling hash of its states.
+
+    The hash of all states and the hash of the last states are available without
+    iterating over the whole history.
+    """
+
+    __slots__ = ("prefix_hash",)
+
+    def __init__(
+        self, item: Any = None, previous: Optional["_StateHistory"] = None
+    ) -> None:
+        super().__init__(item, previous)
+        if previous is None:
+            self.prefix_hash = 0
+        else:
+            self.prefix_hash = rasa.shared.utils.common.extend_sequence_hash(
+                previous.prefix_hash, item
+            )
+
+    def hash_of_last(self, number_of_states: Optional[int] = None) -> StatesHash:
+        """Hashes the last states of the history.
+
+        Args:
+            number_of_states: The number of last states to hash. All states are
+                hashed if this is `None` or exceeds the length of the history.
+
+        Returns:
+            The hash of the states.
+        """
+        if number_of_states is None or number_of_states >= self.length:
+            return self.length, self.prefix_hash
+
+        start = self
+        for _ in range(number_of_states):
+            start = start.previous
+
+        return (
+            number_of_states,
+            rasa.shared.utils.common.subsequence_hash(
+                self.prefix_hash, start.prefix_hash, number_of_states
+            ),
+        )
+
+
+EMPTY_HISTORY = _History()
+EMPTY_STATE_HISTORY = _StateHistory()
+
+
 class TrackerWithCachedStates(DialogueStateTracker):
-    """A tracker wrapper that caches the state creation of the tracker."""
+    """A tracker wrapper that caches the state creation of the tracker.
+
+    Events and cached states are stored in immutable histories and copies of the
+    tracker share them as well as the slots (until one of the trackers changes a slot
+    value). Copying a tracker is therefore independent of the length of its history.
+    """
+
+    # `True` if the slot objects are shared with another tracker and have to be copied
+    # before they are modified
+    _slots_shared = False
 
     def __init__(
         self,
@@ -60,7 +162,7 @@ class TrackerWithCachedStates(DialogueStateTracker):
         super().__init__(
             sender_id, slots, max_event_history, is_rule_tracker=is_rule_tracker
         )
-        self._states_for_hashing = None
+        self._states_for_hashing: Optional[_StateHistory] = None
         self.domain = domain
         # T/F property to filter augmented stories
         self.is_augmented = is_augmented
@@ -83,32 +185,88 @@ class TrackerWithCachedStates(DialogueStateTracker):
             tracker.update(e)
         return tracker
 
-    def past_states_for_hashing(self, domain: Domain) -> Deque[FrozenState]:
-        # we need to make sure this is the same domain, otherwise things will
-        # go south. but really, the same tracker shouldn't be used across
-        # domains
-        assert domain == self.domain
+    @property
+    def events(self) -> Deque[Event]:
+        """The events of the tracker.
+
+        The returned deque is created from the event history and must not be
+        modified. Use `update` to add events instead.
+        """
+        if self._events_view is None or self._events_view[0] is not self._event_history:
+            self._events_view = (
+                self._event_history,
+                self._create_events(self._event_history.items()),
+            )
+        return self._events_view[1]
+
+    @events.setter
+    def events(self, events: Iterable[Event]) -> None:
+        self._event_history = EMPTY_HISTORY.extend(events)
+        self._events_view = None
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        # histories are converted to lists as pickling long linked lists would
+        # exceed the recursion limit
+        state = self.__dict__.copy()
+        state["_event_history"] = self._event_history.items()
+        if self._states_for_hashing is not None:
+            state["_states_for_hashing"] = self._states_for_hashing.items()
+        state["_events_view"] = None
+        return state
+
+    def __setstate__(self, state: Dict[Text, Any]) -> None:
+        state["_event_history"] = EMPTY_HISTORY.extend(state["_event_history"])
+        if state["_states_for_hashing"] is not None:
+            state["_states_for_hashing"] = EMPTY_STATE_HISTORY.extend(
+                state["_states_for_hashing"]
+            )
+        self.__dict__.update(state)
 
+    def _cached_states(self) -> _StateHistory:
         # if don't have it cached, we use the domain to calculate the states
         # from the events
         if self._states_for_hashing is None:
-            states = super().past_states(domain)
-            self._states_for_hashing = deque(
+            states = super().past_states(self.domain)
+            self._states_for_hashing = EMPTY_STATE_HISTORY.extend(
                 self.freeze_current_state(s) for s in states
             )
 
         return self._states_for_hashing
 
+    def hash_of_states(self, number_of_states: Optional[int] = None) -> StatesHash:
+        """Hashes the (last) states of the tracker.
+
+        The hash is updated incrementally whenever a state is added, so this doesn't
+        depend on the length of the tracker's history.
+
+        Args:
+            number_of_states: The number of last states to hash. All states are
+                hashed if this is `None`.
+
+        Returns:
+            The hash of the states. Equal state sequences result in equal hashes.
+        """
+        return self._cached_states().hash_of_last(number_of_states)
+
+    def past_states_for_hashing(self, domain: Domain) -> Deque[FrozenState]:
+        # we need to make sure this is the same domain, otherwise things will
+        # go south. but really, the same tracker shouldn't be used across
+        # domains
+        assert domain == self.domain
+
+        return deque(self._cached_states().items())
+
     @staticmethod
-    def _unfreeze_states(frozen_states: Deque[FrozenState]) -> List[State]:
+    def _unfreeze_states(frozen_states: Iterable[FrozenState]) -> List[State]:
         return [
             {key: dict(value) for key, value in dict(frozen_state).items()}
             for frozen_state in frozen_states
         ]
 
     def past_states(self, domain: Domain) -> List[State]:
-        states_for_hashing = self.past_states_for_hashing(domain)
-        return self._unfreeze_states(states_for_hashing)
+        assert domain == self.domain
+
+        return self._unfreeze_states(self._cached_states().items())
 
     def clear_states(self) -> None:
         """Reset the states."""
@@ -130,56 +288,75 @@ class TrackerWithCachedStates(DialogueStateTracker):
     ) -> "TrackerWithCachedStates":
         """Creates a duplicate of this tracker.
 
-        A new tracker will be created and all events
-        will be replayed."""
+        The duplicate shares the event history, the cached states and the slots
+        with this tracker instead of replaying all events."""
 
-        # This is an optimization, we could use the original copy, but
-        # the states would be lost and we would need to recalculate them
-
-        tracker = self.init_copy()
+        tracker = type(self).__new__(type(self))
+        tracker.__dict__.update(self.__dict__)
         tracker.sender_id = sender_id
         tracker.sender_source = sender_source
+        tracker.active_loop = self.active_loop.copy()
+        tracker._events_view = None
 
-        for event in self.events:
-            tracker.update(event, skip_states=True)
-
-        tracker._states_for_hashing = copy.copy(self._states_for_hashing)
+        self._slots_shared = True
+        tracker._slots_shared = True
 
         return tracker
 
+    def _unshare_slots(self) -> None:
+        if self._slots_shared:
+            slots = copy.copy(self.slots)
+            for name, slot in slots.items():
+                slots[name] = copy.copy(slot)
+            self.slots = slots
+            self._slots_shared = False
+
+    def _set_slot(self, key: Text, value: Any) -> None:
+        self._unshare_slots()
+        super()._set_slot(key, value)
+
+    def _reset_slots(self) -> None:
+        self._unshare_slots()
+        super()._reset_slots()
+
     def _append_current_state(self) -> None:
         if self._states_for_hashing is None:
-            self._states_for_hashing = self.past_states_for_hashing(self.domain)
+            self._cached_states()
         else:
             state = self.domain.get_active_states(self)
             frozen_state = self.freeze_current_state(state)
-            self._states_for_hashing.append(frozen_state)
+            self._states_for_hashing = self._states_for_hashing.append(frozen_state)
 
     def update(self, event: Event, skip_states: bool = False) -> None:
         """Modify the state of the tracker according to an ``Event``. """
 
+        if not isinstance(event, Event):  # pragma: no cover
+            raise ValueError("event to log must be an instance of a subclass of Event.")
+
         # if `skip_states` is `True`, this function behaves exactly like the
         # normal update of the `DialogueStateTracker`
 
         if self._states_for_hashing is None and not skip_states:
             # rest of this function assumes we have the previous state
             # cached. let's make sure it is there.
-            self._states_for_hashing = self.past_states_for_hashing(self.domain)
+            self._cached_states()
 
-        super().update(event)
+        self._event_history = self._event_history.append(event)
+        event.apply_to(self)
 
         if not skip_states:
             if isinstance(event, ActionExecuted):
                 pass
             elif isinstance(event, ActionReverted):
-                self._states_for_hashing.pop()  # removes the state after the action
-                self._states_for_hashing.pop()  # removes the state used for the action
+                # removes the state after the action and the state used for the
+                # action
+                self._states_for_hashing = self._states_for_hashing.pop().pop()
             elif isinstance(event, UserUtteranceReverted):
                 self.clear_states()
             elif isinstance(event, Restarted):
                 self.clear_states()
             else:
-                self._states_for_hashing.pop()
+                self._states_for_hashing = self._states_for_hashing.pop()
 
             self._append_current_state()
 
@@ -650,23 +827,22 @@ class TrainingDataGenerator:
         end_trackers = []  # for all steps
 
         for tracker in trackers:
-            states_for_hashing = tuple(tracker.past_states_for_hashing(self.domain))
-            hashed = hash(states_for_hashing)
+            hashed = tracker.hash_of_states()
 
             # only continue with trackers that created a
             # hashed_featurization we haven't observed
             if hashed not in step_hashed_featurizations:
                 if self.config.unique_last_num_states:
-                    last_states = states_for_hashing[
-                        -self.config.unique_last_num_states :
-                    ]
-                    last_hashed = hash(last_states)
+                    last_hashed = tracker.hash_of_states(
+                        self.config.unique_last_num_states
+                    )
 
                     if last_hashed not in step_hashed_featurizations:
                         step_hashed_featurizations.add(last_hashed)
                         unique_trackers.append(tracker)
                     elif (
-                        len(states_for_hashing) > len(last_states)
+                        # the tracker has more states than the last ones
+                        last_hashed != hashed
                         and hashed not in self.hashed_featurizations
                     ):
                         self.hashed_featurizations.add(hashed)
@@ -691,8 +867,7 @@ class TrainingDataGenerator:
         # otherwise featurization does a lot of unnecessary work
 
         for tracker in trackers:
-            states_for_hashing = tuple(tracker.past_states_for_hashing(self.domain))
-            hashed = hash(states_for_hashing + (tracker.is_rule_tracker,))
+            hashed = tracker.hash_of_states() + (tracker.is_rule_tracker,)
 
             # only continue with trackers that created a
             # hashed_featurization we haven't observed
@@ -165,6 +165,9 @@ class DialogueStateTracker:
         self.sender_source = sender_source
         # whether the tracker belongs to a rule-based data
         self.is_rule_tracker = is_rule_tracker
+        # number of events which were already stored by a tracker store when the
+        # tracker was retrieved or saved the last time (`None` if unknown)
+        self.number_of_persisted_events: Optional[int] = None
 
         ###
         # current state of the tracker - MUST be re-creatable by processing
@@ -527,6 +530,21 @@ class DialogueStateTracker:
         """Creates a duplicate of this tracker"""
         return self.travel_back_in_time(float("inf"))
 
+    def snapshot(self) -> "DialogueStateTracker":
+        """Creates an independent copy of this tracker without replaying its events.
+
+        Events are immutable, so they are shared between the tracker and the copy.
+        """
+        tracker = copy.copy(self)
+        tracker.events = self._create_events(list(self.events))
+        tracker.slots = type(self.slots)(
+            (name, copy.copy(slot)) for name, slot in self.slots.items()
+        )
+        tracker.active_loop = copy.deepcopy(self.active_loop)
+        tracker.latest_action = copy.deepcopy(self.latest_action)
+
+        return tracker
+
     def travel_back_in_time(self, target_time: float) -> "DialogueStateTracker":
         """Creates a new tracker with a state at a specific timestamp.
 
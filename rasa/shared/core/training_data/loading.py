@@ -1,9 +1,12 @@
+import asyncio
+import functools
 import logging
 import os
 from pathlib import Path
 from typing import Text, Optional, Dict, List, Union
 
 import rasa.shared.data
+import rasa.shared.utils.common
 import rasa.shared.utils.io
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.training_data.story_reader.markdown_story_reader import (
@@ -107,13 +110,94 @@ async def load_data_from_files(
     """
     story_steps = []
 
-    for story_file in story_files:
+    for steps in await read_story_files(
+        story_files, domain, template_variables, use_e2e
+    ):
+        story_steps.extend(steps)
 
-        reader = _get_reader(story_file, domain, template_variables, use_e2e)
+    return exclude_story_steps(story_steps, exclusion_percentage)
 
-        steps = await reader.read_from_file(story_file)
-        story_steps.extend(steps)
 
+async def read_story_files(
+    story_files: List[Text],
+    domain: Domain,
+    template_variables: Optional[Dict] = None,
+    use_e2e: bool = False,
+) -> List[List["StoryStep"]]:
+    """Reads the story steps of multiple files.
+
+    The files are read by a pool of processes if this was configured with the
+    `RASA_TRAINING_DATA_LOADING_WORKERS` environment variable.
+
+    Args:
+        story_files: List of files with training data in it.
+        domain: Domain object.
+        template_variables: Variables that have to be replaced in the training data.
+        use_e2e: Identifies whether the e2e reader should be used.
+
+    Returns:
+        The story steps of each file in the same order as `story_files`.
+    """
+    num_workers = rasa.shared.utils.common.number_of_training_data_loading_workers()
+
+    if num_workers > 1 and len(story_files) > 1:
+        return rasa.shared.utils.common.map_in_parallel(
+            functools.partial(
+                _read_story_file_in_new_event_loop,
+                domain=domain,
+                template_variables=template_variables,
+                use_e2e=use_e2e,
+            ),
+            story_files,
+            num_workers,
+        )
+
+    return [
+        await _read_story_file(story_file, domain, template_variables, use_e2e)
+        for story_file in story_files
+    ]
+
+
+async def _read_story_file(
+    story_file: Text,
+    domain: Domain,
+    template_variables: Optional[Dict] = None,
+    use_e2e: bool = False,
+) -> List["StoryStep"]:
+    reader = _get_reader(story_file, domain, template_variables, use_e2e)
+
+    return await reader.read_from_file(story_file)
+
+
+def _read_story_file_in_new_event_loop(
+    story_file: Text,
+    domain: Domain,
+    template_variables: Optional[Dict] = None,
+    use_e2e: bool = False,
+) -> List["StoryStep"]:
+    # worker processes don't have a running event loop
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(
+            _read_story_file(story_file, domain, template_variables, use_e2e)
+        )
+    finally:
+        loop.close()
+
+
+def exclude_story_steps(
+    story_steps: List["StoryStep"], exclusion_percentage: Optional[int] = None
+) -> List["StoryStep"]:
+    """Randomly excludes a percentage of the story steps.
+
+    Args:
+        story_steps: Story steps from the training data.
+        exclusion_percentage: Identifies the percentage of training data that
+                              should be excluded from the training.
+
+    Returns:
+        The remaining story steps.
+    """
     if exclusion_percentage and exclusion_percentage != 100:
         import random
 
@@ -175,6 +175,11 @@ class MarkdownReader(TrainingDataReader):
     @staticmethod
     def is_markdown_nlu_file(filename: Union[Text, Path]) -> bool:
         content = rasa.shared.utils.io.read_file(filename)
+        return MarkdownReader.is_markdown_nlu_content(content)
+
+    @staticmethod
+    def is_markdown_nlu_content(content: Text) -> bool:
+        """Checks if the given text contains NLU training data in markdown format."""
         return any(marker in content for marker in MARKDOWN_SECTION_MARKERS)
 
 
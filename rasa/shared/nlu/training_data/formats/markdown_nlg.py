@@ -97,6 +97,18 @@ class NLGMarkdownReader(TrainingDataReader):
             `True` if file contains NLG training data, `False` otherwise.
         """
         content = io_utils.read_file(filename)
+        return NLGMarkdownReader.is_markdown_nlg_content(content)
+
+    @staticmethod
+    def is_markdown_nlg_content(content: Text) -> bool:
+        """Checks if the given text contains NLG training data in markdown format.
+
+        Args:
+            content: Text of a training data file.
+
+        Returns:
+            `True` if `content` contains NLG training data, `False` otherwise.
+        """
         return re.search(NLG_MARKDOWN_MARKER_REGEX, content) is not None
 
 
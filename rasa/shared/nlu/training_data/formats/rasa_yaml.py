@@ -337,10 +337,25 @@ class RasaYAMLReader(TrainingDataReader):
         if not rasa.shared.data.is_likely_yaml_file(filename):
             return False
 
+        content = rasa.shared.utils.io.read_file(filename)
+        return RasaYAMLReader.is_yaml_nlu_content(content, filename)
+
+    @staticmethod
+    def is_yaml_nlu_content(content: Text, filename: Text = "") -> bool:
+        """Checks if the given text possibly contains NLU training data in YAML.
+
+        Args:
+            content: Text of a training data file.
+            filename: Name of the file the text was read from (used for logging).
+
+        Returns:
+            `True` if `content` is possibly valid YAML NLU training data,
+            `False` otherwise.
+        """
         try:
-            content = rasa.shared.utils.io.read_yaml_file(filename)
+            parsed_content = rasa.shared.utils.io.read_yaml(content)
 
-            return any(key in content for key in {KEY_NLU, KEY_RESPONSES})
+            return any(key in parsed_content for key in {KEY_NLU, KEY_RESPONSES})
         except (YAMLError, Warning) as e:
             logger.error(
                 f"Tried to check if '{filename}' is an NLU file, but failed to "
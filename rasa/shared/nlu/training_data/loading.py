@@ -1,9 +1,12 @@
+import functools
 import json
 import logging
 import os
 import typing
-from typing import Optional, Text
+from typing import List, Optional, Text
 
+import rasa.shared.data
+import rasa.shared.utils.common
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.formats import MarkdownReader, NLGMarkdownReader
 from rasa.shared.nlu.training_data.formats.dialogflow import (
@@ -57,7 +60,7 @@ def load_data(resource_name: Text, language: Optional[Text] = "en") -> "Training
     else:
         files = rasa.shared.utils.io.list_files(resource_name)
 
-    data_sets = [_load(f, language) for f in files]
+    data_sets = load_files(files, language)
     data_sets = [ds for ds in data_sets if ds]
     if len(data_sets) == 0:
         training_data = TrainingData()
@@ -99,20 +102,52 @@ def _reader_factory(fformat: Text) -> Optional["TrainingDataReader"]:
     return reader
 
 
+def load_files(
+    files: List[Text], language: Optional[Text] = "en"
+) -> List[Optional["TrainingData"]]:
+    """Loads multiple training data files from disk.
+
+    The files are loaded by a pool of processes if this was configured with the
+    `RASA_TRAINING_DATA_LOADING_WORKERS` environment variable.
+
+    Args:
+        files: The training data files.
+        language: The language of the training data.
+
+    Returns:
+        The loaded training data in the same order as `files`.
+    """
+    return rasa.shared.utils.common.map_in_parallel(
+        functools.partial(_load, language=language),
+        files,
+        rasa.shared.utils.common.number_of_training_data_loading_workers(),
+    )
+
+
 def _load(filename: Text, language: Optional[Text] = "en") -> Optional["TrainingData"]:
     """Loads a single training data file from disk."""
 
-    fformat = guess_format(filename)
+    content = None
+    if os.path.isfile(filename):
+        content = rasa.shared.utils.io.read_file(filename)
+
+    fformat = _guess_format_from_content(filename, content)
     if fformat == UNK:
         raise ValueError(f"Unknown data format for file '{filename}'.")
 
     reader = _reader_factory(fformat)
 
-    if reader:
-        return reader.read(filename, language=language, fformat=fformat)
-    else:
+    if not reader:
         return None
 
+    if fformat in DIALOGFLOW_RELEVANT:
+        # Dialogflow data is spread across multiple files
+        return reader.read(filename, language=language, fformat=fformat)
+
+    # use the already read content instead of reading the file a second time
+    reader.filename = filename
+    return reader.reads(content, language=language, fformat=fformat)
+
 
 def guess_format(filename: Text) -> Text:
     """Applies heuristics to guess the data format of a file.
@@ -120,6 +155,23 @@ def guess_format(filename: Text) -> Text:
     Args:
         filename: file whose type should be guessed
 
+    Returns:
+        Guessed file format.
+    """
+    content = None
+    if os.path.isfile(filename):
+        content = rasa.shared.utils.io.read_file(filename)
+
+    return _guess_format_from_content(filename, content)
+
+
+def _guess_format_from_content(filename: Text, content: Optional[Text]) -> Text:
+    """Applies heuristics to guess the data format of an already read file.
+
+    Args:
+        filename: file whose type should be guessed
+        content: content of the file or `None` if it is not a file
+
     Returns:
         Guessed file format.
     """
@@ -127,18 +179,19 @@ def guess_format(filename: Text) -> Text:
 
     guess = UNK
 
-    if not os.path.isfile(filename):
+    if content is None:
         return guess
 
     try:
-        content = rasa.shared.utils.io.read_file(filename)
         js = json.loads(content)
     except ValueError:
-        if MarkdownReader.is_markdown_nlu_file(filename):
+        if MarkdownReader.is_markdown_nlu_content(content):
             guess = MARKDOWN
-        elif NLGMarkdownReader.is_markdown_nlg_file(filename):
+        elif NLGMarkdownReader.is_markdown_nlg_content(content):
             guess = MARKDOWN_NLG
-        elif RasaYAMLReader.is_yaml_nlu_file(filename):
+        elif rasa.shared.data.is_likely_yaml_file(
+            filename
+        ) and RasaYAMLReader.is_yaml_nlu_content(content, filename):
             guess = RASA_YAML
     else:
         for file_format, format_heuristic in _json_format_heuristics.items():
@@ -43,6 +43,23 @@ class Message:
             self.output_properties = set()
         self.output_properties.add(TEXT)
 
+    def shallow_copy(self) -> "Message":
+        """Creates a copy which shares the attribute values and features.
+
+        Attributes which are set and features which are added to the copy are not
+        visible in this message. Attribute values must not be modified in place
+        though, as they are shared between both messages.
+
+        Returns:
+            The copied message.
+        """
+        return Message(
+            self.data,
+            output_properties=self.output_properties.copy(),
+            time=self.time,
+            features=self.features.copy(),
+        )
+
     def add_features(self, features: Optional["Features"]) -> None:
         if features is not None:
             self.features.append(features)
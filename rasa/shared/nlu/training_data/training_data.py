@@ -587,18 +587,41 @@ class TrainingData:
         Returns:
             Itself but without training examples which don't have a text or intent.
         """
-        training_examples = copy.deepcopy(self.training_examples)
         entity_synonyms = self.entity_synonyms.copy()
         regex_features = copy.deepcopy(self.regex_features)
         lookup_tables = copy.deepcopy(self.lookup_tables)
         responses = copy.deepcopy(self.responses)
         copied = TrainingData(
-            training_examples, entity_synonyms, regex_features, lookup_tables, responses
+            None, entity_synonyms, regex_features, lookup_tables, responses
         )
         copied.training_examples = self._training_examples_without_empty_e2e_examples()
 
         return copied
 
+    def shallow_copy(self) -> "TrainingData":
+        """Creates a copy which shares the message attributes with this instance.
+
+        Every training example is replaced by a `Message.shallow_copy`. Setting
+        attributes or adding features on the copied messages hence doesn't modify
+        this training data, while the (potentially large) attribute values themselves
+        are not copied.
+
+        Returns:
+            The copied training data.
+        """
+        copied = TrainingData(
+            None,
+            self.entity_synonyms.copy(),
+            copy.deepcopy(self.regex_features),
+            copy.deepcopy(self.lookup_tables),
+            copy.deepcopy(self.responses),
+        )
+        copied.training_examples = [
+            example.shallow_copy() for example in self.training_examples
+        ]
+
+        return copied
+
     def _training_examples_without_empty_e2e_examples(self) -> List[Message]:
         return [
             example
@@ -1,5 +1,18 @@
 import importlib
-from typing import Text, Dict, Optional, Any, List, Callable
+import logging
+import os
+from typing import Text, Dict, Optional, Any, List, Callable, Iterable, Hashable
+
+from rasa.shared.constants import (
+    DEFAULT_TRAINING_DATA_LOADING_WORKERS,
+    ENV_TRAINING_DATA_LOADING_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+# modulus and base of the polynomial rolling hashes of sequences
+SEQUENCE_HASH_MODULUS = (1 << 61) - 1
+SEQUENCE_HASH_BASE = 1_000_003
 
 
 def class_from_module_path(
@@ -61,3 +74,109 @@ def lazy_property(function: Callable) -> Any:
         return getattr(self, attr_name)
 
     return _lazyprop
+
+
+def number_of_workers(environment_variable: Text, default: int) -> int:
+    """Returns the number of workers which is configured in an environment variable.
+
+    Args:
+        environment_variable: The environment variable which contains the number.
+            `0` uses one worker per CPU.
+        default: The number in case the variable isn't set or invalid.
+
+    Returns:
+        The number of workers.
+    """
+    value = os.environ.get(environment_variable, default)
+    try:
+        num_workers = int(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid value '{value}' for '{environment_variable}'. "
+            f"Using {default} instead."
+        )
+        num_workers = default
+
+    if num_workers <= 0:
+        num_workers = os.cpu_count() or 1
+
+    return num_workers
+
+
+def number_of_training_data_loading_workers() -> int:
+    """Returns the number of processes which should be used to load training data.
+
+    The number can be configured with the `RASA_TRAINING_DATA_LOADING_WORKERS`
+    environment variable. `0` uses one process per CPU.
+    """
+    return number_of_workers(
+        ENV_TRAINING_DATA_LOADING_WORKERS, DEFAULT_TRAINING_DATA_LOADING_WORKERS
+    )
+
+
+def map_in_parallel(
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    num_workers: int,
+    start_method: Optional[Text] = None,
+) -> List[Any]:
+    """Applies a function to all items using a pool of processes.
+
+    Args:
+        function: Module level function which is applied to every item.
+        items: Picklable arguments for `function`.
+        num_workers: Maximum number of processes. If `1`, the items are processed
+            in the current process.
+        start_method: The `multiprocessing` start method of the processes. Uses the
+            platform's default if `None`.
+
+    Returns:
+        The results in the same order as `items`.
+    """
+    items = list(items)
+    num_workers = min(num_workers, len(items))
+
+    if num_workers <= 1:
+        return [function(item) for item in items]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = multiprocessing.get_context(start_method)
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=context) as pool:
+        return list(pool.map(function, items))
+
+
+def extend_sequence_hash(sequence_hash: int, item: Hashable) -> int:
+    """Extends the polynomial rolling hash of a sequence by one item.
+
+    Args:
+        sequence_hash: The hash of the sequence (`0` for an empty sequence).
+        item: The item which is appended to the sequence.
+
+    Returns:
+        The hash of the extended sequence.
+    """
+    # items never hash to `0` so that sequences with a different number of leading
+    # items are unlikely to collide
+    item_hash = hash(item) % (SEQUENCE_HASH_MODULUS - 1) + 1
+    return (sequence_hash * SEQUENCE_HASH_BASE + item_hash) % SEQUENCE_HASH_MODULUS
+
+
+def subsequence_hash(prefix_hash: int, shorter_prefix_hash: int, length: int) -> int:
+    """Calculates the hash of the last items of a sequence in constant time.
+
+    Args:
+        prefix_hash: The hash of the sequence.
+        shorter_prefix_hash: The hash of the sequence without its last `length`
+            items.
+        length: The number of last items.
+
+    Returns:
+        The hash of the last `length` items. It is equal to the hash of a sequence
+        which only consists of these items.
+    """
+    offset = shorter_prefix_hash * pow(
+        SEQUENCE_HASH_BASE, length, SEQUENCE_HASH_MODULUS
+    )
+    return (prefix_hash - offset) % SEQUENCE_HASH_MODULUS
@@ -3,6 +3,7 @@ import glob
 import json
 import os
 import re
+import threading
 import warnings
 from collections import OrderedDict
 from hashlib import md5
@@ -228,6 +229,29 @@ def replace_environment_variables() -> None:
     yaml.SafeConstructor.add_constructor("!env_var", env_var_constructor)
 
 
+_yaml_parsers = threading.local()
+
+
+def _get_yaml_parser() -> yaml.YAML:
+    """Returns a YAML parser which is reused for all reads of the current thread.
+
+    Creating the parser and registering the custom constructors is costly compared
+    to parsing small files, hence this is only done once per thread.
+    """
+    yaml_parser = getattr(_yaml_parsers, "parser", None)
+    if yaml_parser is None:
+        fix_yaml_loader()
+
+        replace_environment_variables()
+
+        yaml_parser = yaml.YAML(typ="safe")
+        yaml_parser.version = YAML_VERSION
+        yaml_parser.preserve_quotes = True
+        _yaml_parsers.parser = yaml_parser
+
+    return yaml_parser
+
+
 def read_yaml(content: Text) -> Any:
     """Parses yaml from a text.
 
@@ -237,13 +261,7 @@ def read_yaml(content: Text) -> Any:
     Raises:
         ruamel.yaml.parser.ParserError: If there was an error when parsing the YAML.
     """
-    fix_yaml_loader()
-
-    replace_environment_variables()
-
-    yaml_parser = yaml.YAML(typ="safe")
-    yaml_parser.version = YAML_VERSION
-    yaml_parser.preserve_quotes = True
+    yaml_parser = _get_yaml_parser()
 
     if _is_ascii(content):
         # Required to make sure emojis are correctly parsed
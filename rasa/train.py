@@ -1,8 +1,11 @@
 import asyncio
+import logging
+import multiprocessing
 import os
+import pickle
 import tempfile
 from contextlib import ExitStack
-from typing import Text, Optional, List, Union, Dict
+from typing import Any, Text, Optional, List, Union, Dict
 
 import rasa.core.interpreter
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
@@ -19,8 +22,11 @@ from rasa.constants import (
     DEFAULT_MODELS_PATH,
     DEFAULT_CORE_SUBDIRECTORY_NAME,
     DEFAULT_NLU_SUBDIRECTORY_NAME,
+    ENV_PARALLEL_NLU_CORE_TRAINING,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def train(
     domain: Text,
@@ -231,6 +237,22 @@ async def _do_training(
     if not fingerprint_comparison_result:
         fingerprint_comparison_result = FingerprintComparisonResult()
 
+    if (
+        fingerprint_comparison_result.should_retrain_nlu()
+        and fingerprint_comparison_result.should_retrain_core()
+        and await _can_train_nlu_and_core_in_parallel(file_importer)
+    ):
+        await _train_nlu_and_core_in_parallel(
+            file_importer,
+            output_path=output_path,
+            train_path=train_path,
+            fixed_model_name=fixed_model_name,
+            persist_nlu_training_data=persist_nlu_training_data,
+            core_additional_arguments=core_additional_arguments,
+            nlu_additional_arguments=nlu_additional_arguments,
+        )
+        return
+
     interpreter_path = None
     if fingerprint_comparison_result.should_retrain_nlu():
         model_path = await _train_nlu_with_validated_data(
@@ -273,6 +295,143 @@ async def _do_training(
         )
 
 
+def _core_depends_on_nlu(config: Dict) -> bool:
+    """Checks whether the Core policies use the NLU model during their training.
+
+    Only policies which featurize the dialogue states with a `SingleStateFeaturizer`
+    pass the states through the NLU interpreter. Policies without a state featurizer
+    (e.g. `MemoizationPolicy`, `RulePolicy`) and the `BinarySingleStateFeaturizer`
+    don't need it. Custom policies and featurizers might use the interpreter which
+    is passed to their training in any way, so they are assumed to need it.
+
+    Args:
+        config: The model configuration.
+
+    Returns:
+        `True` if Core has to wait for the NLU training.
+    """
+    from rasa.core import config as core_config
+    from rasa.core.featurizers.single_state_featurizer import (
+        BinarySingleStateFeaturizer,
+    )
+
+    for policy in core_config.load(config):
+        if not _is_built_in(policy):
+            return True
+
+        featurizer = policy.featurizer
+        state_featurizer = getattr(featurizer, "state_featurizer", None)
+        if not all(
+            _is_built_in(component)
+            for component in [featurizer, state_featurizer]
+            if component is not None
+        ):
+            return True
+
+        if state_featurizer is not None and not isinstance(
+            state_featurizer, BinarySingleStateFeaturizer
+        ):
+            return True
+
+    return False
+
+
+def _is_built_in(component: Any) -> bool:
+    return type(component).__module__.startswith("rasa.")
+
+
+async def _can_train_nlu_and_core_in_parallel(
+    file_importer: TrainingDataImporter,
+) -> bool:
+    if os.environ.get(ENV_PARALLEL_NLU_CORE_TRAINING, "true").lower() == "false":
+        return False
+
+    if (os.cpu_count() or 1) < 2:
+        return False
+
+    if _core_depends_on_nlu(await file_importer.get_config()):
+        return False
+
+    try:
+        pickle.dumps(file_importer)
+    except Exception as e:
+        logger.debug(
+            f"Training NLU and Core sequentially since the training data importer "
+            f"can't be passed to a separate process: {e}"
+        )
+        return False
+
+    return True
+
+
+def _train_nlu_in_new_event_loop(
+    file_importer: TrainingDataImporter,
+    output: Text,
+    train_path: Text,
+    fixed_model_name: Optional[Text],
+    persist_nlu_training_data: bool,
+    additional_arguments: Optional[Dict],
+) -> Optional[Text]:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(
+            _train_nlu_with_validated_data(
+                file_importer,
+                output=output,
+                train_path=train_path,
+                fixed_model_name=fixed_model_name,
+                persist_nlu_training_data=persist_nlu_training_data,
+                additional_arguments=additional_arguments,
+            )
+        )
+    finally:
+        loop.close()
+
+
+async def _train_nlu_and_core_in_parallel(
+    file_importer: TrainingDataImporter,
+    output_path: Text,
+    train_path: Text,
+    fixed_model_name: Optional[Text] = None,
+    persist_nlu_training_data: bool = False,
+    core_additional_arguments: Optional[Dict] = None,
+    nlu_additional_arguments: Optional[Dict] = None,
+) -> None:
+    """Trains NLU in a separate process while Core is trained in this one.
+
+    Must only be used if Core doesn't depend on the NLU model (see
+    `_core_depends_on_nlu`). Both models are written to `train_path` and are
+    packaged into one model archive afterwards.
+    """
+    logger.debug("Training NLU and Core in parallel.")
+
+    # `spawn` so that the child doesn't inherit the TensorFlow state of this process
+    pool = multiprocessing.get_context("spawn").Pool(processes=1)
+    try:
+        nlu_training = pool.apply_async(
+            _train_nlu_in_new_event_loop,
+            (
+                file_importer,
+                output_path,
+                train_path,
+                fixed_model_name,
+                persist_nlu_training_data,
+                nlu_additional_arguments,
+            ),
+        )
+        await _train_core_with_validated_data(
+            file_importer,
+            output=output_path,
+            train_path=train_path,
+            fixed_model_name=fixed_model_name,
+            additional_arguments=core_additional_arguments,
+        )
+        await asyncio.get_event_loop().run_in_executor(None, nlu_training.get)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 def _load_interpreter(
     interpreter_path: Optional[Text],
 ) -> Optional[NaturalLanguageInterpreter]:
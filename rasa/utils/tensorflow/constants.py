@@ -65,6 +65,7 @@ INNER = "inner"
 COSINE = "cosine"
 
 BALANCED = "balanced"
+BUCKETED = "bucketed"
 
 SEQUENCE = "sequence"
 SENTENCE = "sentence"
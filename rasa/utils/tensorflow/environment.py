@@ -3,8 +3,11 @@ import os
 from typing import Text, Dict
 import typing
 
+import rasa.shared.utils.common
 import rasa.shared.utils.io
 from rasa.constants import (
+    DEFAULT_BATCH_WORKERS,
+    ENV_BATCH_WORKERS,
     ENV_GPU_CONFIG,
     ENV_CPU_INTER_OP_CONFIG,
     ENV_CPU_INTRA_OP_CONFIG,
@@ -141,3 +144,15 @@ def setup_tf_environment() -> None:
 
     _setup_cpu_environment()
     _setup_gpu_environment()
+
+
+def number_of_batch_workers() -> int:
+    """Returns the number of threads which should be used to assemble batches.
+
+    The number can be configured with the `RASA_BATCH_WORKERS` environment variable.
+    `0` uses one thread per CPU, `1` assembles the batches in the thread which
+    feeds them to TensorFlow.
+    """
+    return rasa.shared.utils.common.number_of_workers(
+        ENV_BATCH_WORKERS, DEFAULT_BATCH_WORKERS
+    )
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
 import scipy.sparse
@@ -12,17 +13,187 @@ from typing import (
     List,
     Tuple,
     Any,
+    Deque,
     Union,
     Generator,
     NamedTuple,
     ValuesView,
     ItemsView,
 )
-from collections import defaultdict
-from rasa.utils.tensorflow.constants import BALANCED, SEQUENCE
+from collections import defaultdict, deque
+
+import rasa.utils.tensorflow.environment
+from rasa.utils.tensorflow.constants import BALANCED, BUCKETED, SEQUENCE
 
 logger = logging.getLogger(__name__)
 
+# number of consecutive batches of an epoch whose examples are sorted by their
+# sequence length when using the bucketed batch strategy
+BATCHES_PER_BUCKETING_WINDOW = 50
+
+
+class PackedFeatures:
+    """Sequence features of all examples stored in one contiguous block.
+
+    The rows (e.g. the tokens) of all examples are stacked on top of each other:
+    `values[offsets[i] : offsets[i + 1]]` are the features of the i-th example.
+
+    Behaves like a numpy object array which contains the features of one example per
+    element: indexing with an integer returns the features of a single example,
+    indexing with a slice, an index array or a boolean mask returns `PackedFeatures`
+    of the selected examples. The selection is done with vectorized row indexing
+    instead of a Python loop over the examples.
+    """
+
+    def __init__(self, values: Any, offsets: np.ndarray) -> None:
+        self.values = values
+        self.offsets = offsets
+
+    @staticmethod
+    def _stack(values: List[Any]) -> Any:
+        raise NotImplementedError
+
+    @classmethod
+    def from_examples(cls, examples: Union[np.ndarray, List[Any]]) -> "PackedFeatures":
+        """Packs the features of single examples.
+
+        Args:
+            examples: The features of every example.
+
+        Returns:
+            The packed features.
+        """
+        lengths = np.array([example.shape[0] for example in examples], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        return cls(cls._stack(list(examples)), offsets)
+
+    @classmethod
+    def concatenate(cls, packed: List["PackedFeatures"]) -> "PackedFeatures":
+        """Concatenates packed features along the example axis.
+
+        Args:
+            packed: The packed features to concatenate.
+
+        Returns:
+            The concatenated features.
+        """
+        offsets = [packed[0].offsets]
+        for features in packed[1:]:
+            offsets.append(features.offsets[1:] + offsets[-1][-1])
+        return cls(cls._stack([f.values for f in packed]), np.concatenate(offsets))
+
+    @property
+    def shape(self) -> Tuple[int]:
+        return (len(self),)
+
+    @property
+    def size(self) -> int:
+        return len(self)
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """The number of rows of each example."""
+        return np.diff(self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key: Any) -> Any:
+        # sklearn indexes arrays with `array[indices, ...]`
+        if isinstance(key, tuple) and len(key) == 2 and key[1] is Ellipsis:
+            key = key[0]
+
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError(f"Index {key} is out of bounds.")
+            return self.values[self.offsets[key] : self.offsets[key + 1]]
+
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                stop = max(start, stop)
+                return type(self)(
+                    self.values[self.offsets[start] : self.offsets[stop]],
+                    self.offsets[start : stop + 1] - self.offsets[start],
+                )
+            return self._take(np.arange(start, stop, step))
+
+        ids = np.asarray(key)
+        if ids.dtype == bool:
+            ids = np.flatnonzero(ids)
+        return self._take(ids.astype(np.int64))
+
+    def _take(self, ids: np.ndarray) -> "PackedFeatures":
+        starts = self.offsets[ids]
+        lengths = self.offsets[ids + 1] - starts
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        rows = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return type(self)(self.values[rows], offsets)
+
+    def _row_positions(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the example and the position within the example of every row."""
+        examples = np.repeat(np.arange(len(self)), self.lengths)
+        positions = np.arange(self.offsets[-1]) - self.offsets[examples]
+        return examples, positions
+
+
+class PackedDenseFeatures(PackedFeatures):
+    """Dense sequence features of all examples stored in one contiguous array."""
+
+    @staticmethod
+    def _stack(values: List[np.ndarray]) -> np.ndarray:
+        return np.concatenate(values)
+
+    def padded(self) -> np.ndarray:
+        """Pads the features of all examples to the length of the longest example.
+
+        Returns:
+            A `float32` array of shape (examples, max. sequence length, features).
+        """
+        max_seq_len = int(self.lengths.max()) if len(self) else 0
+        data_padded = np.zeros(
+            [len(self), max_seq_len, self.values.shape[-1]], dtype=np.float32
+        )
+        examples, positions = self._row_positions()
+        data_padded[examples, positions] = self.values
+        return data_padded
+
+
+class PackedSparseFeatures(PackedFeatures):
+    """Sparse sequence features of all examples stored in one CSR matrix."""
+
+    @staticmethod
+    def _stack(values: List[scipy.sparse.spmatrix]) -> scipy.sparse.csr_matrix:
+        return scipy.sparse.vstack(values, format="csr")
+
+    def to_values(self) -> List[np.ndarray]:
+        """Converts the features into indices, data, and shape.
+
+        Returns:
+            The indices (example, position, feature) and values of the non-zero
+            entries and the dense shape of the padded features.
+        """
+        coo = self.values.tocoo()
+        examples, positions = self._row_positions()
+        indices = np.stack(
+            [examples[coo.row], positions[coo.row], coo.col], axis=1
+        ).astype(np.int64)
+
+        max_seq_len = int(self.lengths.max()) if len(self) else 0
+        shape = np.array((len(self), max_seq_len, self.values.shape[-1]))
+
+        return [indices, coo.data.astype(np.float32), shape.astype(np.int64)]
+
 
 # Mapping of attribute name and feature name to a list of numpy arrays representing
 # the actual features
@@ -31,7 +202,8 @@ logger = logging.getLogger(__name__)
 #   "numpy array containing dense features for every training example",
 #   "numpy array containing sparse features for every training example"
 # ]}
-Data = Dict[Text, Dict[Text, List[np.ndarray]]]
+# Sequence features of all examples are packed into `PackedFeatures`.
+Data = Dict[Text, Dict[Text, List[Union[np.ndarray, PackedFeatures]]]]
 
 
 class FeatureSignature(NamedTuple):
@@ -63,6 +235,9 @@ class RasaModelData:
         """
 
         self.data = data or defaultdict(lambda: defaultdict(list))
+        for attribute_data in self.data.values():
+            for sub_key, features in attribute_data.items():
+                attribute_data[sub_key] = [self._pack(f) for f in features]
         self.label_key = label_key
         self.label_sub_key = label_sub_key
         # should be updated when features are added
@@ -246,7 +421,7 @@ class RasaModelData:
 
         for data in features:
             if data.size > 0:
-                self.data[key][sub_key].append(data)
+                self.data[key][sub_key].append(self._pack(data))
 
         if not self.data[key][sub_key]:
             del self.data[key][sub_key]
@@ -274,7 +449,10 @@ class RasaModelData:
 
         for data in self.data[from_key][from_sub_key]:
             if data.size > 0:
-                lengths = np.array([x.shape[0] for x in data])
+                if isinstance(data, PackedFeatures):
+                    lengths = data.lengths
+                else:
+                    lengths = np.array([x.shape[0] for x in data])
                 self.data[key][sub_key].extend([lengths])
                 break
 
@@ -372,7 +550,11 @@ class RasaModelData:
         }
 
     def as_tf_dataset(
-        self, batch_size: int, batch_strategy: Text = SEQUENCE, shuffle: bool = False
+        self,
+        batch_size: int,
+        batch_strategy: Text = SEQUENCE,
+        shuffle: bool = False,
+        num_workers: Optional[int] = None,
     ) -> tf.data.Dataset:
         """Create tf dataset.
 
@@ -380,19 +562,26 @@ class RasaModelData:
             batch_size: The batch size to use.
             batch_strategy: The batch strategy to use.
             shuffle: Boolean indicating whether the data should be shuffled or not.
+            num_workers: The number of threads which assemble the batches. Defaults to
+                the value of the `RASA_BATCH_WORKERS` environment variable.
 
         Returns:
             The tf.data.Dataset.
         """
 
+        if num_workers is None:
+            num_workers = rasa.utils.tensorflow.environment.number_of_batch_workers()
+
         shapes, types = self._get_shapes_types()
 
         return tf.data.Dataset.from_generator(
-            lambda batch_size_: self._gen_batch(batch_size_, batch_strategy, shuffle),
+            lambda batch_size_: self._gen_batch(
+                batch_size_, batch_strategy, shuffle, num_workers
+            ),
             output_types=types,
             output_shapes=shapes,
             args=([batch_size]),
-        )
+        ).prefetch(tf.data.experimental.AUTOTUNE)
 
     def prepare_batch(
         self,
@@ -440,7 +629,11 @@ class RasaModelData:
                     else:
                         _data = v[:]
 
-                    if isinstance(_data[0], scipy.sparse.spmatrix):
+                    if isinstance(_data, PackedSparseFeatures):
+                        batch_data.extend(_data.to_values())
+                    elif isinstance(_data, PackedDenseFeatures):
+                        batch_data.append(_data.padded())
+                    elif isinstance(_data[0], scipy.sparse.spmatrix):
                         batch_data.extend(self._scipy_matrix_to_values(_data))
                     else:
                         batch_data.append(self._pad_dense_data(_data))
@@ -501,13 +694,100 @@ class RasaModelData:
         ids = np.random.permutation(self.num_examples)
         return self._data_for_ids(data, ids)
 
-    def _balanced_data(self, data: Data, batch_size: int, shuffle: bool) -> Data:
-        """Mix model data to account for class imbalance.
+    def _should_balance(self, data: Data) -> bool:
+        """Checks whether the data can be balanced by its labels.
+
+        Args:
+            data: The data.
+
+        Returns:
+            `False` if there is no label key or the labels are token based.
+        """
+        self._check_label_key()
+
+        return not (
+            self.label_key is None
+            or self.label_sub_key is None
+            or data[self.label_key][self.label_sub_key][0][0].size > 1
+        )
+
+    def _balanced_ids(
+        self, label_ids: np.ndarray, batch_size: int, shuffle: bool
+    ) -> np.ndarray:
+        """Orders the examples to account for class imbalance.
 
         This batching strategy puts rare classes approximately in every other batch,
         by repeating them. Mimics stratified batching, but also takes into account
         that more populated classes should appear more often.
 
+        Args:
+            label_ids: The label of every example.
+            batch_size: The batch size.
+            shuffle: Boolean indicating whether to shuffle the order of the labels.
+
+        Returns:
+            The indices of the examples in balanced order.
+        """
+        _, label_index, counts_label_ids = np.unique(
+            label_ids, return_inverse=True, return_counts=True, axis=0
+        )
+        label_index = label_index.reshape(-1)
+        num_label_ids = len(counts_label_ids)
+
+        # group examples by their label, keeping their order within each label
+        ids_by_label = np.argsort(label_index, kind="stable")
+        label_offsets = np.concatenate([[0], np.cumsum(counts_label_ids)])
+
+        # every label is sampled cyclically in chunks of `chunk_sizes` examples
+        chunk_sizes = (counts_label_ids / self.num_examples * batch_size).astype(
+            np.int64
+        ) + 1
+        chunks_per_cycle = -(-counts_label_ids // chunk_sizes)
+
+        # in every round each label contributes one chunk until it was passed once,
+        # afterwards only every other round; stop as soon as all labels were passed
+        num_rounds = int(chunks_per_cycle.max())
+        rounds = np.arange(num_rounds)[:, np.newaxis]
+        rounds_after_cycle = rounds - chunks_per_cycle
+        takes_chunk = (rounds_after_cycle < 0) | (rounds_after_cycle % 2 == 1)
+        chunk_ids = (np.cumsum(takes_chunk, axis=0) - 1) % chunks_per_cycle
+
+        if shuffle:
+            label_order = np.stack(
+                [np.random.permutation(num_label_ids) for _ in range(num_rounds)]
+            )
+        else:
+            label_order = np.tile(np.arange(num_label_ids), (num_rounds, 1))
+
+        # the last round ends with the last label that is passed for the first time
+        is_last_to_finish = chunks_per_cycle[label_order[-1]] == num_rounds
+        last_position = np.flatnonzero(is_last_to_finish)[-1]
+
+        scheduled_labels = label_order.reshape(-1)[
+            : (num_rounds - 1) * num_label_ids + last_position + 1
+        ]
+        scheduled_rounds = np.arange(len(scheduled_labels)) // num_label_ids
+        is_taken = takes_chunk[scheduled_rounds, scheduled_labels]
+        scheduled_labels = scheduled_labels[is_taken]
+        scheduled_chunks = chunk_ids[scheduled_rounds[is_taken], scheduled_labels]
+
+        # expand the chunks into the indices of their examples
+        chunk_starts = scheduled_chunks * chunk_sizes[scheduled_labels]
+        chunk_lengths = np.minimum(
+            chunk_sizes[scheduled_labels],
+            counts_label_ids[scheduled_labels] - chunk_starts,
+        )
+        offsets = np.concatenate([[0], np.cumsum(chunk_lengths)])
+        positions = np.repeat(
+            label_offsets[scheduled_labels] + chunk_starts - offsets[:-1],
+            chunk_lengths,
+        ) + np.arange(offsets[-1])
+
+        return ids_by_label[positions]
+
+    def _balanced_data(self, data: Data, batch_size: int, shuffle: bool) -> Data:
+        """Mix model data to account for class imbalance.
+
         Args:
             data: The data.
             batch_size: The batch size.
@@ -516,110 +796,179 @@ class RasaModelData:
         Returns:
             The balanced data.
         """
-        self._check_label_key()
-
-        # skip balancing if labels are token based
-        if (
-            self.label_key is None
-            or self.label_sub_key is None
-            or data[self.label_key][self.label_sub_key][0][0].size > 1
-        ):
+        if not self._should_balance(data):
             return data
 
         label_ids = self._create_label_ids(data[self.label_key][self.label_sub_key][0])
 
-        unique_label_ids, counts_label_ids = np.unique(
-            label_ids, return_counts=True, axis=0
+        return self._data_for_ids(
+            data, self._balanced_ids(label_ids, batch_size, shuffle)
         )
-        num_label_ids = len(unique_label_ids)
 
-        # group data points by their label
-        # need to call every time, so that the data is shuffled inside each class
-        data_by_label = self._split_by_label_ids(data, label_ids, unique_label_ids)
+    def _batch_ids(
+        self, batch_size: int, batch_strategy: Text = SEQUENCE, shuffle: bool = False
+    ) -> List[np.ndarray]:
+        """Plans the batches of one epoch.
 
-        # running index inside each data grouped by labels
-        data_idx = [0] * num_label_ids
-        # number of cycles each label was passed
-        num_data_cycles = [0] * num_label_ids
-        # if a label was skipped in current batch
-        skipped = [False] * num_label_ids
+        Args:
+            batch_size: The batch size
+            batch_strategy: The batch strategy.
+            shuffle: Boolean indicating whether to shuffle the data or not.
 
-        new_data = defaultdict(lambda: defaultdict(list))
+        Returns:
+            The indices of the examples of every batch.
+        """
 
-        while min(num_data_cycles) == 0:
-            if shuffle:
-                indices_of_labels = np.random.permutation(num_label_ids)
-            else:
-                indices_of_labels = range(num_label_ids)
+        if shuffle:
+            ids = np.random.permutation(self.num_examples)
+        else:
+            ids = np.arange(self.num_examples)
 
-            for index in indices_of_labels:
-                if num_data_cycles[index] > 0 and not skipped[index]:
-                    skipped[index] = True
-                    continue
+        if batch_strategy in [BALANCED, BUCKETED] and self._should_balance(self.data):
+            label_ids = self._create_label_ids(
+                self.data[self.label_key][self.label_sub_key][0][ids]
+            )
+            # after balancing, number of examples increased
+            ids = ids[self._balanced_ids(label_ids, batch_size, shuffle)]
 
-                skipped[index] = False
+        if batch_strategy == BUCKETED:
+            return self._bucketed_batch_ids(ids, batch_size, shuffle)
 
-                index_batch_size = (
-                    int(counts_label_ids[index] / self.num_examples * batch_size) + 1
-                )
+        return [
+            ids[start : start + batch_size] for start in range(0, len(ids), batch_size)
+        ]
 
-                for key, attribute_data in data_by_label[index].items():
-                    for sub_key, features in attribute_data.items():
-                        for i, f in enumerate(features):
-                            if len(new_data[key][sub_key]) < i + 1:
-                                new_data[key][sub_key].append([])
-                            new_data[key][sub_key][i].append(
-                                f[data_idx[index] : data_idx[index] + index_batch_size]
-                            )
-
-                data_idx[index] += index_batch_size
-                if data_idx[index] >= counts_label_ids[index]:
-                    num_data_cycles[index] += 1
-                    data_idx[index] = 0
-
-                if min(num_data_cycles) > 0:
-                    break
-
-        final_data = defaultdict(lambda: defaultdict(list))
-        for key, attribute_data in new_data.items():
-            for sub_key, features in attribute_data.items():
-                for f in features:
-                    final_data[key][sub_key].append(np.concatenate(np.array(f)))
+    def _sequence_lengths(self) -> List[np.ndarray]:
+        """Returns the sequence length of every example for each sequence feature."""
+        return [
+            f.lengths
+            for attribute_data in self.data.values()
+            for features in attribute_data.values()
+            for f in features
+            if isinstance(f, PackedFeatures)
+        ]
+
+    def _bucketed_batch_ids(
+        self, ids: np.ndarray, batch_size: int, shuffle: bool
+    ) -> List[np.ndarray]:
+        """Groups examples of similar sequence length into the same batches.
+
+        The examples are sorted by their total sequence length within windows of
+        `BATCHES_PER_BUCKETING_WINDOW` batches, so that the composition of the
+        planned (e.g. balanced) epoch is kept locally. The order of the resulting
+        batches is shuffled.
+
+        Args:
+            ids: The planned order of the examples.
+            batch_size: The batch size.
+            shuffle: Boolean indicating whether to shuffle the batches or not.
+
+        Returns:
+            The indices of the examples of every batch.
+        """
+        sequence_lengths = self._sequence_lengths()
+        if sequence_lengths:
+            lengths = np.sum(sequence_lengths, axis=0)[ids]
+        else:
+            lengths = np.zeros(len(ids), dtype=np.int64)
+
+        window_size = batch_size * BATCHES_PER_BUCKETING_WINDOW
+        batch_ids = []
+        for window_start in range(0, len(ids), window_size):
+            window = slice(window_start, window_start + window_size)
+            window_ids = ids[window][np.argsort(lengths[window], kind="stable")]
+            batch_ids.extend(
+                window_ids[start : start + batch_size]
+                for start in range(0, len(window_ids), batch_size)
+            )
+
+        if shuffle:
+            batch_ids = [batch_ids[i] for i in np.random.permutation(len(batch_ids))]
 
-        return final_data
+        return batch_ids
+
+    def _padding_ratio(self, batch_ids: List[np.ndarray]) -> float:
+        """Calculates the fraction of padded positions in the sequence features.
+
+        Args:
+            batch_ids: The indices of the examples of every batch.
+
+        Returns:
+            The number of padded positions divided by the number of all positions
+            of the padded sequence features.
+        """
+        sequence_lengths = self._sequence_lengths()
+        if not batch_ids or not sequence_lengths:
+            return 0.0
+
+        ids = np.concatenate(batch_ids)
+        batch_sizes = np.array([len(batch) for batch in batch_ids])
+        batch_starts = np.concatenate([[0], np.cumsum(batch_sizes)[:-1]])
+
+        number_of_positions = 0
+        number_of_padded_positions = 0
+        for lengths in sequence_lengths:
+            batch_lengths = lengths[ids]
+            max_lengths = np.maximum.reduceat(batch_lengths, batch_starts)
+            positions = np.sum(max_lengths * batch_sizes)
+            number_of_positions += positions
+            number_of_padded_positions += positions - np.sum(batch_lengths)
+
+        if number_of_positions == 0:
+            return 0.0
+
+        return number_of_padded_positions / number_of_positions
+
+    def _prepare_batch_for_ids(self, ids: np.ndarray) -> Tuple[Optional[np.ndarray]]:
+        """Prepares the batch which consists of the examples with the given indices."""
+        return self.prepare_batch(self._data_for_ids(self.data, ids))
 
     def _gen_batch(
-        self, batch_size: int, batch_strategy: Text = SEQUENCE, shuffle: bool = False
+        self,
+        batch_size: int,
+        batch_strategy: Text = SEQUENCE,
+        shuffle: bool = False,
+        num_workers: int = 1,
     ) -> Generator[Tuple[Optional[np.ndarray]], None, None]:
         """Generate batches.
 
+        The batches of an epoch are planned upfront. With several workers, the
+        batches are assembled in parallel threads ahead of time and yielded in order.
+
         Args:
             batch_size: The batch size
             batch_strategy: The batch strategy.
             shuffle: Boolean indicating whether to shuffle the data or not.
+            num_workers: The number of threads which assemble the batches.
 
         Returns:
             A generator over the batches.
         """
 
-        data = self.data
-        num_examples = self.num_examples
+        batch_ids = self._batch_ids(batch_size, batch_strategy, shuffle)
 
-        if shuffle:
-            data = self._shuffled_data(data)
-
-        if batch_strategy == BALANCED:
-            data = self._balanced_data(data, batch_size, shuffle)
-            # after balancing, number of examples increased
-            num_examples = self.number_of_examples(data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Created {len(batch_ids)} batches using the '{batch_strategy}' "
+                f"batch strategy. {self._padding_ratio(batch_ids):.1%} of the "
+                f"sequence features are padding."
+            )
 
-        num_batches = num_examples // batch_size + int(num_examples % batch_size > 0)
+        if num_workers <= 1 or len(batch_ids) <= 1:
+            for ids in batch_ids:
+                yield self._prepare_batch_for_ids(ids)
+            return
 
-        for batch_num in range(num_batches):
-            start = batch_num * batch_size
-            end = start + batch_size
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            pending: Deque[Future] = deque()
+            for ids in batch_ids:
+                pending.append(pool.submit(self._prepare_batch_for_ids, ids))
+                # limit the number of batches which are kept in memory
+                if len(pending) > 2 * num_workers:
+                    yield pending.popleft().result()
 
-            yield self.prepare_batch(data, start, end)
+            while pending:
+                yield pending.popleft().result()
 
     def _check_train_test_sizes(
         self, number_of_test_examples: int, label_counts: Dict[Any, int]
@@ -758,11 +1107,46 @@ class RasaModelData:
             RasaModelData(self.label_key, self.label_sub_key, data_val),
         )
 
+    @staticmethod
+    def _pack(features: Any) -> Any:
+        """Packs an object array of per-example sequence features.
+
+        Args:
+            features: The features of all examples.
+
+        Returns:
+            `PackedFeatures` in case the features contain sparse matrices or dense
+            sequence features for every example, otherwise the unchanged features.
+        """
+        if (
+            not isinstance(features, np.ndarray)
+            or features.dtype != object
+            or features.size == 0
+        ):
+            return features
+
+        if all(isinstance(f, scipy.sparse.spmatrix) for f in features):
+            return PackedSparseFeatures.from_examples(features)
+        if all(isinstance(f, np.ndarray) and f.ndim == 2 for f in features):
+            return PackedDenseFeatures.from_examples(features)
+
+        return features
+
+    @staticmethod
+    def _concatenate(
+        features: List[Union[np.ndarray, PackedFeatures]]
+    ) -> Union[np.ndarray, PackedFeatures]:
+        """Concatenates features along the example axis."""
+        if isinstance(features[0], PackedFeatures):
+            return type(features[0]).concatenate(features)
+
+        return np.concatenate(features)
+
     @staticmethod
     def _combine_features(
-        feature_1: Union[np.ndarray, scipy.sparse.spmatrix],
-        feature_2: Union[np.ndarray, scipy.sparse.spmatrix],
-    ) -> Union[np.ndarray, scipy.sparse.spmatrix]:
+        feature_1: Union[np.ndarray, scipy.sparse.spmatrix, PackedFeatures],
+        feature_2: Union[np.ndarray, scipy.sparse.spmatrix, PackedFeatures],
+    ) -> Union[np.ndarray, scipy.sparse.spmatrix, PackedFeatures]:
         """Concatenate features.
 
         Args:
@@ -773,6 +1157,11 @@ class RasaModelData:
             The combined features.
         """
 
+        if isinstance(feature_1, PackedFeatures):
+            if len(feature_2) == 0:
+                return feature_1
+            return type(feature_1).concatenate([feature_1, feature_2])
+
         if isinstance(feature_1, scipy.sparse.spmatrix) and isinstance(
             feature_2, scipy.sparse.spmatrix
         ):
@@ -18,6 +18,7 @@ from unittest.mock import Mock
 
 import rasa.shared.utils.io
 from rasa import server
+from rasa.constants import ENV_TRAINING_DATA_CACHE_DIRECTORY
 from rasa.core import config
 from rasa.core.agent import Agent, load_agent
 from rasa.core.brokers.broker import EventBroker
@@ -63,6 +64,14 @@ def event_loop(request: Request) -> Iterator[asyncio.AbstractEventLoop]:
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def training_data_cache_directory(tmpdir_factory: TempdirFactory) -> Text:
+    # don't let tests read or pollute the training data cache of the user
+    cache_directory = tmpdir_factory.mktemp("training_data_cache").strpath
+    os.environ[ENV_TRAINING_DATA_CACHE_DIRECTORY] = cache_directory
+    return cache_directory
+
+
 @pytest.fixture(scope="session")
 async def _trained_default_agent(tmpdir_factory: TempdirFactory) -> Agent:
     model_path = tmpdir_factory.mktemp("model").strpath
@@ -1,9 +1,12 @@
 import json
 import logging
+import threading
+import time
 from pathlib import Path
 import textwrap
 
-from typing import Union, Text, List, Optional, Type
+from typing import Any, Dict, Union, Text, List, Optional, Tuple, Type
+from unittest.mock import Mock
 
 import pytest
 from _pytest.logging import LogCaptureFixture
@@ -120,6 +123,154 @@ def test_sql_broker_logs_to_sql_db():
     assert events_types == ["user", "slot", "restart"]
 
 
+def test_sql_broker_publish_many():
+    broker = SQLEventBroker(db=":memory:", max_batch_size=2)
+
+    broker.publish_many([e.as_dict() for e in TEST_EVENTS])
+
+    with broker.session_scope() as session:
+        events_types = [
+            json.loads(event.data)["event"]
+            for event in session.query(broker.SQLBrokerEvent).all()
+        ]
+
+    assert events_types == ["user", "slot", "restart"]
+
+
+def test_sql_broker_publishes_in_background(tmp_path: Path):
+    broker = SQLEventBroker(db=str(tmp_path / "events.db"), publish_in_background=True)
+
+    for e in TEST_EVENTS:
+        broker.publish(e.as_dict())
+    broker.close()
+
+    with broker.session_scope() as session:
+        events_types = [
+            json.loads(event.data)["event"]
+            for event in session.query(broker.SQLBrokerEvent).all()
+        ]
+
+    assert events_types == ["user", "slot", "restart"]
+
+
+def test_pika_publish_batch_retries_unpublished_events(monkeypatch: MonkeyPatch):
+    # patch PikaEventBroker so it doesn't try to connect to RabbitMQ on init
+    monkeypatch.setattr(PikaEventBroker, "_run_pika", lambda _: None)
+    pika_producer = PikaEventBroker("", "", "", queues=["queue"])
+
+    published = []
+
+    def publish(body: Text, _: Optional[Dict[Text, Text]] = None) -> None:
+        if len(published) == 1 and not failures:
+            failures.append(body)
+            raise ConnectionError()
+        published.append(json.loads(body)["event"])
+
+    failures = []
+    monkeypatch.setattr(pika_producer, "_publish", publish)
+
+    pika_producer.publish_batch(
+        [e.as_dict() for e in TEST_EVENTS], retry_delay_in_seconds=0
+    )
+
+    assert published == ["user", "slot", "restart"]
+    assert len(failures) == 1
+
+
+def test_pika_publishes_in_background(monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(PikaEventBroker, "_run_pika", lambda _: None)
+    pika_producer = PikaEventBroker("", "", "", publish_in_background=True)
+
+    published = []
+    monkeypatch.setattr(
+        pika_producer, "_publish", lambda body, headers: published.append(body)
+    )
+
+    for e in TEST_EVENTS:
+        pika_producer.publish(e.as_dict())
+    pika_producer._background_publisher.flush()
+
+    assert [json.loads(body)["event"] for body in published] == [
+        "user",
+        "slot",
+        "restart",
+    ]
+
+
+@pytest.mark.parametrize(
+    "confirmation, expected_republished",
+    [
+        ("Basic.Ack", []),
+        ("Basic.Nack", [("1", None), ("2", {"rasa-export-process-id": "id"})]),
+    ],
+)
+def test_pika_delivery_confirmation(
+    monkeypatch: MonkeyPatch,
+    confirmation: Text,
+    expected_republished: List[Tuple[Text, Optional[Dict[Text, Text]]]],
+):
+    monkeypatch.setattr(PikaEventBroker, "_run_pika", lambda _: None)
+    pika_producer = PikaEventBroker("", "", "", queues=["queue"], confirm_delivery=True)
+    pika_producer._unconfirmed_messages = {
+        1: ("1", None),
+        2: ("2", {"rasa-export-process-id": "id"}),
+        3: ("3", None),
+    }
+
+    republished = []
+    monkeypatch.setattr(
+        pika_producer, "_publish", lambda *message: republished.append(message)
+    )
+
+    pika_producer._on_delivery_confirmation(
+        Mock(method=Mock(NAME=confirmation, multiple=True, delivery_tag=2))
+    )
+
+    assert republished == expected_republished
+    assert pika_producer._unconfirmed_messages == {3: ("3", None)}
+
+
+def test_pika_delivery_confirmation_of_messages_published_concurrently(
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setattr(PikaEventBroker, "_run_pika", lambda _: None)
+    monkeypatch.setattr(PikaEventBroker, "_get_message_properties", lambda *_: None)
+    pika_producer = PikaEventBroker("", "", "", queues=["queue"], confirm_delivery=True)
+    pika_producer._pika_connection = Mock(is_closed=False)
+
+    received = []
+
+    def basic_publish(body: bytes, **_: Any) -> None:
+        received.append(body.decode())
+        if len(received) == 1:
+            # give the other thread the chance to publish in between
+            time.sleep(0.1)
+
+    pika_producer.channel = Mock(basic_publish=basic_publish)
+
+    threads = [
+        threading.Thread(target=pika_producer._publish, args=(body, {"id": body}))
+        for body in ["1", "2"]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    republished = []
+    monkeypatch.setattr(
+        pika_producer, "_publish", lambda *message: republished.append(message)
+    )
+    pika_producer._on_delivery_confirmation(
+        Mock(method=Mock(NAME="Basic.Nack", multiple=False, delivery_tag=1))
+    )
+
+    assert republished == [(received[0], {"id": received[0]})]
+    assert pika_producer._unconfirmed_messages == {
+        2: (received[1], {"id": received[1]})
+    }
+
+
 def test_file_broker_from_config(tmp_path: Path):
     # backslashes need to be encoded (windows...) otherwise we run into unicode issues
     path = str(tmp_path / "rasa_test_event.log").replace("\\", "\\\\")
@@ -1,6 +1,6 @@
 import uuid
 from pathlib import Path
-from typing import Optional, Dict, Any, Text, List
+from typing import Optional, Dict, Any, Iterable, Iterator, Text, List
 from unittest.mock import Mock
 
 import pytest
@@ -9,6 +9,7 @@ import rasa.shared.utils.io
 from rasa.shared.core.constants import ACTION_SESSION_START_NAME
 from rasa.shared.core.domain import Domain
 
+from rasa.core.brokers.broker import DEFAULT_MAX_BATCH_SIZE
 from rasa.core.brokers.pika import PikaEventBroker
 from rasa.core.brokers.sql import SQLEventBroker
 from rasa.core.constants import RASA_EXPORT_PROCESS_ID_HEADER_NAME
@@ -88,14 +89,17 @@ def test_fetch_events_within_time_range():
     event_3 = random_user_uttered_event(1)
     events = {conversation_ids[0]: [event_1, event_2], conversation_ids[1]: [event_3]}
 
-    def _get_tracker(conversation_id: Text) -> DialogueStateTracker:
-        return DialogueStateTracker.from_events(
-            conversation_id, events[conversation_id]
-        )
+    def _get_trackers(
+        conversation_ids: Iterable[Text],
+    ) -> Iterator[DialogueStateTracker]:
+        for conversation_id in conversation_ids:
+            yield DialogueStateTracker.from_events(
+                conversation_id, events[conversation_id]
+            )
 
     # create mock tracker store
     tracker_store = Mock()
-    tracker_store.retrieve.side_effect = _get_tracker
+    tracker_store.retrieve_many.side_effect = _get_trackers
     tracker_store.keys.return_value = conversation_ids
 
     exporter = MockExporter(tracker_store)
@@ -115,9 +119,9 @@ def test_fetch_events_within_time_range():
 
 
 def test_fetch_events_within_time_range_tracker_does_not_err():
-    # create mock tracker store that returns `None` on `retrieve()`
+    # create mock tracker store that does not find any tracker on `retrieve_many()`
     tracker_store = Mock()
-    tracker_store.retrieve.return_value = None
+    tracker_store.retrieve_many.return_value = iter([])
     tracker_store.keys.return_value = [uuid.uuid4()]
 
     exporter = MockExporter(tracker_store)
@@ -129,10 +133,10 @@ def test_fetch_events_within_time_range_tracker_does_not_err():
 
 
 def test_fetch_events_within_time_range_tracker_contains_no_events():
-    # create mock tracker store that returns `None` on `retrieve()`
+    # create mock tracker store that returns a tracker without events
     tracker_store = Mock()
-    tracker_store.retrieve.return_value = DialogueStateTracker.from_events(
-        "a great ID", []
+    tracker_store.retrieve_many.return_value = iter(
+        [DialogueStateTracker.from_events("a great ID", [])]
     )
     tracker_store.keys.return_value = ["a great ID"]
 
@@ -248,14 +252,14 @@ def test_publish_with_headers_pika_event_broker():
     exporter = MockExporter(event_broker=event_broker)
 
     headers = {"some": "header"}
-    event = {"some": "event"}
+    events = [{"some": "event"}]
 
     # noinspection PyProtectedMember
-    exporter._publish_with_message_headers(event, headers)
+    exporter._publish_with_message_headers(events, headers)
 
-    # the `PikaEventBroker`'s `publish()` method was called with both
-    # the `event` and `headers` arguments
-    event_broker.publish.assert_called_with(event=event, headers=headers)
+    # the `PikaEventBroker`'s `publish_batch()` method was called with both
+    # the `events` and `headers` arguments
+    event_broker.publish_batch.assert_called_with(events, headers=headers)
 
 
 def test_publish_with_headers_non_pika_event_broker():
@@ -263,20 +267,20 @@ def test_publish_with_headers_non_pika_event_broker():
     exporter = MockExporter(event_broker=event_broker)
 
     headers = {"some": "header"}
-    event = {"some": "event"}
+    events = [{"some": "event"}]
 
     # noinspection PyProtectedMember
-    exporter._publish_with_message_headers(event, headers)
+    exporter._publish_with_message_headers(events, headers)
 
-    # the `SQLEventBroker`'s `publish()` method was called with only the `event`
-    # argument
-    event_broker.publish.assert_called_with(event)
+    # the `SQLEventBroker`'s `publish_many()` method was called with only the
+    # `events` argument
+    event_broker.publish_many.assert_called_with(events)
 
 
 def test_publishing_error():
-    # mock event broker so it raises on `publish()`
+    # mock event broker so it raises on `publish_many()`
     event_broker = Mock()
-    event_broker.publish.side_effect = ValueError()
+    event_broker.publish_many.side_effect = ValueError()
 
     exporter = MockExporter(event_broker=event_broker)
 
@@ -290,3 +294,24 @@ def test_publishing_error():
     with pytest.raises(PublishingError):
         # noinspection PyProtectedMember
         exporter.publish_events()
+
+
+def test_publish_events_in_batches():
+    event_broker = Mock(SQLEventBroker)
+    exporter = MockExporter(event_broker=event_broker)
+
+    events = []
+    for timestamp in range(DEFAULT_MAX_BATCH_SIZE + 1):
+        event = random_user_uttered_event(timestamp).as_dict()
+        event["sender_id"] = uuid.uuid4().hex
+        events.append(event)
+
+    # noinspection PyProtectedMember
+    exporter._fetch_events_within_time_range = Mock(return_value=events)
+
+    assert exporter.publish_events() == len(events)
+
+    assert [call[0][0] for call in event_broker.publish_many.call_args_list] == [
+        events[:DEFAULT_MAX_BATCH_SIZE],
+        events[DEFAULT_MAX_BATCH_SIZE:],
+    ]
@@ -1,11 +1,32 @@
-from typing import Text
-from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
+from typing import List, Optional, Text, Tuple
+
+import jsonpickle
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.constants import ENV_TRACKER_FEATURIZATION_WORKERS
+from rasa.core.featurizers.tracker_featurizers import (
+    MaxHistoryTrackerFeaturizer,
+    TrackerFeaturizer,
+    share_training_data,
+)
 from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
 from rasa.shared.core.domain import Domain
 import numpy as np
-from rasa.shared.nlu.constants import ACTION_TEXT, ACTION_NAME, ENTITIES, TEXT, INTENT
-from rasa.shared.core.constants import ACTIVE_LOOP, SLOTS
-from rasa.shared.nlu.interpreter import RegexInterpreter
+from rasa.shared.nlu.constants import (
+    ACTION_TEXT,
+    ACTION_NAME,
+    ENTITIES,
+    FEATURE_TYPE_SENTENCE,
+    TEXT,
+    INTENT,
+)
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, ACTIVE_LOOP, SLOTS
+from rasa.shared.core.events import ActionExecuted, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter, RegexInterpreter
+from rasa.shared.nlu.training_data.features import Features
+from rasa.shared.nlu.training_data.message import Message
 import scipy.sparse
 
 
@@ -255,3 +276,198 @@ def test_single_state_featurizer_with_interpreter_state_with_no_action_name(
     assert (
         encoded[ACTIVE_LOOP][0].features != scipy.sparse.coo_matrix([[0, 0, 0, 1]])
     ).nnz == 0
+
+
+def test_single_state_featurizer_encode_all_states():
+    f = SingleStateFeaturizer()
+    f._default_feature_states[INTENT] = {"a": 0, "b": 1}
+    f._default_feature_states[ENTITIES] = {"c": 0}
+    f._default_feature_states[ACTION_NAME] = {"d": 0, "action_listen": 1}
+    f._default_feature_states[SLOTS] = {"e_0": 0, "f_0": 1}
+    f._default_feature_states[ACTIVE_LOOP] = {"h": 0}
+
+    state = {
+        "user": {"intent": "a", "entities": ("c",)},
+        "prev_action": {"action_name": "action_listen"},
+        "slots": {"e": (1.0,)},
+    }
+    states = [
+        state,
+        {"prev_action": {"action_name": "d"}, "active_loop": {"name": "h"}},
+        # identical to the first state
+        {
+            "user": {"intent": "a", "entities": ("c",)},
+            "prev_action": {"action_name": "action_listen"},
+            "slots": {"e": (1.0,)},
+        },
+        # user input is ignored as the previous action is not action_listen
+        {"user": {"intent": "b"}, "prev_action": {"action_name": "d"}},
+        # unhashable sub states can't be interned
+        {
+            "user": {"intent": "a", "entities": ["c"]},
+            "prev_action": {"action_name": "d"},
+        },
+        state,
+    ]
+
+    encoded_states = f.encode_all_states(states, RegexInterpreter())
+
+    assert len(encoded_states) == len(states)
+    for state, encoded in zip(states, encoded_states):
+        expected = f.encode_state(state, RegexInterpreter())
+        assert list(encoded.keys()) == list(expected.keys())
+        for attribute, features in encoded.items():
+            assert len(features) == len(expected[attribute])
+            for actual, expected_features in zip(features, expected[attribute]):
+                assert (actual.features != expected_features.features).nnz == 0
+
+    # identical states share their features
+    assert encoded_states[0] is encoded_states[2] is encoded_states[5]
+    assert encoded_states[1][ACTION_NAME] is encoded_states[3][ACTION_NAME]
+
+
+class CountingInterpreter(NaturalLanguageInterpreter):
+    def __init__(self) -> None:
+        self.featurized = []
+
+    def featurize_message(self, message: Message) -> Optional[Message]:
+        for attribute, value in message.data.items():
+            self.featurized.append((attribute, value))
+            message.add_features(
+                Features(
+                    np.array([[len(value)]]),
+                    FEATURE_TYPE_SENTENCE,
+                    attribute,
+                    "CountingInterpreter",
+                )
+            )
+        return message
+
+
+def test_single_state_featurizer_caches_interpreter_features():
+    f = SingleStateFeaturizer()
+    f._default_feature_states[INTENT] = {"a": 0, "b": 1}
+    f._default_feature_states[ACTION_NAME] = {"c": 0, "action_listen": 1}
+    interpreter = CountingInterpreter()
+
+    states = [
+        {
+            "user": {"intent": "a", "text": "hello"},
+            "prev_action": {"action_name": "action_listen"},
+        },
+        {"user": {"intent": "a"}, "prev_action": {"action_name": "action_listen"}},
+        {"prev_action": {"action_name": "c"}},
+    ]
+    encoded = f.encode_all_states(states, interpreter)
+    f.encode_all_states(states, interpreter)
+    f.encode_all_actions(Domain.from_yaml("actions:\n- c"), interpreter)
+
+    # every (attribute, value) pair is featurized only once
+    assert len(interpreter.featurized) == len(set(interpreter.featurized))
+    assert {
+        (ACTION_NAME, "action_listen"),
+        (ACTION_NAME, "c"),
+        (INTENT, "a"),
+        (TEXT, "hello"),
+    } <= set(interpreter.featurized)
+    assert encoded[0][TEXT][0].features[0, 0] == len("hello")
+    assert encoded[0][INTENT] is encoded[1][INTENT]
+
+    # features of a different interpreter are not reused
+    other_interpreter = CountingInterpreter()
+    f.encode_all_states(states[2:], other_interpreter)
+    assert other_interpreter.featurized == [(ACTION_NAME, "c")]
+
+
+def test_single_state_featurizer_does_not_persist_cached_features():
+    f = SingleStateFeaturizer()
+    f._default_feature_states[ACTION_NAME] = {"c": 0}
+    f.encode_all_states([{"prev_action": {"action_name": "c"}}], CountingInterpreter())
+
+    loaded = jsonpickle.decode(jsonpickle.encode(f))
+
+    assert loaded._default_feature_states == f._default_feature_states
+    assert len(loaded._featurization_cache) == 0
+
+
+def _domain_and_trackers() -> Tuple[Domain, List[DialogueStateTracker]]:
+    domain = Domain.from_yaml(
+        """
+intents:
+- greet
+- goodbye
+actions:
+- utter_greet
+- utter_goodbye
+"""
+    )
+    trackers = []
+    for i in range(10):
+        events = [ActionExecuted(ACTION_LISTEN_NAME)]
+        for turn in range(i % 4 + 1):
+            intent = "greet" if (i + turn) % 3 else "goodbye"
+            events += [
+                UserUttered(intent, intent={"name": intent}),
+                ActionExecuted(f"utter_{intent}"),
+                ActionExecuted(ACTION_LISTEN_NAME),
+            ]
+        trackers.append(DialogueStateTracker.from_events(str(i), events, domain.slots))
+
+    return domain, trackers
+
+
+@pytest.mark.parametrize("max_history", [None, 2])
+def test_max_history_featurizer_in_parallel(
+    max_history: Optional[int], monkeypatch: MonkeyPatch
+):
+    domain, trackers = _domain_and_trackers()
+
+    featurizer = MaxHistoryTrackerFeaturizer(max_history=max_history)
+    expected = featurizer.training_states_and_actions(trackers, domain)
+
+    monkeypatch.setenv(ENV_TRACKER_FEATURIZATION_WORKERS, "2")
+    actual = featurizer.training_states_and_actions(trackers, domain)
+
+    assert actual == expected
+
+
+def test_featurizers_share_training_examples(monkeypatch: MonkeyPatch):
+    domain, trackers = _domain_and_trackers()
+    expected = MaxHistoryTrackerFeaturizer(max_history=2).training_states_and_actions(
+        trackers, domain
+    )
+
+    featurized_trackers = []
+    training_examples = MaxHistoryTrackerFeaturizer._training_examples
+
+    def counting_training_examples(
+        featurizer: MaxHistoryTrackerFeaturizer,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+    ):
+        featurized_trackers.append(tracker)
+        return training_examples(featurizer, tracker, domain)
+
+    monkeypatch.setattr(
+        MaxHistoryTrackerFeaturizer, "_training_examples", counting_training_examples
+    )
+
+    with share_training_data():
+        MaxHistoryTrackerFeaturizer(max_history=2).training_states_and_actions(
+            trackers[:5], domain
+        )
+        actual = MaxHistoryTrackerFeaturizer(
+            SingleStateFeaturizer(), max_history=2
+        ).training_states_and_actions(trackers, domain)
+        MaxHistoryTrackerFeaturizer(max_history=3).training_states_and_actions(
+            trackers[:1], domain
+        )
+
+    assert actual == expected
+    assert featurized_trackers == trackers + trackers[:1]
+
+    # nothing is shared outside of the context
+    MaxHistoryTrackerFeaturizer(max_history=2).training_states_and_actions(
+        trackers[:1], domain
+    )
+    assert featurized_trackers == trackers + trackers[:1] * 2
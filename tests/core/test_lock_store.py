@@ -135,6 +135,37 @@ def test_lock_expiration(lock_store: LockStore):
     assert lock.issue_ticket(10) == 1
 
 
+@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+def test_cleanup_keeps_lock_if_someone_waiting(lock_store: LockStore):
+    conversation_id = "my id 3"
+
+    ticket_0 = lock_store.issue_ticket(conversation_id, 10)
+    ticket_1 = lock_store.issue_ticket(conversation_id, 10)
+
+    lock_store.cleanup(conversation_id, ticket_0)
+
+    lock = lock_store.get_lock(conversation_id)
+    assert lock.now_serving == ticket_1
+
+    lock_store.cleanup(conversation_id, ticket_1)
+
+    assert lock_store.get_lock(conversation_id) is None
+
+
+async def test_redis_lock_store_round_trips(monkeypatch: MonkeyPatch):
+    lock_store = FakeRedisLockStore()
+    get = Mock(wraps=lock_store.red.get)
+    monkeypatch.setattr(lock_store.red, "get", get)
+
+    async with lock_store.lock("some sender") as lock:
+        assert lock.now_serving == 0
+
+    # the lock is only read to issue the ticket and to clean up, since saving the
+    # ticket and checking whether it can be served are pipelined
+    assert get.call_count == 2
+    assert lock_store.get_lock("some sender") is None
+
+
 async def test_multiple_conversation_ids(default_agent: Agent):
     text = INTENT_MESSAGE_PREFIX + 'greet{"name":"Rasa"}'
 
@@ -32,7 +32,7 @@ from rasa.core.policies import SimplePolicyEnsemble
 from rasa.core.policies.ted_policy import TEDPolicy
 from rasa.core.processor import MessageProcessor
 from rasa.shared.core.slots import Slot
-from rasa.core.tracker_store import InMemoryTrackerStore
+from rasa.core.tracker_store import InMemoryTrackerStore, WriteBehindTrackerStore
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.constants import INTENT_NAME_KEY
 from rasa.utils.endpoints import EndpointConfig
@@ -228,6 +228,33 @@ async def test_reminder_aborted(
     assert len(t.events) == 3  # nothing should have been executed
 
 
+async def test_reminder_flushes_write_behind_tracker_store(
+    default_channel: CollectingOutputChannel, default_processor: MessageProcessor
+):
+    sender_id = uuid.uuid4().hex
+    tracker_store = default_processor.tracker_store
+    default_processor.tracker_store = WriteBehindTrackerStore(tracker_store)
+
+    reminder = ReminderScheduled("remind", datetime.datetime.now())
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    tracker.update(reminder)
+    tracker_store.save(tracker)
+
+    try:
+        await default_processor.handle_reminder(
+            reminder, sender_id, default_channel, default_processor.nlg
+        )
+    finally:
+        default_processor.tracker_store = tracker_store
+
+    # the reminder was written to the wrapped tracker store right away
+    t = tracker_store.retrieve(sender_id)
+    assert t.events[-2] == UserUttered(
+        f"{EXTERNAL_MESSAGE_PREFIX}remind",
+        intent={INTENT_NAME_KEY: "remind", IS_EXTERNAL: True},
+    )
+
+
 async def wait_until_all_jobs_were_executed(
     timeout_after_seconds: Optional[float] = None,
 ) -> None:
@@ -496,7 +523,7 @@ async def test_update_tracker_session(
     await default_processor._update_tracker_session(tracker, default_channel)
 
     # the save is not called in _update_tracker_session()
-    default_processor._save_tracker(tracker)
+    await default_processor._save_tracker(tracker)
 
     # inspect tracker and make sure all events are present
     tracker = default_processor.tracker_store.retrieve(sender_id)
@@ -527,7 +554,7 @@ async def test_update_tracker_session_with_metadata(
     await default_processor._update_tracker_session(tracker, default_channel, metadata)
 
     # the save is not called in _update_tracker_session()
-    default_processor._save_tracker(tracker)
+    await default_processor._save_tracker(tracker)
 
     # inspect tracker events and make sure SessionStarted event is present
     # and has metadata.
@@ -565,7 +592,7 @@ async def test_update_tracker_session_with_slots(
     await default_processor._update_tracker_session(tracker, default_channel)
 
     # the save is not called in _update_tracker_session()
-    default_processor._save_tracker(tracker)
+    await default_processor._save_tracker(tracker)
 
     # inspect tracker and make sure all events are present
     tracker = default_processor.tracker_store.retrieve(sender_id)
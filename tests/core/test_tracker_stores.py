@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -9,16 +11,29 @@ import uuid
 from _pytest.capture import CaptureFixture
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
+from boto3.dynamodb.conditions import Key
 from moto import mock_dynamodb2
 from rasa.shared.constants import DEFAULT_SENDER_ID
 from sqlalchemy.dialects.postgresql.base import PGDialect
 from sqlalchemy.dialects.sqlite.base import SQLiteDialect
 from sqlalchemy.dialects.oracle.base import OracleDialect
 from sqlalchemy.engine.url import URL
-from typing import Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
+from typing import (
+    Any,
+    Tuple,
+    Text,
+    Type,
+    Dict,
+    List,
+    Union,
+    Optional,
+    ContextManager,
+    Iterator,
+)
 from unittest.mock import Mock
 
 import rasa.core.tracker_store
+from rasa.core.brokers.broker import EventBroker
 from rasa.shared.core.constants import ACTION_LISTEN_NAME, ACTION_SESSION_START_NAME
 from rasa.core.constants import POSTGRESQL_SCHEMA
 from rasa.shared.core.domain import Domain
@@ -38,6 +53,9 @@ from rasa.core.tracker_store import (
     SQLTrackerStore,
     DynamoTrackerStore,
     FailSafeTrackerStore,
+    WriteBehindTrackerStore,
+    MAX_EVENTS_PER_DYNAMO_ITEM,
+    MONGO_SESSION_START_INDEX_KEY,
 )
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
@@ -92,6 +110,124 @@ def test_dynamo_tracker_floats():
     assert retrieved_timestamp == timestamp
 
 
+def _dynamo_items(tracker_store: DynamoTrackerStore, sender_id: Text) -> List[Dict]:
+    return tracker_store.db.query(
+        KeyConditionExpression=Key("sender_id").eq(sender_id)
+    )["Items"]
+
+
+@mock_dynamodb2
+def test_dynamo_saves_only_new_events():
+    tracker_store = DynamoTrackerStore(domain)
+    tracker = tracker_store.get_or_create_tracker("some-id")
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+
+    tracker = tracker_store.retrieve("some-id")
+    for i in range(MAX_EVENTS_PER_DYNAMO_ITEM + 1):
+        tracker.update(UserUttered(f"message {i}"))
+    tracker_store.save(tracker)
+
+    items = _dynamo_items(tracker_store, "some-id")
+    assert [item["session_date"] for item in items] == [
+        -1,
+        0,
+        1,
+        2,
+        2 + MAX_EVENTS_PER_DYNAMO_ITEM,
+    ]
+    assert items[0]["number_of_events"] == len(tracker.events)
+    assert list(tracker_store.keys()) == ["some-id"]
+    assert tracker_store.retrieve("some-id") == tracker
+
+
+@mock_dynamodb2
+def test_dynamo_uses_table_resource_per_thread():
+    tracker_store = DynamoTrackerStore(domain)
+    tracker = DialogueStateTracker.from_events("some-id", [UserUttered("hi")])
+
+    tables_of_other_thread = []
+
+    def save_in_other_thread() -> None:
+        tracker_store.save(tracker)
+        tables_of_other_thread.append(tracker_store.db)
+
+    thread = threading.Thread(target=save_in_other_thread)
+    thread.start()
+    thread.join()
+
+    assert tables_of_other_thread[0] is not tracker_store.db
+    assert tracker_store.retrieve("some-id") == tracker
+
+
+@mock_dynamodb2
+def test_dynamo_keeps_number_of_events_if_writing_chunks_fails(
+    monkeypatch: MonkeyPatch,
+):
+    tracker_store = DynamoTrackerStore(domain)
+    tracker = tracker_store.get_or_create_tracker("some-id")
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+    saved = tracker_store.retrieve("some-id")
+
+    @contextmanager
+    def failing_batch_writer() -> Iterator[Mock]:
+        # the batch is written in any order and fails after writing all items
+        # except the chunks of events
+        batch = Mock()
+        yield batch
+        for call in batch.put_item.call_args_list:
+            if "events" not in call[1]["Item"]:
+                tracker_store.db.put_item(**call[1])
+        raise ValueError()
+
+    monkeypatch.setattr(tracker_store.db, "batch_writer", failing_batch_writer)
+    tracker.update(UserUttered("hi again"))
+    with pytest.raises(ValueError):
+        tracker_store.save(tracker)
+
+    items = _dynamo_items(tracker_store, "some-id")
+    assert items[0]["number_of_events"] == len(saved.events)
+    assert tracker_store.retrieve("some-id") == saved
+
+
+@mock_dynamodb2
+@pytest.mark.parametrize("load_previous_sessions", [False, True])
+def test_dynamo_retrieve_with_session_started_events(load_previous_sessions: bool):
+    tracker_store = DynamoTrackerStore(domain)
+    tracker_store.load_events_from_previous_conversation_sessions = (
+        load_previous_sessions
+    )
+    tracker = _saved_tracker_with_multiple_session_starts(tracker_store, "some-id")
+    tracker.update(UserUttered("hi2"))
+    tracker_store.save(tracker)
+
+    events = list(tracker_store.retrieve("some-id").events)
+
+    if load_previous_sessions:
+        assert len(events) == 6
+    else:
+        assert events == [SessionStarted(), UserUttered("hi2")]
+
+
+@mock_dynamodb2
+def test_dynamo_retrieve_conversation_saved_as_snapshot():
+    tracker_store = DynamoTrackerStore(domain)
+    tracker = DialogueStateTracker.from_events(
+        "some-id", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+    tracker_store.db.put_item(Item=tracker_store.serialise_tracker(tracker))
+
+    retrieved = tracker_store.retrieve("some-id")
+    assert retrieved == tracker
+
+    retrieved.update(ActionExecuted("utter_greet"))
+    tracker_store.save(retrieved)
+
+    assert tracker_store.retrieve("some-id") == retrieved
+    assert len(_dynamo_items(tracker_store, "some-id")) == 3
+
+
 def test_restart_after_retrieval_from_tracker_store(default_domain: Domain):
     store = InMemoryTrackerStore(default_domain)
     tr = store.get_or_create_tracker("myuser")
@@ -119,6 +255,390 @@ def test_tracker_store_remembers_max_history(default_domain: Domain):
     assert tr._max_event_history == tr2._max_event_history == 42
 
 
+class RecordingEventBroker(EventBroker):
+    def __init__(self) -> None:
+        self.published = []
+
+    def publish(self, event: Dict) -> None:
+        self.published.append([event])
+
+    def publish_many(self, events: List[Dict]) -> None:
+        self.published.append(events)
+
+    def published_event_types(self) -> List[List[Text]]:
+        return [[event["event"] for event in batch] for batch in self.published]
+
+
+def test_stream_events_without_retrieving_tracker(default_domain: Domain):
+    event_broker = RecordingEventBroker()
+    store = InMemoryTrackerStore(default_domain, event_broker)
+    tracker = store.get_or_create_tracker("myuser")
+
+    store.retrieve = Mock(wraps=store.retrieve)
+    tracker.update(UserUttered("hi"))
+    tracker.update(ActionExecuted("utter_greet"))
+    store.save(tracker)
+    store.save(tracker)
+
+    tracker = store.get_or_create_tracker("myuser")
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    store.save(tracker)
+
+    # the tracker is only retrieved by `get_or_create_tracker`
+    store.retrieve.assert_called_once_with("myuser")
+    assert event_broker.published_event_types() == [
+        ["action"],
+        ["user", "action"],
+        ["action"],
+    ]
+
+
+def test_stream_events_of_tracker_unknown_to_tracker_store(default_domain: Domain):
+    event_broker = RecordingEventBroker()
+    store = InMemoryTrackerStore(default_domain, event_broker)
+    store.save(store.get_or_create_tracker("myuser"))
+
+    tracker = DialogueStateTracker.from_events(
+        "myuser",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")],
+        default_domain.slots,
+    )
+    store.save(tracker)
+
+    assert event_broker.published_event_types() == [["action"], ["user"]]
+
+
+class ThreadRecordingTrackerStore(InMemoryTrackerStore):
+    def __init__(self, domain: Domain) -> None:
+        super().__init__(domain)
+        self.threads = []
+
+    def save(self, tracker: DialogueStateTracker) -> None:
+        self.threads.append(threading.current_thread())
+        super().save(tracker)
+
+    def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        self.threads.append(threading.current_thread())
+        return super().retrieve(sender_id)
+
+
+async def test_async_tracker_store_api(default_domain: Domain):
+    store = ThreadRecordingTrackerStore(default_domain)
+
+    tracker = await store.get_or_create_tracker_async("myuser")
+    tracker.update(SlotSet("name", "Rasa"))
+    await store.save_async(tracker)
+
+    retrieved = await store.retrieve_async("myuser")
+    assert retrieved.get_slot("name") == "Rasa"
+    assert list(await store.keys_async()) == ["myuser"]
+
+    # the blocking methods don't run in the thread of the event loop
+    assert len(store.threads) == 4
+    assert threading.current_thread() not in store.threads
+
+
+async def test_async_tracker_store_api_uses_overridden_get_or_create_tracker(
+    default_domain: Domain,
+):
+    class CustomTrackerStore(InMemoryTrackerStore):
+        def get_or_create_tracker(
+            self,
+            sender_id: Text,
+            max_event_history: Optional[int] = None,
+            append_action_listen: bool = True,
+        ) -> DialogueStateTracker:
+            tracker = super().get_or_create_tracker(
+                sender_id, max_event_history, append_action_listen
+            )
+            tracker.update(ActionExecuted("action_custom"))
+            return tracker
+
+    store = CustomTrackerStore(default_domain)
+
+    tracker = await store.get_or_create_tracker_async("myuser")
+
+    assert tracker.latest_action_name == "action_custom"
+
+
+async def test_fail_safe_tracker_store_with_async_save_error(default_domain: Domain):
+    failing_tracker_store = InMemoryTrackerStore(default_domain)
+    failing_tracker_store.save = Mock(side_effect=Exception())
+    fallback_tracker_store = InMemoryTrackerStore(default_domain)
+    on_error_callback = Mock()
+
+    tracker_store = FailSafeTrackerStore(
+        failing_tracker_store, on_error_callback, fallback_tracker_store
+    )
+    tracker = DialogueStateTracker.from_events("myuser", [Restarted()])
+    await tracker_store.save_async(tracker)
+
+    on_error_callback.assert_called_once()
+    assert list(fallback_tracker_store.keys()) == ["myuser"]
+
+
+def _save_conversation(
+    store: InMemoryTrackerStore, sender_id: Text, number_of_messages: int = 1
+) -> DialogueStateTracker:
+    tracker = store.get_or_create_tracker(sender_id, append_action_listen=False)
+    for i in range(number_of_messages):
+        tracker.update(UserUttered(f"message {i}"))
+    store.save(tracker)
+    return tracker
+
+
+def test_in_memory_tracker_store_returns_independent_trackers(default_domain: Domain):
+    store = InMemoryTrackerStore(default_domain)
+    tracker = _save_conversation(store, "myuser")
+    tracker.update(SlotSet("name", "Rasa"))
+
+    retrieved = store.retrieve("myuser")
+    assert retrieved.get_slot("name") is None
+    retrieved.update(UserUttered("another message"))
+
+    assert len(store.retrieve("myuser").events) == 1
+
+
+def test_in_memory_tracker_store_evicts_least_recently_used(default_domain: Domain):
+    store = InMemoryTrackerStore(default_domain, max_conversations=2)
+    _save_conversation(store, "first")
+    _save_conversation(store, "second")
+    store.retrieve("first")
+    _save_conversation(store, "third")
+
+    assert list(store.keys()) == ["first", "third"]
+    assert store.retrieve("second") is None
+
+
+def test_in_memory_tracker_store_limits_number_of_events(default_domain: Domain):
+    store = InMemoryTrackerStore(default_domain, max_events=5)
+    _save_conversation(store, "first", 2)
+    _save_conversation(store, "second", 2)
+    _save_conversation(store, "third", 2)
+
+    assert list(store.keys()) == ["second", "third"]
+    assert store.number_of_events == 4
+
+    # the saved conversation is kept even if it exceeds the limit on its own
+    _save_conversation(store, "fourth", 6)
+    assert list(store.keys()) == ["fourth"]
+
+
+def test_in_memory_tracker_store_expires_conversations(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    now = 1000
+    monkeypatch.setattr(rasa.core.tracker_store.time, "time", lambda: now)
+    store = InMemoryTrackerStore(default_domain, conversation_ttl=60)
+    _save_conversation(store, "first")
+
+    now += 30
+    _save_conversation(store, "second")
+
+    now += 31
+    assert store.retrieve("first") is None
+    assert store.retrieve("second") is not None
+
+
+def test_in_memory_tracker_store_spills_evicted_conversations(
+    default_domain: Domain, tmp_path: Path
+):
+    store = InMemoryTrackerStore(
+        default_domain, max_conversations=1, spill_path=str(tmp_path / "spill.db")
+    )
+    first = _save_conversation(store, "first", 2)
+    _save_conversation(store, "second")
+
+    assert set(store.keys()) == {"first", "second"}
+    assert store.retrieve("first") == first
+    assert list(store.store.keys()) == ["first"]
+
+
+def test_in_memory_tracker_store_from_endpoint_config(default_domain: Domain):
+    store = TrackerStore.create(
+        EndpointConfig(type="in_memory", max_conversations=10), default_domain
+    )
+
+    assert isinstance(store, InMemoryTrackerStore)
+    assert store.max_conversations == 10
+
+
+def _write_behind_tracker_store(
+    domain: Domain, **kwargs: Any
+) -> Tuple[WriteBehindTrackerStore, Mock]:
+    tracker_store = InMemoryTrackerStore(domain, RecordingEventBroker())
+    save = Mock(wraps=tracker_store.save)
+    tracker_store.save = save
+    return WriteBehindTrackerStore(tracker_store, **kwargs), save
+
+
+async def test_write_behind_tracker_store_coalesces_saves(default_domain: Domain):
+    store, save = _write_behind_tracker_store(default_domain)
+    tracker = store.get_or_create_tracker("myuser")
+    await store.save_async(tracker)
+    tracker.update(UserUttered("hello"))
+    await store.save_async(tracker)
+
+    retrieved = store.get_or_create_tracker("myuser")
+    assert retrieved == tracker
+    retrieved.update(ActionExecuted("utter_greet"))
+    await store.save_async(retrieved)
+    save.assert_not_called()
+
+    await store.flush_async("myuser")
+
+    save.assert_called_once()
+    assert store.retrieve("myuser") == retrieved
+    assert store.event_broker.published_event_types() == [
+        [ActionExecuted.type_name, UserUttered.type_name, ActionExecuted.type_name]
+    ]
+
+
+async def test_write_behind_tracker_store_with_flush_interval(default_domain: Domain):
+    store, save = _write_behind_tracker_store(default_domain, flush_interval=0.01)
+    await store.save_async(DialogueStateTracker("first", default_domain.slots))
+    await store.save_async(DialogueStateTracker("second", default_domain.slots))
+
+    await store.flush_async("first")
+    save.assert_not_called()
+
+    await asyncio.sleep(0.1)
+    assert save.call_count == 2
+    assert set(store._tracker_store.keys()) == {"first", "second"}
+
+
+def test_write_behind_tracker_store_flushes_when_full(default_domain: Domain):
+    store, save = _write_behind_tracker_store(default_domain, max_pending_trackers=2)
+    store.save(DialogueStateTracker("first", default_domain.slots))
+    save.assert_not_called()
+
+    store.save(DialogueStateTracker("second", default_domain.slots))
+    assert save.call_count == 2
+
+
+def test_write_behind_tracker_store_keeps_trackers_which_failed_to_save(
+    default_domain: Domain,
+):
+    store, save = _write_behind_tracker_store(default_domain)
+    store.save(DialogueStateTracker("myuser", default_domain.slots))
+    save.side_effect = ValueError()
+
+    with pytest.raises(ValueError):
+        store.flush()
+
+    save.side_effect = None
+    store.flush()
+    assert list(store._tracker_store.keys()) == ["myuser"]
+
+
+def test_write_behind_tracker_store_retrieves_trackers_while_flushing(
+    default_domain: Domain,
+):
+    store, save = _write_behind_tracker_store(default_domain)
+    tracker = DialogueStateTracker("myuser", default_domain.slots)
+    tracker.update(UserUttered("hello"))
+    store.save(tracker)
+
+    saving = threading.Event()
+    finish_saving = threading.Event()
+
+    def slow_save(_tracker: DialogueStateTracker) -> None:
+        saving.set()
+        finish_saving.wait()
+
+    save.side_effect = slow_save
+    flush = threading.Thread(target=store.flush)
+    flush.start()
+    saving.wait()
+
+    try:
+        # the tracker isn't saved in the wrapped tracker store yet
+        assert store._tracker_store.retrieve("myuser") is None
+        assert store.retrieve("myuser") == tracker
+        assert list(store.keys()) == ["myuser"]
+    finally:
+        finish_saving.set()
+        flush.join()
+
+    assert not store._in_flight
+
+
+def test_write_behind_tracker_store_publishes_events_of_failed_flush(
+    default_domain: Domain,
+):
+    store, save = _write_behind_tracker_store(default_domain)
+    tracker = DialogueStateTracker("myuser", default_domain.slots)
+    tracker.update(UserUttered("hello"))
+    store.save(tracker)
+
+    saving = threading.Event()
+    finish_saving = threading.Event()
+
+    def failing_slow_save(_tracker: DialogueStateTracker) -> None:
+        saving.set()
+        finish_saving.wait()
+        raise ValueError()
+
+    def failing_flush() -> None:
+        with pytest.raises(ValueError):
+            store.flush()
+
+    save.side_effect = failing_slow_save
+    flush = threading.Thread(target=failing_flush)
+    flush.start()
+    saving.wait()
+
+    try:
+        # the tracker is retrieved and saved again while the flush is in flight
+        retrieved = store.get_or_create_tracker("myuser")
+        retrieved.update(ActionExecuted("utter_greet"))
+        store.save(retrieved)
+    finally:
+        finish_saving.set()
+        flush.join()
+
+    save.side_effect = None
+    store.flush()
+
+    event_broker = store._tracker_store.event_broker
+    assert event_broker.published_event_types() == [["user", "action"]]
+
+
+def test_write_behind_tracker_store_from_endpoint_config(default_domain: Domain):
+    store = TrackerStore.create(
+        EndpointConfig(type="in_memory", write_behind={"flush_interval": 2}),
+        default_domain,
+    )
+
+    assert isinstance(store, WriteBehindTrackerStore)
+    assert isinstance(store._tracker_store, InMemoryTrackerStore)
+    assert store.flush_interval == 2
+
+
+def test_write_behind_endpoint_config_can_be_used_again(default_domain: Domain):
+    endpoint_config = EndpointConfig(type="in_memory", write_behind=True)
+
+    for _ in range(2):
+        store = TrackerStore.create(endpoint_config, default_domain)
+        assert isinstance(store, WriteBehindTrackerStore)
+
+    assert endpoint_config.kwargs == {"write_behind": True}
+
+
+def test_sql_tracker_store_save_many(default_domain: Domain):
+    store = SQLTrackerStore(default_domain)
+    trackers = []
+    for sender_id in ["first", "second"]:
+        tracker = DialogueStateTracker(sender_id, default_domain.slots)
+        tracker.update(UserUttered(f"hi from {sender_id}"))
+        trackers.append(tracker)
+
+    store.save_many(trackers)
+
+    for tracker in trackers:
+        assert store.retrieve(tracker.sender_id) == tracker
+
+
 def test_tracker_store_endpoint_config_loading():
     cfg = read_endpoint_config(DEFAULT_ENDPOINTS_FILE, "tracker_store")
 
@@ -148,6 +668,52 @@ def test_create_tracker_store_from_endpoint_config(default_domain: Domain):
     assert isinstance(tracker_store, type(TrackerStore.create(store, default_domain)))
 
 
+def _redis_tracker_store(domain: Domain, **kwargs: Any) -> RedisTrackerStore:
+    import fakeredis
+
+    tracker_store = RedisTrackerStore(domain, **kwargs)
+    tracker_store.red = fakeredis.FakeStrictRedis()
+
+    # added in redis==3.3.0, but not yet in fakeredis
+    tracker_store.red.connection_pool.connection_class.health_check_interval = 0
+
+    return tracker_store
+
+
+def test_redis_tracker_store_compression(default_domain: Domain):
+    tracker_store = _redis_tracker_store(
+        default_domain, compression="zlib", compression_threshold=1000
+    )
+
+    short_tracker = DialogueStateTracker.from_events("short", [UserUttered("hi")])
+    long_tracker = DialogueStateTracker.from_events(
+        "long", [UserUttered(f"message {i}") for i in range(20)]
+    )
+    tracker_store.save(short_tracker)
+    tracker_store.save(long_tracker)
+
+    # only trackers above the threshold are compressed
+    assert tracker_store.red.get("short").startswith(b"{")
+    assert tracker_store.red.get("long").startswith(b"\x78")
+
+    for tracker in [short_tracker, long_tracker]:
+        assert tracker_store.retrieve(tracker.sender_id) == tracker
+
+    # compressed trackers can also be read if the compression is disabled
+    uncompressed_tracker_store = _redis_tracker_store(default_domain)
+    uncompressed_tracker_store.red = tracker_store.red
+
+    assert list(uncompressed_tracker_store.retrieve_many(["short", "long"])) == [
+        short_tracker,
+        long_tracker,
+    ]
+
+
+def test_redis_tracker_store_with_unknown_compression(default_domain: Domain):
+    with pytest.raises(ValueError):
+        RedisTrackerStore(default_domain, compression="zip")
+
+
 def test_exception_tracker_store_from_endpoint_config(
     default_domain: Domain, monkeypatch: MonkeyPatch
 ):
@@ -404,7 +970,7 @@ def test_fail_safe_tracker_store_if_no_errors():
     # test keys
     expected = ["sender 1", "sender 2"]
     mocked_tracker_store.keys = Mock(return_value=expected)
-    assert tracker_store.keys() == expected
+    assert list(tracker_store.keys()) == expected
     mocked_tracker_store.keys.assert_called_once()
 
 
@@ -433,7 +999,7 @@ def test_fail_safe_tracker_store_with_keys_error():
     on_error_callback = Mock()
 
     tracker_store = FailSafeTrackerStore(mocked_tracker_store, on_error_callback)
-    assert tracker_store.keys() == []
+    assert list(tracker_store.keys()) == []
     on_error_callback.assert_called_once()
 
 
@@ -524,6 +1090,41 @@ def test_mongo_additional_events_with_session_start(default_domain: Domain):
     assert isinstance(additional_events[0], UserUttered)
 
 
+def test_mongo_fetches_only_events_of_latest_session(default_domain: Domain):
+    sender = "test_mongo_fetches_only_events_of_latest_session"
+    tracker_store = MockedMongoTrackerStore(default_domain)
+    _saved_tracker_with_multiple_session_starts(tracker_store, sender)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender})
+    assert len(stored["events"]) == 5
+    assert stored[MONGO_SESSION_START_INDEX_KEY] == 4
+
+    # noinspection PyProtectedMember
+    conversation = tracker_store._find_conversation(sender)
+    assert [event["event"] for event in conversation["events"]] == [
+        SessionStarted.type_name
+    ]
+
+
+def test_mongo_conversation_saved_without_session_start_index(default_domain: Domain,):
+    sender = "test_mongo_conversation_saved_without_session_start_index"
+    tracker_store = MockedMongoTrackerStore(default_domain)
+    _saved_tracker_with_multiple_session_starts(tracker_store, sender)
+    tracker_store.conversations.update_one(
+        {"sender_id": sender}, {"$unset": {MONGO_SESSION_START_INDEX_KEY: ""}}
+    )
+
+    tracker = tracker_store.retrieve(sender)
+    assert list(tracker.events) == [SessionStarted()]
+
+    tracker.update(UserUttered("hi2"))
+    tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender})
+    assert len(stored["events"]) == 6
+    assert stored[MONGO_SESSION_START_INDEX_KEY] == 4
+
+
 # we cannot parametrise over this and the previous test due to the different ways of
 # calling _additional_events()
 def test_sql_additional_events(default_domain: Domain):
@@ -541,6 +1142,25 @@ def test_sql_additional_events(default_domain: Domain):
         )
 
 
+@pytest.mark.parametrize("load_events_from_previous_sessions", [True, False])
+def test_sql_retrieve_many_with_session_start(
+    default_domain: Domain, load_events_from_previous_sessions: bool
+):
+    tracker_store = SQLTrackerStore(default_domain)
+    tracker_store.load_events_from_previous_conversation_sessions = (
+        load_events_from_previous_sessions
+    )
+    _saved_tracker_with_multiple_session_starts(tracker_store, "first")
+    _saved_tracker_with_multiple_session_starts(tracker_store, "second")
+
+    retrieved = list(tracker_store.retrieve_many(["second", "first"]))
+
+    assert [tracker.sender_id for tracker in retrieved] == ["first", "second"]
+    for tracker in retrieved:
+        expected = tracker_store.retrieve(tracker.sender_id)
+        assert list(tracker.events) == list(expected.events)
+
+
 def test_sql_additional_events_with_session_start(default_domain: Domain):
     sender = "test_sql_additional_events_with_session_start"
     tracker_store = SQLTrackerStore(default_domain)
@@ -747,6 +1367,68 @@ def test_create_engine_kwargs(
     assert rasa.core.tracker_store.create_engine_kwargs(url) == kwargs
 
 
+@pytest.mark.parametrize(
+    "url,kwargs",
+    [
+        (
+            f"{PGDialect.name}://admin:pw@localhost:5432/rasa",
+            {
+                "pool_size": 5,
+                "max_overflow": 10,
+                "pool_pre_ping": True,
+                "pool_recycle": 3600,
+            },
+        ),
+        (
+            "mysql://admin:pw@localhost:3306/rasa",
+            {
+                "pool_size": 5,
+                "max_overflow": 10,
+                "pool_pre_ping": True,
+                "pool_recycle": 3600,
+            },
+        ),
+        (f"{SQLiteDialect.name}:///", {"pool_pre_ping": True, "pool_recycle": 3600}),
+    ],
+)
+def test_create_engine_kwargs_with_pool_configuration(
+    monkeypatch: MonkeyPatch, url: Text, kwargs: Dict[Text, Union[Text, int]]
+):
+    set_or_delete_postgresql_schema_env_var(monkeypatch, None)
+
+    assert (
+        rasa.core.tracker_store.create_engine_kwargs(
+            url, pool_size=5, max_overflow=10, pool_pre_ping=True, pool_recycle=3600
+        )
+        == kwargs
+    )
+
+
+def test_sql_tracker_store_lists_conversations_from_read_replica(
+    default_domain: Domain, tmp_path: Path
+):
+    primary_url = f"sqlite:///{tmp_path / 'primary.db'}"
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    # the replica is a separate database so that reads from it can be detected
+    replica = SQLTrackerStore(default_domain, host=replica_url)
+    tracker_store = SQLTrackerStore(
+        default_domain, host=primary_url, read_replicas=[replica_url]
+    )
+
+    tracker = DialogueStateTracker("myuser", default_domain.slots)
+    tracker.update(UserUttered("hello"))
+    tracker_store.save(tracker)
+
+    # single trackers are always retrieved from the primary database
+    assert tracker_store.retrieve("myuser") == tracker
+    assert list(tracker_store.keys()) == []
+    assert list(tracker_store.retrieve_many(["myuser"])) == []
+
+    replica.save(tracker)
+    assert list(tracker_store.keys()) == ["myuser"]
+    assert list(tracker_store.retrieve_many(["myuser"])) == [tracker]
+
+
 @contextmanager
 def does_not_raise():
     """Contextmanager to be used when an expression is not expected to raise an
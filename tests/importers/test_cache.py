@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.constants import ENV_TRAINING_DATA_CACHE
+from rasa.importers import utils
+from rasa.importers.cache import TrainingDataCache
+
+
+def test_fingerprint_changes_with_file_content(tmp_path: Path):
+    training_file = tmp_path / "nlu.yml"
+    training_file.write_text("version: '2.0'")
+    first = TrainingDataCache.fingerprint([str(training_file)])
+
+    training_file.write_text("version: '2.0'\nnlu: []")
+    second = TrainingDataCache.fingerprint([str(training_file)])
+
+    assert first != second
+    assert second == TrainingDataCache.fingerprint([str(training_file)])
+
+
+def test_fingerprint_changes_with_additional_inputs(tmp_path: Path):
+    training_file = tmp_path / "nlu.yml"
+    training_file.write_text("version: '2.0'")
+
+    assert TrainingDataCache.fingerprint(
+        [str(training_file)], "en"
+    ) != TrainingDataCache.fingerprint([str(training_file)], "de")
+
+
+@pytest.mark.parametrize(
+    "content", ["password: ${PASSWORD}", "does not exist"],
+)
+def test_no_fingerprint_for_uncacheable_files(tmp_path: Path, content: str):
+    training_file = tmp_path / "domain.yml"
+    if content != "does not exist":
+        training_file.write_text(content)
+
+    assert TrainingDataCache.fingerprint([str(training_file)]) is None
+
+
+def test_load_or_compute(tmp_path: Path):
+    training_file = tmp_path / "nlu.yml"
+    training_file.write_text("version: '2.0'")
+    cache = TrainingDataCache(str(tmp_path / "cache"))
+
+    assert cache.load_or_compute([str(training_file)], lambda: {"parsed": 1}) == {
+        "parsed": 1
+    }
+    # result is now loaded from the cache instead of being computed again
+    assert cache.load_or_compute([str(training_file)], lambda: {"parsed": 2}) == {
+        "parsed": 1
+    }
+
+
+def test_load_or_compute_with_disabled_cache(tmp_path: Path, monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_TRAINING_DATA_CACHE, "false")
+    training_file = tmp_path / "nlu.yml"
+    training_file.write_text("version: '2.0'")
+    cache = TrainingDataCache(str(tmp_path / "cache"))
+
+    cache.load_or_compute([str(training_file)], lambda: 1)
+
+    assert cache.load_or_compute([str(training_file)], lambda: 2) == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_load_with_corrupted_cache_entry(tmp_path: Path):
+    cache = TrainingDataCache(str(tmp_path))
+    (tmp_path / "key.pkl").write_text("not a pickle")
+
+    assert cache.load("key") is None
+
+
+async def test_cached_training_data_equals_parsed_training_data(
+    default_domain_path: str, default_stories_file: str, default_nlu_data: str
+):
+    domain = utils.domain_from_path(default_domain_path)
+    assert utils.domain_from_path(default_domain_path).as_dict() == domain.as_dict()
+
+    stories = await utils.story_graph_from_paths([default_stories_file], domain)
+    cached_stories = await utils.story_graph_from_paths([default_stories_file], domain)
+    assert cached_stories.as_story_string() == stories.as_story_string()
+
+    nlu_data = utils.training_data_from_paths([default_nlu_data], "en")
+    cached_nlu_data = utils.training_data_from_paths([default_nlu_data], "en")
+    assert cached_nlu_data.nlu_as_json() == nlu_data.nlu_as_json()
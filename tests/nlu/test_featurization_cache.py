@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import scipy.sparse
+
+from rasa.nlu.components import Component
+from rasa.nlu.config import RasaNLUModelConfig
+from rasa.nlu.featurization_cache import FeaturizationCache
+from rasa.nlu.featurizers.featurizer import DenseFeaturizer
+from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+from rasa.shared.nlu.constants import (
+    FEATURE_TYPE_SENTENCE,
+    FEATURE_TYPE_SEQUENCE,
+    TEXT,
+)
+from rasa.shared.nlu.training_data.features import Features
+from rasa.shared.nlu.training_data.message import Message
+from rasa.shared.nlu.training_data.training_data import TrainingData
+
+
+class CountingFeaturizer(DenseFeaturizer):
+    has_cacheable_training_output = True
+
+    def __init__(self, component_config: Optional[dict] = None) -> None:
+        super().__init__(component_config)
+        self.featurized_texts = []
+
+    def train(
+        self,
+        training_data: TrainingData,
+        config: Optional[RasaNLUModelConfig] = None,
+        **kwargs: Any,
+    ) -> None:
+        for example in training_data.training_examples:
+            self.featurized_texts.append(example.get(TEXT))
+            length = len(example.get(TEXT))
+            example.add_features(
+                Features(
+                    np.full((1, 3), length, dtype=np.float32),
+                    FEATURE_TYPE_SENTENCE,
+                    TEXT,
+                    self.name,
+                )
+            )
+            example.add_features(
+                Features(
+                    scipy.sparse.coo_matrix([[length, 0]]),
+                    FEATURE_TYPE_SEQUENCE,
+                    TEXT,
+                    self.name,
+                )
+            )
+
+
+def _training_data(*texts: str) -> TrainingData:
+    return TrainingData([Message(data={TEXT: text}) for text in texts])
+
+
+def _train(
+    cache: FeaturizationCache, component: Component, training_data: TrainingData
+) -> None:
+    tokenizer = WhitespaceTokenizer()
+    cache.register_examples(training_data)
+    cache.train(tokenizer, [], training_data, RasaNLUModelConfig())
+    cache.train(component, [tokenizer], training_data, RasaNLUModelConfig())
+
+
+def test_featurization_cache_restores_features(tmp_path: Path):
+    cache = FeaturizationCache(str(tmp_path))
+    texts = ("hello there", "how are you?")
+
+    featurized = _training_data(*texts)
+    _train(cache, CountingFeaturizer(), featurized)
+
+    featurizer = CountingFeaturizer()
+    restored = _training_data(*texts)
+    _train(cache, featurizer, restored)
+
+    assert featurizer.featurized_texts == []
+    for expected, actual in zip(
+        featurized.training_examples, restored.training_examples
+    ):
+        assert [t.text for t in actual.get("text_tokens")] == [
+            t.text for t in expected.get("text_tokens")
+        ]
+        assert len(actual.features) == len(expected.features) == 2
+        for expected_features, actual_features in zip(
+            expected.features, actual.features
+        ):
+            assert actual_features.type == expected_features.type
+            assert actual_features.origin == expected_features.origin
+            if expected_features.is_dense():
+                assert actual_features.features.dtype == np.float32
+                assert np.all(actual_features.features == expected_features.features)
+            else:
+                assert (actual_features.features != expected_features.features).nnz == 0
+
+
+def test_featurization_cache_only_computes_new_examples(tmp_path: Path):
+    cache = FeaturizationCache(str(tmp_path))
+    _train(cache, CountingFeaturizer(), _training_data("hello there", "hi"))
+
+    featurizer = CountingFeaturizer()
+    training_data = _training_data("hello there", "how are you?")
+    _train(cache, featurizer, training_data)
+
+    assert featurizer.featurized_texts == ["how are you?"]
+    assert all(len(ex.features) == 2 for ex in training_data.training_examples)
+
+
+def test_featurization_cache_depends_on_component_config(tmp_path: Path):
+    cache = FeaturizationCache(str(tmp_path))
+    _train(cache, CountingFeaturizer(), _training_data("hello there"))
+
+    featurizer = CountingFeaturizer({"pooling": "max"})
+    _train(cache, featurizer, _training_data("hello there"))
+
+    assert featurizer.featurized_texts == ["hello there"]
@@ -1,4 +1,10 @@
+import pickle
+
 import rasa.shared.core.generator
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, ActionReverted, SlotSet, UserUttered
+from rasa.shared.core.generator import TrackerWithCachedStates
 
 
 def test_subsample_array_read_only():
@@ -18,3 +24,78 @@ def test_subsample_array():
 
     assert len(r) == 5
     assert set(r).issubset(t)
+
+
+def _tracker_with_events(domain: Domain) -> TrackerWithCachedStates:
+    return TrackerWithCachedStates.from_events(
+        "test",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", intent={"name": "greet"}),
+            ActionExecuted("utter_greet"),
+            SlotSet("name", "Peter"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+        ],
+        domain.slots,
+        domain=domain,
+    )
+
+
+def test_tracker_copy_is_independent_of_original():
+    domain = Domain.load("data/test_domains/default_with_slots.yml")
+    tracker = _tracker_with_events(domain)
+    states = tracker.past_states(domain)
+
+    tracker_copy = tracker.copy("copy")
+    assert list(tracker_copy.events) == list(tracker.events)
+    assert tracker_copy.past_states(domain) == states
+    assert tracker_copy.current_slot_values() == tracker.current_slot_values()
+
+    tracker_copy.update(UserUttered("bye", intent={"name": "goodbye"}))
+    tracker_copy.update(SlotSet("name", "Paul"))
+
+    assert len(tracker.events) == 5
+    assert len(tracker_copy.events) == 7
+    assert tracker.get_slot("name") == "Peter"
+    assert tracker_copy.get_slot("name") == "Paul"
+    assert tracker.past_states(domain) == states
+    assert tracker_copy.past_states(domain) != states
+
+
+def test_tracker_copy_equals_replayed_tracker():
+    domain = Domain.load("data/test_domains/default_with_slots.yml")
+    tracker = _tracker_with_events(domain)
+    tracker_copy = tracker.copy()
+    tracker_copy.update(ActionReverted())
+
+    replayed = TrackerWithCachedStates.from_events(
+        "", list(tracker_copy.events), domain.slots, domain=domain
+    )
+
+    assert replayed.past_states(domain) == tracker_copy.past_states(domain)
+    assert replayed.current_slot_values() == tracker_copy.current_slot_values()
+
+
+def test_pickle_tracker_with_cached_states():
+    domain = Domain.load("data/test_domains/default_with_slots.yml")
+    tracker = _tracker_with_events(domain)
+
+    unpickled = pickle.loads(pickle.dumps(tracker))
+
+    assert list(unpickled.events) == list(tracker.events)
+    assert unpickled.past_states(unpickled.domain) == tracker.past_states(domain)
+
+
+def test_hash_of_states():
+    domain = Domain.load("data/test_domains/default_with_slots.yml")
+    tracker = _tracker_with_events(domain)
+    same_tracker = _tracker_with_events(domain)
+    states = tuple(tracker.past_states_for_hashing(domain))
+
+    assert tracker.hash_of_states() == same_tracker.hash_of_states()
+    assert tracker.hash_of_states(2) == (2, same_tracker.hash_of_states(2)[1])
+    assert tracker.hash_of_states(len(states) + 1) == tracker.hash_of_states()
+
+    tracker_copy = tracker.copy()
+    tracker_copy.update(UserUttered("bye", intent={"name": "goodbye"}))
+    assert tracker_copy.hash_of_states() != tracker.hash_of_states()
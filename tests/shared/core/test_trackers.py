@@ -69,6 +69,7 @@ class MockRedisTrackerStore(RedisTrackerStore):
     def __init__(self, _domain: Domain) -> None:
         self.red = fakeredis.FakeStrictRedis()
         self.record_exp = None
+        self.compression = None
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
@@ -132,6 +133,22 @@ def test_tracker_store_storage_and_retrieval(store):
     assert len(other_tracker.events) == 1
 
 
+@pytest.mark.parametrize("store", stores_to_be_tested(), ids=stores_to_be_tested_ids())
+def test_tracker_store_keys_and_retrieve_many(store):
+    sender_ids = [f"retrieve-many-{i}" for i in range(3)]
+    for sender_id in sender_ids:
+        tracker = store.get_or_create_tracker(sender_id)
+        tracker.update(UserUttered(f"hello from {sender_id}"))
+        store.save(tracker)
+
+    assert set(sender_ids) <= set(store.keys())
+
+    retrieved = store.retrieve_many(sender_ids + ["unknown-id"])
+    assert {tracker.sender_id: list(tracker.events) for tracker in retrieved} == {
+        sender_id: list(store.retrieve(sender_id).events) for sender_id in sender_ids
+    }
+
+
 @pytest.mark.parametrize("store", stores_to_be_tested(), ids=stores_to_be_tested_ids())
 @pytest.mark.parametrize("pair", zip(TEST_DIALOGUES, EXAMPLE_DOMAINS))
 def test_tracker_store(store, pair):
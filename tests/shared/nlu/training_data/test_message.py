@@ -264,3 +264,19 @@ def test_build_from_action():
     assert Message.build_from_action(
         action_text=test_action_text, action_name=test_action_name
     ) == Message(data={ACTION_NAME: test_action_name, ACTION_TEXT: test_action_text})
+
+
+def test_shallow_copy_does_not_modify_original():
+    features = Features(np.array([1, 1, 0]), FEATURE_TYPE_SEQUENCE, TEXT, "test")
+    message = Message({TEXT: "hello", "intent": "greet"}, features=[features])
+
+    copied = message.shallow_copy()
+    copied.set("tokens", ["hello"])
+    copied.add_features(
+        Features(np.array([1, 2, 2]), FEATURE_TYPE_SENTENCE, TEXT, "test")
+    )
+
+    assert copied.get(TEXT) == message.get(TEXT)
+    assert copied.features[0] is features
+    assert message.get("tokens") is None
+    assert message.features == [features]
@@ -3,8 +3,10 @@ from pathlib import Path
 from typing import Text, List
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 import rasa.shared.utils.io
+from rasa.shared.constants import ENV_TRAINING_DATA_LOADING_WORKERS
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import UserUttered, ActionExecuted
 from rasa.shared.core.training_data.structures import StoryStep, StoryGraph
@@ -306,6 +308,24 @@ def test_data_merging(files):
     assert td.regex_features == td_reference.regex_features
 
 
+@pytest.mark.parametrize(
+    "directory", ["data/test/multiple_files_json", "data/test/multiple_files_markdown"]
+)
+def test_data_loading_with_multiple_processes(
+    directory: Text, monkeypatch: MonkeyPatch
+):
+    sequentially_loaded = load_data(directory)
+
+    monkeypatch.setenv(ENV_TRAINING_DATA_LOADING_WORKERS, "2")
+    loaded_in_parallel = load_data(directory)
+
+    assert [m.as_dict() for m in loaded_in_parallel.training_examples] == [
+        m.as_dict() for m in sequentially_loaded.training_examples
+    ]
+    assert loaded_in_parallel.entity_synonyms == sequentially_loaded.entity_synonyms
+    assert loaded_in_parallel.regex_features == sequentially_loaded.regex_features
+
+
 def test_markdown_single_sections():
     td_regex_only = load_data("data/test/markdown_single_sections/regex_only.md")
     assert td_regex_only.regex_features == [{"name": "greet", "pattern": r"hey[^\s]*"}]
@@ -636,3 +656,19 @@ async def test_without_additional_e2e_examples(tmp_path: Path):
     assert training_data.training_examples
     assert training_data.is_empty()
     assert not training_data.without_empty_e2e_examples().training_examples
+
+
+def test_shallow_copy_shares_message_attributes():
+    training_data = load_data("data/examples/rasa/demo-rasa.json")
+
+    copied = training_data.shallow_copy()
+    for example in copied.training_examples:
+        example.set("tokens", [])
+
+    assert len(copied.training_examples) == len(training_data.training_examples)
+    assert copied.entity_synonyms == training_data.entity_synonyms
+    for original, copy in zip(
+        training_data.training_examples, copied.training_examples
+    ):
+        assert copy.get(TEXT) is original.get(TEXT)
+        assert original.get("tokens") is None
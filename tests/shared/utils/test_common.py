@@ -1,4 +1,10 @@
+from typing import Any, List
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
 import rasa.shared.utils.common
+from rasa.shared.constants import ENV_TRAINING_DATA_LOADING_WORKERS
 
 
 def test_all_subclasses():
@@ -22,3 +28,51 @@ def test_sort_dicts_by_keys():
     actual = rasa.shared.utils.common.sort_list_of_dicts_by_first_key(test_data)
 
     assert actual == expected
+
+
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_map_in_parallel_keeps_order(num_workers: int):
+    items = list(range(-10, 10))
+
+    actual = rasa.shared.utils.common.map_in_parallel(abs, items, num_workers)
+
+    assert actual == [abs(item) for item in items]
+
+
+@pytest.mark.parametrize(
+    "configured, expected", [("3", 3), ("invalid", 1), (None, 1)],
+)
+def test_number_of_training_data_loading_workers(
+    configured: str, expected: int, monkeypatch: MonkeyPatch
+):
+    if configured is not None:
+        monkeypatch.setenv(ENV_TRAINING_DATA_LOADING_WORKERS, configured)
+    else:
+        monkeypatch.delenv(ENV_TRAINING_DATA_LOADING_WORKERS, raising=False)
+
+    assert (
+        rasa.shared.utils.common.number_of_training_data_loading_workers() == expected
+    )
+
+
+def _sequence_hash(items: List[Any]) -> int:
+    sequence_hash = 0
+    for item in items:
+        sequence_hash = rasa.shared.utils.common.extend_sequence_hash(
+            sequence_hash, item
+        )
+    return sequence_hash
+
+
+@pytest.mark.parametrize("length", [0, 1, 3, 5])
+def test_subsequence_hash(length: int):
+    items = ["a", ("b", 1), frozenset({"c"}), None, "a"]
+    shorter_prefix = items[: len(items) - length]
+
+    assert rasa.shared.utils.common.subsequence_hash(
+        _sequence_hash(items), _sequence_hash(shorter_prefix), length
+    ) == _sequence_hash(items[len(items) - length :])
+
+
+def test_sequence_hash_depends_on_order():
+    assert _sequence_hash(["a", "b"]) != _sequence_hash(["b", "a"])
@@ -0,0 +1,149 @@
+import time
+from typing import List, Text
+
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, UserUttered
+from rasa.shared.core.generator import TrainingDataGenerator, TrackerWithCachedStates
+from rasa.shared.core.training_data.structures import (
+    Checkpoint,
+    StoryGraph,
+    StoryStep,
+    STORY_START,
+)
+
+NUMBER_OF_MEASUREMENTS = 3
+
+# Story graph in which every block of a level can follow every block of the previous
+# level. This results in `BLOCKS_PER_LEVEL ** LEVELS` unique stories.
+BLOCKS_PER_LEVEL = 3
+LEVELS = 6
+TURNS_PER_BLOCK = 4
+
+# Maximum expected time to generate the training trackers of the story graph when
+# running on a CI VM.
+MAX_GENERATION_TIME_S = 10
+
+# Maximum expected slowdown of the deduplication of trackers with long histories
+# compared to trackers with short histories. Deduplication should not depend on the
+# history length.
+MAX_DEDUPLICATION_SLOWDOWN = 3
+
+DOMAIN = Domain.from_yaml(
+    """
+intents:
+- greet
+- goodbye
+- affirm
+- deny
+responses:
+  utter_greet:
+  - text: hi
+  utter_goodbye:
+  - text: bye
+  utter_ask:
+  - text: sure?
+"""
+)
+
+
+def _story_graph() -> StoryGraph:
+    intents = DOMAIN.intents
+    actions = list(DOMAIN.templates.keys())
+
+    story_steps = []
+    for level in range(LEVELS):
+        for block in range(BLOCKS_PER_LEVEL):
+            start = STORY_START if level == 0 else f"level_{level - 1}"
+            end = f"level_{level}" if level < LEVELS - 1 else None
+            events = []
+            for turn in range(TURNS_PER_BLOCK):
+                intent = intents[(block + turn + level) % len(intents)]
+                events.append(UserUttered(intent, intent={"name": intent}))
+                events.append(
+                    ActionExecuted(actions[(block * turn + level) % len(actions)])
+                )
+                events.append(ActionExecuted(ACTION_LISTEN_NAME))
+            story_steps.append(
+                StoryStep(
+                    block_name=f"block_{level}_{block}",
+                    start_checkpoints=[Checkpoint(start)],
+                    end_checkpoints=[Checkpoint(end)] if end else [],
+                    events=events,
+                )
+            )
+
+    return StoryGraph(story_steps)
+
+
+def _average_generation_time(n: int) -> float:
+    story_graph = _story_graph()
+    total = 0
+
+    for _ in range(n):
+        generator = TrainingDataGenerator(
+            story_graph, DOMAIN, augmentation_factor=20, tracker_limit=None
+        )
+        start = time.perf_counter()
+        generator.generate()
+        total += time.perf_counter() - start
+
+    return total / n
+
+
+def _trackers(number_of_trackers: int, turns: int) -> List[TrackerWithCachedStates]:
+    trackers = []
+    for i in range(number_of_trackers):
+        tracker = TrackerWithCachedStates(
+            "", DOMAIN.slots, domain=DOMAIN, is_rule_tracker=False
+        )
+        tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+        for turn in range(turns):
+            # the turn which makes the tracker unique is at the start of the history
+            intent = DOMAIN.intents[(i if turn == 0 else turn) % len(DOMAIN.intents)]
+            tracker.update(UserUttered(intent, intent={"name": intent}))
+            tracker.update(ActionExecuted("utter_greet"))
+            tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+        trackers.append(tracker)
+
+    return trackers
+
+
+def _deduplication_time(trackers: List[TrackerWithCachedStates]) -> float:
+    generator = TrainingDataGenerator(StoryGraph([]), DOMAIN, tracker_limit=None)
+    total = 0
+
+    for _ in range(NUMBER_OF_MEASUREMENTS):
+        start = time.perf_counter()
+        generator._remove_duplicate_trackers(trackers)
+        generator.hashed_featurizations.clear()
+        generator._remove_duplicate_story_end_trackers(trackers)
+        generator.hashed_featurizations.clear()
+        total += time.perf_counter() - start
+
+    return total / NUMBER_OF_MEASUREMENTS
+
+
+def _deduplication_slowdown() -> float:
+    short_histories = _deduplication_time(_trackers(500, 2))
+    long_histories = _deduplication_time(_trackers(500, 200))
+
+    return long_histories / short_histories
+
+
+def test_story_generation_time():
+    generation_time = _average_generation_time(NUMBER_OF_MEASUREMENTS)
+    assert generation_time < MAX_GENERATION_TIME_S
+
+
+def test_deduplication_time_independent_of_history_length():
+    assert _deduplication_slowdown() < MAX_DEDUPLICATION_SLOWDOWN
+
+
+def _print_results(name: Text, value: float) -> None:
+    print(f"{name}: {value:.3f}")
+
+
+if __name__ == "__main__":
+    _print_results("generation time (s)", _average_generation_time(1))
+    _print_results("deduplication slowdown", _deduplication_slowdown())
@@ -11,6 +11,7 @@ from typing import List, Text, Type, Generator, NoReturn, Dict
 from contextlib import ExitStack
 
 from _pytest import pathlib
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 
 import pytest
@@ -29,6 +30,8 @@ from rasa.shared.core import events
 from rasa.core.agent import Agent
 from rasa.core.channels import CollectingOutputChannel, RestInput, SlackInput
 from rasa.core.channels.slack import SlackBot
+from rasa.core.tracker_store import InMemoryTrackerStore, WriteBehindTrackerStore
+from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import Event, UserUttered, SlotSet, BotUttered
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.model import unpack_model
@@ -1084,6 +1087,20 @@ def test_load_model(rasa_app: SanicTestClient, trained_core_model: Text):
     assert old_fingerprint != response.json["fingerprint"]
 
 
+def test_load_model_flushes_tracker_store(
+    rasa_app: SanicTestClient, trained_core_model: Text, monkeypatch: MonkeyPatch
+):
+    tracker_store = WriteBehindTrackerStore(InMemoryTrackerStore(Domain.empty()))
+    monkeypatch.setattr(rasa_app.app.agent, "tracker_store", tracker_store)
+    tracker_store.save(DialogueStateTracker("some-id", []))
+
+    _, response = rasa_app.put("/model", json={"model_file": trained_core_model})
+
+    assert response.status == 204
+    # the pending tracker of the replaced agent was saved
+    assert tracker_store._tracker_store.retrieve("some-id")
+
+
 def test_load_model_from_model_server(
     rasa_app: SanicTestClient, trained_core_model: Text
 ):
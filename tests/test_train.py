@@ -3,7 +3,7 @@ import sys
 import tempfile
 import os
 from pathlib import Path
-from typing import Text, Dict
+from typing import Dict, List, Optional, Text
 from unittest.mock import Mock
 
 import pytest
@@ -11,6 +11,7 @@ from _pytest.capture import CaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
 
 import rasa.model
+import rasa.shared.utils.io
 import rasa.core
 import rasa.importers.autoconfig as autoconfig
 from rasa.core.interpreter import RasaNLUInterpreter
@@ -327,3 +328,135 @@ def test_train_nlu_autoconfig(
     mocked_get_configuration.assert_called_once()
     _, args, _ = mocked_get_configuration.mock_calls[0]
     assert args[1] == autoconfig.TrainingType.NLU
+
+
+@pytest.mark.parametrize(
+    "policies, expected",
+    [
+        ([{"name": "MemoizationPolicy"}, {"name": "RulePolicy"}], False),
+        ([{"name": "MemoizationPolicy"}, {"name": "TEDPolicy"}], True),
+        # custom policies might use the interpreter in any way
+        ([{"name": "tests.core.conftest.ExamplePolicy", "example_arg": 1}], True),
+        (
+            [
+                {
+                    "name": "TEDPolicy",
+                    "featurizer": [
+                        {
+                            "name": "MaxHistoryTrackerFeaturizer",
+                            "state_featurizer": [
+                                {"name": "BinarySingleStateFeaturizer"}
+                            ],
+                        }
+                    ],
+                }
+            ],
+            False,
+        ),
+    ],
+)
+def test_core_depends_on_nlu(policies: List[Dict], expected: bool):
+    from rasa.train import _core_depends_on_nlu
+
+    assert _core_depends_on_nlu({"policies": policies}) == expected
+
+
+@pytest.mark.parametrize(
+    "policies, environment_value, expected_parallel",
+    [
+        ([{"name": "MemoizationPolicy"}], None, True),
+        ([{"name": "MemoizationPolicy"}], "false", False),
+        ([{"name": "TEDPolicy"}], None, False),
+    ],
+)
+def test_nlu_and_core_trained_in_parallel_if_independent(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    policies: List[Dict],
+    environment_value: Optional[Text],
+    expected_parallel: bool,
+):
+    from rasa.constants import ENV_PARALLEL_NLU_CORE_TRAINING
+
+    if environment_value is None:
+        monkeypatch.delenv(ENV_PARALLEL_NLU_CORE_TRAINING, raising=False)
+    else:
+        monkeypatch.setenv(ENV_PARALLEL_NLU_CORE_TRAINING, environment_value)
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+    config_path = tmp_path / "config.yml"
+    rasa.shared.utils.io.write_yaml(
+        {
+            "language": "en",
+            "pipeline": [{"name": "KeywordIntentClassifier"}],
+            "policies": policies,
+        },
+        config_path,
+    )
+
+    module = sys.modules["rasa.train"]
+    _train_in_parallel = Mock()
+    monkeypatch.setattr(
+        module,
+        "_train_nlu_and_core_in_parallel",
+        asyncio.coroutine(_train_in_parallel),
+    )
+    _train_nlu = Mock(return_value=str(tmp_path))
+    monkeypatch.setattr(
+        module, "_train_nlu_with_validated_data", asyncio.coroutine(_train_nlu)
+    )
+    _train_core = Mock()
+    monkeypatch.setattr(
+        module, "_train_core_with_validated_data", asyncio.coroutine(_train_core)
+    )
+    monkeypatch.setattr(module, "_load_interpreter", lambda _: None)
+    monkeypatch.setattr(module.model, "package_model", Mock())
+
+    train(
+        DEFAULT_DOMAIN_PATH_WITH_SLOTS,
+        str(config_path),
+        [DEFAULT_STORIES_FILE, DEFAULT_NLU_DATA],
+        str(tmp_path / "models"),
+    )
+
+    assert _train_in_parallel.called == expected_parallel
+    assert _train_nlu.called != expected_parallel
+    assert _train_core.called != expected_parallel
+
+
+def test_train_nlu_and_core_in_parallel_packages_both_models(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    from rasa.constants import ENV_PARALLEL_NLU_CORE_TRAINING
+
+    monkeypatch.delenv(ENV_PARALLEL_NLU_CORE_TRAINING, raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+    config_path = tmp_path / "config.yml"
+    rasa.shared.utils.io.write_yaml(
+        {
+            "language": "en",
+            "pipeline": [{"name": "KeywordIntentClassifier"}],
+            "policies": [{"name": "RulePolicy"}],
+        },
+        config_path,
+    )
+
+    module = sys.modules["rasa.train"]
+    _train_in_parallel = Mock(wraps=module._train_nlu_and_core_in_parallel)
+    monkeypatch.setattr(module, "_train_nlu_and_core_in_parallel", _train_in_parallel)
+
+    model_path = train(
+        "examples/moodbot/domain.yml",
+        str(config_path),
+        ["examples/moodbot/data"],
+        str(tmp_path / "models"),
+    )
+
+    # NLU was trained in a separate process
+    _train_in_parallel.assert_called_once()
+
+    unpacked = rasa.model.unpack_model(model_path)
+    core_path, nlu_path = rasa.model.get_model_subdirectories(unpacked)
+    assert core_path and os.path.exists(os.path.join(core_path, "metadata.json"))
+    assert nlu_path and os.path.exists(os.path.join(nlu_path, "metadata.json"))
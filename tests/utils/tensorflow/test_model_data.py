@@ -1,10 +1,15 @@
 import copy
+from typing import Text
 
 import pytest
 import scipy.sparse
 import numpy as np
 
-from rasa.utils.tensorflow.model_data import RasaModelData
+from rasa.utils.tensorflow.model_data import (
+    PackedDenseFeatures,
+    PackedSparseFeatures,
+    RasaModelData,
+)
 
 
 @pytest.fixture
@@ -213,3 +218,121 @@ def test_get_num_of_features(model_data: RasaModelData):
     num_features = model_data.feature_dimension("text_features", "sentence")
 
     assert num_features == 24
+
+
+def test_sequence_features_are_packed(model_data: RasaModelData):
+    dense, sparse = model_data.get("text_features", "sentence")
+
+    assert isinstance(dense, PackedDenseFeatures)
+    assert isinstance(sparse, PackedSparseFeatures)
+    assert np.all(dense.lengths == [5, 2, 3, 1, 3])
+    assert dense.values.shape == (14, 14)
+    assert sparse.values.shape == (14, 10)
+
+
+def test_packed_features_indexing(model_data: RasaModelData):
+    dense, sparse = model_data.get("text_features", "sentence")
+    ids = np.array([3, 0, 4])
+
+    selected_dense = dense[ids]
+    selected_sparse = sparse[ids]
+    sliced_dense = dense[1:4]
+
+    assert len(selected_dense) == len(selected_sparse) == 3
+    for i, example_id in enumerate(ids):
+        assert np.all(selected_dense[i] == dense[example_id])
+        assert (selected_sparse[i] != sparse[example_id]).nnz == 0
+    for i in range(3):
+        assert np.all(sliced_dense[i] == dense[i + 1])
+    mask = np.array([True, False, False, True, True])
+    assert np.all(dense[mask].lengths == [5, 1, 3])
+
+
+def test_prepare_batch_with_packed_features(model_data: RasaModelData):
+    dense, sparse = model_data.get("text_features", "sentence")
+
+    batch = model_data.prepare_batch(start=1, end=4)
+    dense_batch = batch[0]
+    indices, values, shape = batch[1:4]
+
+    expected_dense = np.zeros((3, 3, 14))
+    expected_sparse = np.zeros((3, 3, 10))
+    for i in range(3):
+        length = dense[i + 1].shape[0]
+        expected_dense[i, :length] = dense[i + 1]
+        expected_sparse[i, :length] = sparse[i + 1].toarray()
+
+    sparse_batch = np.zeros(shape)
+    sparse_batch[tuple(indices.T)] = values
+
+    assert dense_batch.dtype == np.float32
+    assert np.allclose(dense_batch, expected_dense)
+    assert np.allclose(sparse_batch, expected_sparse)
+
+
+@pytest.mark.parametrize("batch_strategy", ["sequence", "balanced"])
+def test_gen_batch_with_workers(model_data: RasaModelData, batch_strategy: Text):
+    np.random.seed(42)
+    sequential = list(model_data._gen_batch(2, batch_strategy, shuffle=True))
+    np.random.seed(42)
+    parallel = list(
+        model_data._gen_batch(2, batch_strategy, shuffle=True, num_workers=3)
+    )
+
+    assert len(parallel) == len(sequential)
+    for parallel_batch, sequential_batch in zip(parallel, sequential):
+        assert len(parallel_batch) == len(sequential_batch)
+        for parallel_values, sequential_values in zip(parallel_batch, sequential_batch):
+            assert np.all(parallel_values == sequential_values)
+
+
+def test_batch_ids_cover_all_examples(model_data: RasaModelData):
+    batch_ids = model_data._batch_ids(2, "sequence", shuffle=True)
+
+    assert [len(ids) for ids in batch_ids] == [2, 2, 1]
+    assert sorted(np.concatenate(batch_ids)) == [0, 1, 2, 3, 4]
+
+
+def test_balanced_ids_contain_every_example():
+    label_ids = np.array([0] * 20 + [1] * 3 + [2])
+    model_data = RasaModelData(
+        label_key="label", label_sub_key="ids", data={"label": {"ids": [label_ids]}}
+    )
+
+    balanced_ids = model_data._balanced_ids(label_ids, 4, shuffle=False)
+
+    assert set(balanced_ids) == set(range(len(label_ids)))
+    # the rarest label is repeated while the other labels are passed once
+    assert list(np.bincount(balanced_ids)) == [1] * 23 + [2]
+    # after a label was passed once, it only contributes to every other round
+    assert list(label_ids[balanced_ids]) == (
+        [0, 0, 0, 0, 1, 2] + [0, 0, 0, 0, 1] + [0, 0, 0, 0, 1, 2] + [0] * 8
+    )
+
+
+def test_bucketed_batches_reduce_padding(model_data: RasaModelData):
+    np.random.seed(42)
+    sequence_batches = model_data._batch_ids(2, "sequence", shuffle=True)
+    np.random.seed(42)
+    bucketed_batches = model_data._batch_ids(2, "bucketed", shuffle=True)
+
+    # example lengths: 5, 2, 3, 1, 3 -> batches (1, 2), (3, 3), (5)
+    assert sorted(sorted(batch) for batch in bucketed_batches) == [[0], [1, 3], [2, 4]]
+    assert model_data._padding_ratio(bucketed_batches) < model_data._padding_ratio(
+        sequence_batches
+    )
+
+
+def test_bucketed_batches_are_balanced(model_data: RasaModelData):
+    balanced = np.concatenate(model_data._batch_ids(2, "balanced", shuffle=False))
+    bucketed = np.concatenate(model_data._batch_ids(2, "bucketed", shuffle=False))
+
+    assert sorted(bucketed) == sorted(balanced)
+
+
+def test_padding_ratio(model_data: RasaModelData):
+    # three sequence features have the lengths 5, 2, 3, 1, 3 and the entity tags
+    # have the lengths 5, 2, 3, 2, 3
+    padding_ratio = model_data._padding_ratio([np.array([0, 1]), np.array([2, 3])])
+
+    assert padding_ratio == pytest.approx((3 * 5 + 4) / (4 * 16))
@@ -1,6 +1,14 @@
+import os
+
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from typing import Text, Dict
-from rasa.utils.tensorflow.environment import _parse_gpu_config
+
+from rasa.constants import ENV_BATCH_WORKERS
+from rasa.utils.tensorflow.environment import (
+    _parse_gpu_config,
+    number_of_batch_workers,
+)
 
 
 @pytest.mark.parametrize(
@@ -9,3 +17,17 @@ from rasa.utils.tensorflow.environment import _parse_gpu_config
 )
 def test_gpu_config_parser(gpu_config_string: Text, parsed_gpu_config: Dict[int, int]):
     assert _parse_gpu_config(gpu_config_string) == parsed_gpu_config
+
+
+@pytest.mark.parametrize("value, expected", [("3", 3), ("invalid", 2)])
+def test_number_of_batch_workers(value: Text, expected: int, monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_BATCH_WORKERS, value)
+
+    assert number_of_batch_workers() == expected
+
+
+def test_number_of_batch_workers_uses_all_cpus(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_BATCH_WORKERS, "0")
+    monkeypatch.setattr(os, "cpu_count", lambda: 7)
+
+    assert number_of_batch_workers() == 7